@@ -3,9 +3,19 @@ adapters/gcp_auth.py
 ──────────────────────────────────────────────────────────────────────────────
 GCP authentication manager.
 
-Wraps the `gcloud auth print-access-token` subprocess call, caches the token
-in memory, and refreshes automatically when it is within TOKEN_REFRESH_MARGIN
-seconds of expiry.
+Mints access tokens in-process via google-auth Application Default
+Credentials, caches the token in memory, and refreshes automatically when it
+is within TOKEN_REFRESH_MARGIN seconds of expiry.
+
+Token sources (automatic selection):
+  1. google-auth (preferred) — google.auth.default() + credentials.refresh()
+     over a pooled HTTPS session.  Tens of milliseconds, and the credential's
+     own expiry is used instead of assuming TOKEN_TTL_SECONDS.
+  2. gcloud subprocess (fallback) — `gcloud auth print-access-token`.  Used
+     when google-auth is not installed, no ADC is configured, a google-auth
+     refresh fails (e.g. oauth2.googleapis.com blocked by the corporate
+     proxy), or GCP_AUTH_USE_GCLOUD=true.  Once google-auth fails the
+     manager stays on gcloud for the lifetime of the process.
 
 Design notes:
   - All adapters that need GCP auth receive a GCPAuthManager instance via DI.
@@ -13,14 +23,28 @@ Design notes:
     across VertexEmbeddingAdapter and GeminiLLMAdapter → one token, one call.
   - Thread-safe: uses a threading.Lock for token refresh in multi-threaded
     contexts (Streamlit, FastAPI worker threads).
+  - Double-checked locking: a fresh cached token is returned without touching
+    the lock.  _TokenState is replaced as a whole (never mutated in place) so
+    a lock-free reader always sees a consistent (value, fresh_until) pair.
+  - Staleness is tracked on time.monotonic(), which never jumps on NTP
+    steps, and the refresh margin is folded into fresh_until at refresh time
+    so the fast path is one clock read and one compare.
+  - Proactive refresh: after every refresh a daemon threading.Timer is armed
+    to re-mint the token shortly before the refresh margin is reached, so
+    user-facing calls never pay the refresh latency at the expiry boundary.
+    Call close() on shutdown to cancel the timer.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import subprocess
 import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from datetime import timezone
+from functools import cache
+from typing import Any
 
 from prod.config.settings import Settings
 from prod.domain.exceptions import AuthenticationError
@@ -33,13 +57,21 @@ TOKEN_REFRESH_MARGIN: int = 120  # 2 minutes
 # GCP access tokens expire after 3600 seconds; we assume this conservatively.
 TOKEN_TTL_SECONDS: int = 3600
 
+# Extra slack (seconds) so the background refresh fires before any request
+# thread would see the token as stale.
+BACKGROUND_REFRESH_LEAD: int = 30
+
+_CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+
 
-@dataclass
+@dataclass(frozen=True)
 class _TokenState:
-    """Internal mutable token state (not frozen so we can refresh in place)."""
+    """Immutable token snapshot — swapped atomically on refresh/invalidate."""
 
     value: str = ""
-    expires_at: float = 0.0  # Unix timestamp
+    # time.monotonic() deadline after which the token needs refreshing
+    # (expiry minus TOKEN_REFRESH_MARGIN).
+    fresh_until: float = 0.0
 
 
 class GCPAuthManager:
@@ -54,7 +86,18 @@ class GCPAuthManager:
         self._gcloud_path = settings.gcloud_path
         self._state = _TokenState()
         self._lock = threading.Lock()
-        logger.debug("GCPAuthManager initialised | gcloud=%s", self._gcloud_path)
+        self._refresh_timer: threading.Timer | None = None
+        self._creds: Any = None
+        self._auth_request: Any = None
+        if not settings.gcp_auth_use_gcloud:
+            self._creds = _load_google_credentials()
+            if self._creds is not None:
+                self._auth_request = _google_auth_request(settings.https_proxy)
+        logger.debug(
+            "GCPAuthManager initialised | source=%s gcloud=%s",
+            "google-auth" if self._creds is not None else "gcloud",
+            self._gcloud_path,
+        )
 
     # ── Public API ─────────────────────────────────────────────────────────
 
@@ -67,25 +110,82 @@ class GCPAuthManager:
         Raises:
             AuthenticationError: If gcloud fails.
         """
+        # Fast path: one attribute load + one float compare, no lock.
+        state = self._state
+        if state.value and state.fresh_until > time.monotonic():
+            return state.value
+
         with self._lock:
+            # Re-check: another thread may have refreshed while we waited.
             if self._needs_refresh():
                 self._refresh()
             return self._state.value
 
+    async def aget_token(self) -> str:
+        """Awaitable get_token() for the Async* adapters.
+
+        A fresh cached token is returned inline; only an actual refresh is
+        pushed to a worker thread so the event loop never blocks on it.
+        """
+        state = self._state
+        if state.value and state.fresh_until > time.monotonic():
+            return state.value
+        return await asyncio.to_thread(self.get_token)
+
     def invalidate(self) -> None:
         """Force the next call to get_token() to fetch a fresh token."""
         with self._lock:
-            self._state.expires_at = 0.0
+            self._state = _TokenState(value=self._state.value, fresh_until=0.0)
             logger.debug("GCPAuthManager: token invalidated")
 
+    def close(self) -> None:
+        """Cancel the background refresh timer (process shutdown / tests)."""
+        with self._lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+
     # ── Private helpers ────────────────────────────────────────────────────
 
     def _needs_refresh(self) -> bool:
-        margin_time = time.time() + TOKEN_REFRESH_MARGIN
-        return self._state.value == "" or self._state.expires_at <= margin_time
+        state = self._state
+        return state.value == "" or state.fresh_until <= time.monotonic()
 
     def _refresh(self) -> None:
         logger.info("GCPAuthManager: refreshing access token …")
+        if self._creds is not None:
+            try:
+                token, ttl = self._refresh_via_google_auth()
+            except Exception as exc:
+                logger.warning(
+                    "GCPAuthManager: google-auth refresh failed — switching to "
+                    "gcloud for this process. Reason: %s", exc,
+                )
+                self._creds = None
+                token, ttl = self._refresh_via_gcloud()
+        else:
+            token, ttl = self._refresh_via_gcloud()
+
+        fresh_until = time.monotonic() + ttl - TOKEN_REFRESH_MARGIN
+        self._state = _TokenState(value=token, fresh_until=fresh_until)
+        logger.info("GCPAuthManager: token refreshed (expires in %ds)", ttl)
+        self._schedule_refresh(ttl)
+
+    def _refresh_via_google_auth(self) -> tuple[str, float]:
+        """Refresh ADC in-process; returns (token, seconds until expiry)."""
+        self._creds.refresh(self._auth_request)
+        token = self._creds.token
+        if not token:
+            raise AuthenticationError("google-auth returned an empty access token")
+        expiry = self._creds.expiry
+        if expiry is None:
+            return token, TOKEN_TTL_SECONDS
+        # google-auth reports expiry as a naive UTC (wall-clock) datetime;
+        # convert once to a relative TTL for the monotonic deadline.
+        return token, expiry.replace(tzinfo=timezone.utc).timestamp() - time.time()
+
+    def _refresh_via_gcloud(self) -> tuple[str, float]:
+        """Shell out to gcloud; returns (token, assumed seconds until expiry)."""
         try:
             result = subprocess.run(
                 [self._gcloud_path, "auth", "print-access-token"],
@@ -110,7 +210,52 @@ class GCPAuthManager:
         token = result.stdout.strip()
         if not token:
             raise AuthenticationError("gcloud returned an empty access token")
+        return token, TOKEN_TTL_SECONDS
+
+    def _schedule_refresh(self, ttl: float) -> None:
+        """Arm a daemon timer to refresh ahead of expiry.  Caller holds the lock."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        delay = max(ttl - TOKEN_REFRESH_MARGIN - BACKGROUND_REFRESH_LEAD, 1.0)
+        timer = threading.Timer(delay, self._background_refresh)
+        timer.daemon = True
+        timer.start()
+        self._refresh_timer = timer
+
+    def _background_refresh(self) -> None:
+        """Timer callback — failures are logged; the next get_token() retries."""
+        with self._lock:
+            try:
+                self._refresh()
+            except AuthenticationError as exc:
+                logger.warning("GCPAuthManager: background refresh failed: %s", exc)
+
+
+# ── google-auth helpers ────────────────────────────────────────────────────
+
+def _load_google_credentials() -> Any:
+    """Resolve Application Default Credentials, or None if unavailable."""
+    try:
+        import google.auth
+        from google.auth.exceptions import DefaultCredentialsError
+    except ImportError:
+        logger.info("google-auth not installed — using gcloud for access tokens")
+        return None
+    try:
+        creds, _ = google.auth.default(scopes=[_CLOUD_PLATFORM_SCOPE])
+    except DefaultCredentialsError as exc:
+        logger.info("No Application Default Credentials (%s) — using gcloud", exc)
+        return None
+    return creds
+
+
+@cache
+def _google_auth_request(https_proxy: str) -> Any:
+    """Return a shared google-auth transport Request backed by a pooled Session."""
+    import requests
+    from google.auth.transport.requests import Request
 
-        self._state.value = token
-        self._state.expires_at = time.time() + TOKEN_TTL_SECONDS
-        logger.info("GCPAuthManager: token refreshed (expires in %ds)", TOKEN_TTL_SECONDS)
+    session = requests.Session()
+    if https_proxy:
+        session.proxies = {"https": f"http://{https_proxy}"}
+    return Request(session=session)
@@ -21,6 +21,7 @@ import logging
 import os
 import time
 
+from prod.adapters import llm_batch
 from prod.adapters.gcp_auth import GCPAuthManager
 from prod.config.settings import Settings
 from prod.domain.exceptions import LLMError
@@ -191,6 +192,20 @@ class GeminiLangChainLLMAdapter:
         )
         return result
 
+    def generate_json_batch(
+        self,
+        system_prompt: str,
+        user_messages: list[str],
+    ) -> list[str | None]:
+        """generate_json() per message, packed LLM_BATCH_SIZE messages per
+        call (see adapters/llm_batch.py)."""
+        return llm_batch.generate_json_batch(
+            self.generate_json,
+            system_prompt,
+            user_messages,
+            self._settings.llm_batch_size,
+        )
+
     # ── Private helpers ────────────────────────────────────────────────────
 
     def _build_messages(self, system_prompt: str, user_message: str) -> list:
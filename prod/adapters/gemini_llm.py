@@ -7,36 +7,100 @@ Key behaviour:
   - Sends systemInstruction + contents in the Vertex AI REST format
   - Requests JSON output via responseMimeType: application/json
   - Token 401 → triggers GCPAuthManager.invalidate() then retries once
-  - Retries on 429/503 with exponential back-off
+  - Retries on 429/503 with exponential back-off (or the server's Retry-After)
+  - Shares the process-wide Session for the regional aiplatform host
   - Returns raw JSON string (caller parses)
 
+AsyncGeminiLLMAdapter is an asyncio sibling (httpx.AsyncClient, awaitable
+back-off, GCPAuthManager.aget_token) for orchestrators that gather many LLM
+calls on one event loop.
+
 To swap to OpenAI-compatible endpoints:
   1. Write OpenAILLMAdapter implementing LLMPort
   2. Change ONE import in services/container.py
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING
 
-import requests
+import orjson
 
+from prod.adapters import llm_batch
 from prod.adapters.gcp_auth import GCPAuthManager
+from prod.adapters.http_session import (
+    acquire_session,
+    aiplatform_base_url,
+    body_snippet,
+    build_async_client,
+    jittered,
+    proxies_for,
+    release_session,
+    retry_after,
+)
 from prod.config.settings import Settings
 from prod.domain.exceptions import AuthenticationError, LLMError
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
+# Identical on every request — shared by reference, never mutated.
+_GENERATION_CONFIG = {
+    "temperature": 0.1,
+    "responseMimeType": "application/json",
+}
+
 
-def _build_gemini_url(settings: Settings) -> str:
+@lru_cache(maxsize=4)
+def _build_gemini_url(location: str, project: str, model: str) -> str:
+    """generateContent endpoint — memoised per (location, project, model)."""
     return (
-        f"https://{settings.gcp_location_id}-aiplatform.googleapis.com"
-        f"/v1/projects/{settings.gcp_project_id}"
-        f"/locations/{settings.gcp_location_id}"
-        f"/publishers/google/models/{settings.gcp_gemini_model}:generateContent"
+        f"{aiplatform_base_url(location)}"
+        f"/v1/projects/{project}"
+        f"/locations/{location}"
+        f"/publishers/google/models/{model}:generateContent"
     )
 
 
+def _build_payload(system_prompt: str, user_message: str) -> dict:
+    """Build the Gemini generateContent request body."""
+    return {
+        "systemInstruction": {
+            "parts": [{"text": system_prompt}],
+        },
+        "contents": [
+            {
+                "role": "user",
+                "parts": [{"text": user_message}],
+            }
+        ],
+        "generationConfig": _GENERATION_CONFIG,
+    }
+
+
+def _extract_text(response_json: dict) -> str | None:
+    """Pull the text content out of the Gemini generateContent response."""
+    try:
+        candidates = response_json.get("candidates", [])
+        if not candidates:
+            logger.warning("Gemini response contained no candidates")
+            return None
+        parts = candidates[0].get("content", {}).get("parts", [])
+        if not parts:
+            logger.warning("Gemini candidate contained no parts")
+            return None
+        text = parts[0].get("text", "").strip()
+        return text if text else None
+    except (KeyError, IndexError, TypeError) as exc:
+        logger.error("Failed to parse Gemini response structure: %s", exc)
+        return None
+
+
 class GeminiLLMAdapter:
     """Vertex AI Gemini adapter.
 
@@ -46,12 +110,11 @@ class GeminiLLMAdapter:
     def __init__(self, auth: GCPAuthManager, settings: Settings) -> None:
         self._auth = auth
         self._settings = settings
-        self._url = _build_gemini_url(settings)
-        self._proxies = (
-            {"https": f"http://{settings.https_proxy}"}
-            if settings.https_proxy
-            else {}
+        self._base_url = aiplatform_base_url(settings.gcp_location_id)
+        self._url = _build_gemini_url(
+            settings.gcp_location_id, settings.gcp_project_id, settings.gcp_gemini_model
         )
+        self._proxies = proxies_for(settings.https_proxy)
         logger.debug("GeminiLLMAdapter ready | model=%s", settings.gcp_gemini_model)
 
     # ── LLMPort implementation ─────────────────────────────────────────────
@@ -72,12 +135,16 @@ class GeminiLLMAdapter:
             user_message:  User-turn message content.
 
         Returns:
-            Raw JSON string from the model, or None on recoverable failure.
+            Raw JSON string from the model, or None on recoverable failure
+            or a blank *user_message*.
 
         Raises:
             LLMError: On unrecoverable API failure.
         """
-        payload = self._build_payload(system_prompt, user_message)
+        if not user_message or not user_message.strip():
+            logger.warning("Blank user message — skipping Gemini call")
+            return None
+        payload = _build_payload(system_prompt, user_message)
         _t_total = time.perf_counter()
         result = self._post_with_retry(payload)
         logger.info(
@@ -86,24 +153,36 @@ class GeminiLLMAdapter:
         )
         return result
 
+    def generate_json_batch(
+        self,
+        system_prompt: str,
+        user_messages: list[str],
+    ) -> list[str | None]:
+        """generate_json() per message, packed LLM_BATCH_SIZE messages per
+        call (see adapters/llm_batch.py)."""
+        return llm_batch.generate_json_batch(
+            self.generate_json,
+            system_prompt,
+            user_messages,
+            self._settings.llm_batch_size,
+        )
+
+    def close(self) -> None:
+        """Release this adapter's reference to the shared regional session."""
+        if self.__dict__.pop("_session", None) is not None:
+            release_session(self._base_url)
+
     # ── Private helpers ────────────────────────────────────────────────────
 
-    def _build_payload(self, system_prompt: str, user_message: str) -> dict:
-        return {
-            "systemInstruction": {
-                "parts": [{"text": system_prompt}],
-            },
-            "contents": [
-                {
-                    "role": "user",
-                    "parts": [{"text": user_message}],
-                }
-            ],
-            "generationConfig": {
-                "temperature": 0.1,
-                "responseMimeType": "application/json",
-            },
-        }
+    @cached_property
+    def _session(self) -> requests.Session:
+        """Process-wide session for the regional aiplatform host, acquired on
+        first use so ``import requests`` is deferred until a request is made.
+
+        The session is shared with other Vertex adapters and the bearer token
+        rotates, so all headers are passed per request.
+        """
+        return acquire_session(self._base_url)
 
     def _post_with_retry(
         self,
@@ -111,24 +190,28 @@ class GeminiLLMAdapter:
         retries: int = 3,
     ) -> str | None:
         """POST to Gemini with token refresh on 401 and back-off on 429/503."""
+        import requests
+
         delay = 2.0
         last_exc: Exception | None = None
 
+        # Encode once (orjson → bytes); reused on every attempt.
+        body = orjson.dumps(payload)
+
         # ── Log prompt sizes once (same payload on every attempt) ─────────
-        import json as _json
-        _payload_bytes = len(_json.dumps(payload).encode())
-        _sys_chars = len(payload.get("systemInstruction", {})
-                         .get("parts", [{}])[0].get("text", ""))
-        _usr_chars = len((payload.get("contents", [{}])[0]
-                         .get("parts", [{}])[0].get("text", "")))
-        logger.info(
-            "⏱ [GeminiLLM] prompt_size system_chars=%d user_chars=%d "
-            "total_payload_kb=%.1f est_tokens≈%d",
-            _sys_chars,
-            _usr_chars,
-            _payload_bytes / 1024,
-            (_sys_chars + _usr_chars) // 4,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            _sys_chars = len(payload.get("systemInstruction", {})
+                             .get("parts", [{}])[0].get("text", ""))
+            _usr_chars = len((payload.get("contents", [{}])[0]
+                             .get("parts", [{}])[0].get("text", "")))
+            logger.info(
+                "⏱ [GeminiLLM] prompt_size system_chars=%d user_chars=%d "
+                "total_payload_kb=%.1f est_tokens≈%d",
+                _sys_chars,
+                _usr_chars,
+                len(body) / 1024,
+                (_sys_chars + _usr_chars) // 4,
+            )
 
         for attempt in range(1, retries + 1):
             token = self._auth.get_token()
@@ -138,10 +221,10 @@ class GeminiLLMAdapter:
             }
             try:
                 _t0 = time.perf_counter()
-                resp = requests.post(
+                resp = self._session.post(
                     self._url,
                     headers=headers,
-                    json=payload,
+                    data=body,
                     proxies=self._proxies,
                     timeout=self._settings.llm_timeout,
                 )
@@ -154,7 +237,7 @@ class GeminiLLMAdapter:
             except requests.RequestException as exc:
                 last_exc = exc
                 logger.warning("Gemini HTTP error (attempt %d/%d): %s", attempt, retries, exc)
-                time.sleep(delay)
+                time.sleep(jittered(delay))
                 delay *= 2
                 continue
 
@@ -164,37 +247,122 @@ class GeminiLLMAdapter:
                 continue
 
             if resp.status_code in (429, 503):
+                wait = retry_after(resp.headers, jittered(delay))
                 logger.warning(
                     "Gemini %d (attempt %d/%d) — back-off %.1fs",
-                    resp.status_code, attempt, retries, delay,
+                    resp.status_code, attempt, retries, wait,
                 )
-                time.sleep(delay)
+                time.sleep(wait)
                 delay *= 2
                 continue
 
             if not resp.ok:
                 # Log but don't raise — caller can handle None gracefully
-                logger.error("Gemini HTTP %d: %s", resp.status_code, resp.text[:300])
+                logger.error("Gemini HTTP %d: %s", resp.status_code, body_snippet(resp))
                 return None
 
-            return self._extract_text(resp.json())
+            return _extract_text(orjson.loads(resp.content))
 
         logger.error("Gemini failed after %d attempts", retries)
         return None
 
-    def _extract_text(self, response_json: dict) -> str | None:
-        """Pull the text content out of the Gemini generateContent response."""
-        try:
-            candidates = response_json.get("candidates", [])
-            if not candidates:
-                logger.warning("Gemini response contained no candidates")
-                return None
-            parts = candidates[0].get("content", {}).get("parts", [])
-            if not parts:
-                logger.warning("Gemini candidate contained no parts")
-                return None
-            text = parts[0].get("text", "").strip()
-            return text if text else None
-        except (KeyError, IndexError, TypeError) as exc:
-            logger.error("Failed to parse Gemini response structure: %s", exc)
+
+class AsyncGeminiLLMAdapter:
+    """asyncio variant of GeminiLLMAdapter satisfying AsyncLLMPort.
+
+    Shares the GCPAuthManager with the sync adapters; token reads go through
+    ``aget_token()`` so a cached token never leaves the event loop.  Create
+    one adapter per event loop and ``await aclose()`` it on shutdown.
+    """
+
+    def __init__(self, auth: GCPAuthManager, settings: Settings) -> None:
+        self._auth = auth
+        self._settings = settings
+        self._url = _build_gemini_url(
+            settings.gcp_location_id, settings.gcp_project_id, settings.gcp_gemini_model
+        )
+        self._client = build_async_client(
+            headers={"Content-Type": "application/json"},
+            proxy=f"http://{settings.https_proxy}" if settings.https_proxy else None,
+            timeout=settings.llm_timeout,
+        )
+        logger.debug("AsyncGeminiLLMAdapter ready | model=%s", settings.gcp_gemini_model)
+
+    # ── AsyncLLMPort implementation ────────────────────────────────────────
+
+    @property
+    def model_name(self) -> str:
+        return self._settings.gcp_gemini_model
+
+    async def generate_json(
+        self,
+        system_prompt: str,
+        user_message: str,
+    ) -> str | None:
+        """Awaitable counterpart of GeminiLLMAdapter.generate_json()."""
+        if not user_message or not user_message.strip():
+            logger.warning("Blank user message — skipping Gemini call")
             return None
+        payload = _build_payload(system_prompt, user_message)
+        _t_total = time.perf_counter()
+        result = await self._post_with_retry(payload)
+        logger.info(
+            "⏱ [AsyncGeminiLLM] operation=generate_json_total elapsed=%.3fs",
+            time.perf_counter() - _t_total,
+        )
+        return result
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client."""
+        await self._client.aclose()
+
+    # ── Private helpers ────────────────────────────────────────────────────
+
+    async def _post_with_retry(
+        self,
+        payload: dict,
+        retries: int = 3,
+    ) -> str | None:
+        """POST to Gemini with token refresh on 401 and awaitable back-off."""
+        import httpx
+
+        delay = 2.0
+        body = orjson.dumps(payload)
+
+        for attempt in range(1, retries + 1):
+            token = await self._auth.aget_token()
+            try:
+                resp = await self._client.post(
+                    self._url,
+                    headers={"Authorization": f"Bearer {token}"},
+                    content=body,
+                )
+            except httpx.HTTPError as exc:
+                logger.warning("Gemini HTTP error (attempt %d/%d): %s", attempt, retries, exc)
+                await asyncio.sleep(jittered(delay))
+                delay *= 2
+                continue
+
+            if resp.status_code == 401:
+                logger.warning("Gemini 401 — invalidating token and retrying")
+                self._auth.invalidate()
+                continue
+
+            if resp.status_code in (429, 503):
+                wait = retry_after(resp.headers, jittered(delay))
+                logger.warning(
+                    "Gemini %d (attempt %d/%d) — back-off %.1fs",
+                    resp.status_code, attempt, retries, wait,
+                )
+                await asyncio.sleep(wait)
+                delay *= 2
+                continue
+
+            if not resp.is_success:
+                logger.error("Gemini HTTP %d: %s", resp.status_code, body_snippet(resp))
+                return None
+
+            return _extract_text(orjson.loads(resp.content))
+
+        logger.error("Gemini failed after %d attempts", retries)
+        return None
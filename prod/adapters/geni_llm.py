@@ -50,8 +50,11 @@ import subprocess
 import time
 from pathlib import Path
 
+import orjson
 import requests
 
+from prod.adapters import llm_batch
+from prod.adapters.http_session import body_snippet
 from prod.config.settings import Settings
 from prod.domain.exceptions import LLMError
 
@@ -214,6 +217,20 @@ class GeniLLMAdapter:
             logger.error("GeniLLMAdapter unexpected error: %s", exc)
             raise LLMError(f"GENI call failed: {exc}") from exc
 
+    def generate_json_batch(
+        self,
+        system_prompt: str,
+        user_messages: list[str],
+    ) -> list[str | None]:
+        """generate_json() per message, packed LLM_BATCH_SIZE messages per
+        call (see adapters/llm_batch.py)."""
+        return llm_batch.generate_json_batch(
+            self.generate_json,
+            system_prompt,
+            user_messages,
+            self._settings.llm_batch_size,
+        )
+
     # ── Auth ───────────────────────────────────────────────────────────────
 
     def _get_token(self) -> str:
@@ -309,7 +326,7 @@ class GeniLLMAdapter:
                 timeout=60,
             )
         _raise_for_status(resp, "upload file")
-        payload = resp.json()
+        payload = orjson.loads(resp.content)
         file_id: str = payload["file"]["id"]
         logger.info(
             "⏱ [GeniLLM] operation=upload_csv elapsed=%.3fs file_id=%s",
@@ -343,7 +360,7 @@ class GeniLLMAdapter:
             timeout=30,
         )
         _raise_for_status(resp, "create conversation")
-        conversation_id = resp.json()["conversation"]["id"]
+        conversation_id = orjson.loads(resp.content)["conversation"]["id"]
         logger.info(
             "⏱ [GeniLLM] operation=create_conversation elapsed=%.3fs conversation_id=%s",
             time.perf_counter() - _t0,
@@ -380,7 +397,7 @@ class GeniLLMAdapter:
             timeout=30,
         )
         _raise_for_status(resp, "post question")
-        question_id = resp.json()["question"]["id"]
+        question_id = orjson.loads(resp.content)["question"]["id"]
         logger.info(
             "⏱ [GeniLLM] operation=post_question elapsed=%.3fs question_id=%s",
             time.perf_counter() - _t0,
@@ -414,7 +431,7 @@ class GeniLLMAdapter:
             )
             _raise_for_status(status_resp, "poll status")
 
-            if status_resp.json().get("has_answer"):
+            if orjson.loads(status_resp.content).get("has_answer"):
                 _t_fetch = time.perf_counter()
                 answer_resp = requests.get(
                     f"{self._base_url}/api/crud/questions/{question_id}",
@@ -423,7 +440,7 @@ class GeniLLMAdapter:
                 )
                 _raise_for_status(answer_resp, "fetch answer")
 
-                answer_obj = answer_resp.json().get("answer", {})
+                answer_obj = orjson.loads(answer_resp.content).get("answer", {})
                 if answer_obj.get("error"):
                     raise LLMError(f"GENI returned error: {answer_obj['error']}")
 
@@ -457,5 +474,5 @@ def _raise_for_status(resp: requests.Response, context: str) -> None:
     if not resp.ok:
         raise LLMError(
             f"GENI API error during '{context}': "
-            f"HTTP {resp.status_code} — {resp.text[:200]}"
+            f"HTTP {resp.status_code} — {body_snippet(resp, 200)}"
         )
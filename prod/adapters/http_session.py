@@ -0,0 +1,336 @@
+"""
+adapters/http_session.py
+──────────────────────────────────────────────────────────────────────────────
+Pooled HTTP client factories shared by the HTTP-based adapters.
+
+  build_session()       → requests.Session      (sync adapters)
+  acquire_session()     → process-wide requests.Session per host (ref-counted)
+  release_session()     → drop one reference; the last one closes the Session
+  build_async_client()  → httpx.AsyncClient     (Async* adapters)
+  build_http2_client()  → httpx.Client          (HTTP/2 fan-out, e.g. OpenAI embeddings)
+  acquire_http2_client() / release_http2_client()
+                        → process-wide HTTP/2 httpx.Client per host (ref-counted)
+  aiplatform_base_url() → regional Vertex AI host (shared-Session key)
+  proxies_for()         → requests ``proxies`` mapping for HTTPS_PROXY
+  body_snippet()        → bounded error-body prefix for logs / exceptions
+  retry_after()         → back-off seconds for a throttled (429/503) reply
+  jittered()            → back-off delay with random jitter added
+
+Why a Session?
+  Module-level requests.post() builds a throw-away Session — and therefore a
+  fresh TCP + TLS connection — on every call.  A long-lived Session keeps the
+  connection alive, so only the first request to *.googleapis.com /
+  api.openai.com pays the TLS handshake.
+
+Retries are handled by each adapter's own _post_with_retry loop, so the
+urllib3 adapter is mounted with max_retries=0.  requests.Session is safe to
+share across threads for this usage (one pool, many concurrent POSTs).
+
+Why HTTP/2 for fan-out?
+  requests speaks HTTP/1.1 only, so N concurrent batches need N connections
+  (N TLS handshakes).  An HTTP/2 httpx.Client multiplexes them as streams
+  over one or two connections.  HTTP/2 needs the ``h2`` package (installed
+  via ``httpx[http2]``); without it the client quietly speaks HTTP/1.1.
+
+Why share Sessions across adapters?
+  OpenAI embeddings + OpenAI LLM both talk to api.openai.com; Vertex
+  embeddings + Gemini both talk to the regional aiplatform host.  One pool
+  per host means each host pays one TLS handshake per process, not one per
+  adapter.  Shared Sessions (and the shared HTTP/2 clients behind
+  acquire_http2_client()) carry no default headers — credentials differ
+  per adapter (and GCP tokens rotate), so adapters pass headers per request.
+  Anything still open at interpreter exit is closed by an atexit hook.
+
+requests and httpx are imported lazily (~70 ms and ~40 ms respectively), so
+importing this module — or an adapter module — costs neither until the first
+client is actually built.  An AsyncClient is bound to the event loop it is first used on — create
+one per loop.
+"""
+from __future__ import annotations
+
+import atexit
+import random
+import threading
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import requests
+
+# ── Connection pool settings ──────────────────────────────────────────────
+# pool_connections=4  — number of distinct hosts kept in the pool cache
+# pool_maxsize=32     — concurrent keep-alive connections per host
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 32
+
+# ── Async client limits ───────────────────────────────────────────────────
+# One event loop drives many in-flight requests, so the async pool is wider.
+_ASYNC_MAX_CONNECTIONS = 64
+_ASYNC_MAX_KEEPALIVE = 32
+
+# ── HTTP/2 client limits ──────────────────────────────────────────────────
+# Each HTTP/2 connection carries many concurrent streams, so a handful is
+# plenty for EMBED_PARALLELISM-wide fan-out.
+_HTTP2_MAX_CONNECTIONS = 16
+_HTTP2_MAX_KEEPALIVE = 4
+
+# ── Shared Session / client registries ────────────────────────────────────
+# base_url → [Session or httpx.Client, reference count]
+_SHARED: dict[str, list[Any]] = {}
+_SHARED_HTTP2: dict[str, list[Any]] = {}
+_SHARED_LOCK = threading.Lock()
+
+# ── Retry-After handling ──────────────────────────────────────────────────
+# Upper bound on a server-requested wait, so a bogus header cannot stall a
+# request for minutes.
+_RETRY_AFTER_CAP = 60.0
+# Each back-off sleep is stretched by a random 0–50 %, so clients throttled
+# together do not all retry on the same tick.
+_BACKOFF_JITTER = 0.5
+
+
+def build_session(headers: dict[str, str] | None = None) -> requests.Session:
+    """Create a keep-alive Session with a sized HTTPS connection pool.
+
+    Args:
+        headers: Default headers sent with every request (e.g. a static
+                 API key).  Per-request headers such as a rotating GCP
+                 bearer token should be passed on each call instead.
+
+    Returns:
+        A ready-to-use requests.Session.  Call ``close()`` on shutdown.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def acquire_session(base_url: str) -> requests.Session:
+    """Return the process-wide Session for *base_url*, creating it if needed.
+
+    Every call takes a reference; pair it with ``release_session(base_url)``
+    when the adapter is closed.  The Session has no default headers.
+
+    Args:
+        base_url: Scheme + host the Session talks to, e.g.
+                  ``https://api.openai.com``.
+
+    Returns:
+        The shared requests.Session for that host.
+    """
+    return _acquire(_SHARED, base_url, build_session)
+
+
+def release_session(base_url: str) -> None:
+    """Drop one reference to the shared Session; the last release closes it."""
+    _release(_SHARED, base_url)
+
+
+def acquire_http2_client(base_url: str) -> Any:
+    """Return the process-wide HTTP/2 httpx.Client for *base_url*.
+
+    The httpx counterpart of acquire_session(): every adapter instance that
+    fans out to the same host multiplexes over one client's connections.
+    No default headers and the default timeout — pass both per request.
+    Pair every call with ``release_http2_client(base_url)``.
+    """
+    return _acquire(_SHARED_HTTP2, base_url, build_http2_client)
+
+
+def release_http2_client(base_url: str) -> None:
+    """Drop one reference to the shared HTTP/2 client; the last release closes it."""
+    _release(_SHARED_HTTP2, base_url)
+
+
+@atexit.register
+def close_shared_sessions() -> None:
+    """Close every shared Session and HTTP/2 client, whatever their references."""
+    with _SHARED_LOCK:
+        clients = [
+            client for registry in (_SHARED, _SHARED_HTTP2) for client, _ in registry.values()
+        ]
+        _SHARED.clear()
+        _SHARED_HTTP2.clear()
+    for client in clients:
+        client.close()
+
+
+def build_async_client(
+    headers: dict[str, str] | None = None,
+    proxy: str | None = None,
+    timeout: float = 30.0,
+    http2: bool = False,
+) -> Any:
+    """Create a keep-alive httpx.AsyncClient for the Async* adapters.
+
+    Args:
+        headers: Default headers sent with every request.
+        proxy:   Optional proxy URL (e.g. ``http://host:8080``).
+        timeout: Default total timeout in seconds.
+        http2:   Multiplex requests over HTTP/2 (if ``h2`` is installed).
+
+    Returns:
+        An httpx.AsyncClient.  Call ``await client.aclose()`` on shutdown.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    try:
+        import httpx
+    except ImportError as exc:
+        raise ImportError(
+            'httpx is not installed. Run: pip install -e .'
+        ) from exc
+
+    return httpx.AsyncClient(
+        headers=headers,
+        proxy=proxy,
+        timeout=timeout,
+        http2=http2 and _h2_available(),
+        limits=httpx.Limits(
+            max_connections=_ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=_ASYNC_MAX_KEEPALIVE,
+        ),
+    )
+
+
+def build_http2_client(
+    headers: dict[str, str] | None = None,
+    timeout: float = 30.0,
+) -> Any:
+    """Create a keep-alive, HTTP/2-multiplexing httpx.Client.
+
+    Safe to share across threads.  Falls back to HTTP/1.1 if ``h2`` is not
+    installed.
+
+    Args:
+        headers: Default headers sent with every request.
+        timeout: Default total timeout in seconds.
+
+    Returns:
+        An httpx.Client.  Call ``close()`` on shutdown.
+    """
+    import httpx
+
+    return httpx.Client(
+        headers=headers,
+        timeout=timeout,
+        http2=_h2_available(),
+        limits=httpx.Limits(
+            max_connections=_HTTP2_MAX_CONNECTIONS,
+            max_keepalive_connections=_HTTP2_MAX_KEEPALIVE,
+        ),
+    )
+
+
+def aiplatform_base_url(location: str) -> str:
+    """Regional Vertex AI host — shared-Session key for every Vertex adapter."""
+    return f"https://{location}-aiplatform.googleapis.com"
+
+
+@lru_cache(maxsize=4)
+def proxies_for(https_proxy: str) -> dict[str, str]:
+    """Return the requests ``proxies`` mapping for *https_proxy*.
+
+    Memoised so every adapter shares one dict per proxy value — treat the
+    result as read-only.  An empty *https_proxy* yields ``{}`` (direct).
+    """
+    return {"https": f"http://{https_proxy}"} if https_proxy else {}
+
+
+def body_snippet(resp: Any, limit: int = 300) -> str:
+    """Return at most *limit* bytes of a response body as text.
+
+    Slices the raw bytes before decoding, so an error page of any size costs
+    O(limit) — unlike ``resp.text[:limit]``, which decodes (and for requests
+    may charset-sniff) the whole body first.  Works for requests and httpx.
+    """
+    return resp.content[:limit].decode("utf-8", "replace")
+
+
+def retry_after(headers: Mapping[str, str], delay: float) -> float:
+    """Seconds to wait before retrying a throttled response.
+
+    Honours a ``Retry-After`` header in either of its RFC 9110 forms
+    (delta-seconds or HTTP-date).  The server's value wins when it asks for
+    longer than the current exponential *delay*; otherwise *delay* is used.
+    The result is clamped to ``_RETRY_AFTER_CAP``.
+
+    Args:
+        headers: Response headers (requests or httpx — both are mappings).
+        delay:   The caller's current exponential back-off delay.
+
+    Returns:
+        Seconds to sleep before the next attempt.
+    """
+    raw = headers.get("Retry-After")
+    if not raw:
+        return delay
+    try:
+        wait = float(raw)
+    except (TypeError, ValueError):
+        try:
+            when = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            return delay
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        wait = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(wait, delay), _RETRY_AFTER_CAP)
+
+
+def jittered(delay: float) -> float:
+    """*delay* stretched by a random factor in [1, 1 + ``_BACKOFF_JITTER``).
+
+    Adapters pass their exponential back-off delay through this before
+    sleeping (or before ``retry_after()``), so concurrent callers spread
+    their retries out instead of hitting a throttled endpoint in lockstep.
+    """
+    return delay * (1.0 + random.random() * _BACKOFF_JITTER)
+
+
+# ── Private helpers ────────────────────────────────────────────────────────
+
+def _acquire(registry: dict[str, list[Any]], base_url: str, factory: Any) -> Any:
+    """Take a reference to *registry*'s client for *base_url*, building it once."""
+    with _SHARED_LOCK:
+        entry = registry.get(base_url)
+        if entry is None:
+            entry = registry[base_url] = [factory(), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release(registry: dict[str, list[Any]], base_url: str) -> None:
+    """Drop one reference; close the client once none remain."""
+    with _SHARED_LOCK:
+        entry = registry.get(base_url)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del registry[base_url]
+    entry[0].close()
+
+
+@lru_cache(maxsize=1)
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
@@ -0,0 +1,97 @@
+"""
+adapters/llm_batch.py
+──────────────────────────────────────────────────────────────────────────────
+Packs several LLMPort.generate_json() calls into one model turn; shared by
+the sync LLM adapters' generate_json_batch().
+
+  generate_json_batch() → list[str | None], one raw JSON answer per message
+
+Why pack?
+  A batch CLI run or Streamlit upload re-ranks hundreds of queries with the
+  same system prompt.  Sending up to LLM_BATCH_SIZE user messages per call
+  (each under a ``---QUERY i---`` delimiter, see config/prompts.py) pays the
+  system prompt tokens and the round trip once per chunk instead of once
+  per query.
+
+The model is asked for {"answers": [...]} with one element per request.
+Each element is re-serialised so the caller parses it exactly like a
+single-call response.  If a chunk's reply is missing, unparsable or has the
+wrong number of answers, that chunk falls back to one generate_json() call
+per message — batching never changes what the caller gets back.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+
+import orjson
+
+from prod.config.prompts import build_batch_user_message
+
+logger = logging.getLogger(__name__)
+
+
+def generate_json_batch(
+    generate_json: Callable[[str, str], str | None],
+    system_prompt: str,
+    user_messages: Sequence[str],
+    batch_size: int,
+) -> list[str | None]:
+    """Answer *user_messages* in chunks of *batch_size* per LLM call.
+
+    Args:
+        generate_json: The adapter's single-message generate_json().
+        system_prompt: System instruction shared by every message.
+        user_messages: Independent user messages.
+        batch_size:    Messages per call; ≤ 1 disables packing.
+
+    Returns:
+        Raw JSON string (or None) per message, in input order.
+    """
+    size = max(1, batch_size)
+    results: list[str | None] = []
+    for start in range(0, len(user_messages), size):
+        chunk = list(user_messages[start:start + size])
+        if len(chunk) == 1:
+            results.append(generate_json(system_prompt, chunk[0]))
+            continue
+
+        _t = time.perf_counter()
+        raw = generate_json(system_prompt, build_batch_user_message(chunk))
+        answers = _split_answers(raw, len(chunk))
+        logger.info(
+            "⏱ [LLMBatch] operation=generate_json_batch elapsed=%.3fs "
+            "messages=%d packed=%s",
+            time.perf_counter() - _t,
+            len(chunk),
+            answers is not None,
+        )
+        if answers is None:
+            logger.warning(
+                "Batched LLM reply unusable for %d messages — "
+                "falling back to one call per message", len(chunk)
+            )
+            answers = [generate_json(system_prompt, message) for message in chunk]
+        results.extend(answers)
+    return results
+
+
+# ── Private helpers ────────────────────────────────────────────────────────
+
+def _split_answers(raw: str | None, n: int) -> list[str | None] | None:
+    """Per-request JSON strings from a batched reply, or None if unusable."""
+    if not raw:
+        return None
+    try:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+    if isinstance(parsed, dict):
+        parsed = parsed.get("answers")
+    if not isinstance(parsed, list) or len(parsed) != n:
+        return None
+    return [
+        None if answer is None else orjson.dumps(answer).decode()
+        for answer in parsed
+    ]
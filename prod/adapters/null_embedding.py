@@ -20,13 +20,17 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
+
+from prod.ports.embedding_port import Vector
+
 logger = logging.getLogger(__name__)
 
 
 class NullEmbeddingAdapter:
     """EmbeddingPort implementation that disables vector search.
 
-    Returns an empty list from embed_query() — HybridRetriever treats
+    Returns an empty vector from embed_query() — HybridRetriever treats
     this as a signal to skip the vector search leg entirely.
 
     Injected via services/container.py when EMBED_PROVIDER=none.
@@ -43,18 +47,22 @@ class NullEmbeddingAdapter:
             "EMBED_PROVIDER=openai to re-enable hybrid search."
         )
 
-    def embed_query(self, text: str) -> list[float]:
-        """Return empty list — signals HybridRetriever to skip vector search."""
-        return []
+    def embed_query(self, text: str) -> Vector:
+        """Return an empty vector — signals HybridRetriever to skip vector search."""
+        return np.empty(0, dtype=np.float32)
+
+    def embed_queries_batch(self, texts: list[str]) -> list[Vector | None]:
+        """One empty vector per query, as embed_query()."""
+        return [np.empty(0, dtype=np.float32) for _ in texts]
 
-    def embed_document(self, text: str, title: str = "") -> list[float]:
-        """Not called in FTS-only mode; returns empty list defensively."""
-        return []
+    def embed_document(self, text: str, title: str = "") -> Vector:
+        """Not called in FTS-only mode; returns an empty vector defensively."""
+        return np.empty(0, dtype=np.float32)
 
     def embed_documents_batch(
         self,
         texts: list[str],
         titles: list[str] | None = None,
-    ) -> list[list[float] | None]:
+    ) -> list[Vector | None]:
         """Not called in FTS-only mode; returns list of None defensively."""
         return [None for _ in texts]
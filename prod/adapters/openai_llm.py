@@ -7,9 +7,13 @@ Key behaviour:
   - Uses /v1/chat/completions via raw requests (no openai SDK dependency)
   - Requests JSON output via response_format={"type": "json_object"}
   - system_prompt → system role message; user_message → user role message
-  - Retries on 429 / 500 with exponential back-off
+  - Retries on 429 / 500 with exponential back-off (or the server's Retry-After)
+  - Shares the process-wide api.openai.com Session (TLS handshake paid once)
   - Returns the raw JSON string (caller parses); None on recoverable failure
 
+AsyncOpenAILLMAdapter is an asyncio sibling (httpx.AsyncClient, awaitable
+back-off) for orchestrators that gather many LLM calls on one event loop.
+
 Required env vars:
   OPENAI_API_KEY     — your OpenAI secret key  (sk-...)
   OPENAI_LLM_MODEL   — default: gpt-4o
@@ -19,17 +23,67 @@ To enable:
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from functools import cached_property
+from typing import TYPE_CHECKING
 
-import requests
+import orjson
 
+from prod.adapters import llm_batch
+from prod.adapters.http_session import (
+    acquire_session,
+    body_snippet,
+    build_async_client,
+    jittered,
+    release_session,
+    retry_after,
+)
 from prod.config.settings import Settings
 from prod.domain.exceptions import AuthenticationError, LLMError
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
-_OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+_OPENAI_BASE_URL = "https://api.openai.com"
+_OPENAI_CHAT_URL = f"{_OPENAI_BASE_URL}/v1/chat/completions"
+
+
+def _payload_template(settings: Settings) -> dict:
+    """Request-body fields that are identical for every chat completion."""
+    return {
+        "model": settings.openai_llm_model,
+        "temperature": 0.1,
+        "response_format": {"type": "json_object"},
+    }
+
+
+def _build_payload(template: dict, system_prompt: str, user_message: str) -> dict:
+    """Build the OpenAI chat completions request body."""
+    return {
+        **template,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ],
+    }
+
+
+def _extract_text(response_json: dict) -> str | None:
+    """Pull the content string out of the chat completions response."""
+    try:
+        choices = response_json.get("choices", [])
+        if not choices:
+            logger.warning("OpenAI response contained no choices")
+            return None
+        content = choices[0].get("message", {}).get("content", "").strip()
+        return content if content else None
+    except (KeyError, IndexError, TypeError) as exc:
+        logger.error("Failed to parse OpenAI response structure: %s", exc)
+        return None
 
 
 class OpenAILLMAdapter:
@@ -60,6 +114,8 @@ class OpenAILLMAdapter:
             "Authorization": f"Bearer {settings.openai_api_key}",
             "Content-Type": "application/json",
         }
+        # Static part of every request body; only "messages" varies per call.
+        self._payload_template = _payload_template(settings)
         logger.debug("OpenAILLMAdapter ready | model=%s", settings.openai_llm_model)
 
     # ── LLMPort implementation ─────────────────────────────────────────────
@@ -85,27 +141,48 @@ class OpenAILLMAdapter:
             user_message:  User-turn message content.
 
         Returns:
-            Raw JSON string from the model, or ``None`` on recoverable failure.
+            Raw JSON string from the model, or ``None`` on recoverable failure
+            or a blank *user_message*.
 
         Raises:
             LLMError: On unrecoverable API failure (non-2xx after all retries).
         """
-        payload = self._build_payload(system_prompt, user_message)
+        if not user_message or not user_message.strip():
+            logger.warning("Blank user message — skipping OpenAI LLM call")
+            return None
+        payload = _build_payload(self._payload_template, system_prompt, user_message)
         return self._post_with_retry(payload)
 
+    def generate_json_batch(
+        self,
+        system_prompt: str,
+        user_messages: list[str],
+    ) -> list[str | None]:
+        """generate_json() per message, packed LLM_BATCH_SIZE messages per
+        call (see adapters/llm_batch.py)."""
+        return llm_batch.generate_json_batch(
+            self.generate_json,
+            system_prompt,
+            user_messages,
+            self._settings.llm_batch_size,
+        )
+
+    def close(self) -> None:
+        """Release this adapter's reference to the shared api.openai.com session."""
+        if self.__dict__.pop("_session", None) is not None:
+            release_session(_OPENAI_BASE_URL)
+
     # ── Private helpers ────────────────────────────────────────────────────
 
-    def _build_payload(self, system_prompt: str, user_message: str) -> dict:
-        """Build the OpenAI chat completions request body."""
-        return {
-            "model": self._settings.openai_llm_model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message},
-            ],
-            "temperature": 0.1,
-            "response_format": {"type": "json_object"},
-        }
+    @cached_property
+    def _session(self) -> requests.Session:
+        """Process-wide api.openai.com session, acquired on first use so
+        ``import requests`` is deferred until a request is actually made.
+
+        The session is shared with other adapters, so the API key travels
+        as a per-request header rather than a session default.
+        """
+        return acquire_session(_OPENAI_BASE_URL)
 
     def _post_with_retry(
         self,
@@ -113,15 +190,19 @@ class OpenAILLMAdapter:
         retries: int = 3,
     ) -> str | None:
         """POST to the OpenAI API with back-off on 429 / 500."""
+        import requests
+
         delay = 2.0
         last_exc: Exception | None = None
+        # Encode once (orjson → bytes); reused on every attempt.
+        body = orjson.dumps(payload)
 
         for attempt in range(1, retries + 1):
             try:
-                resp = requests.post(
+                resp = self._session.post(
                     _OPENAI_CHAT_URL,
                     headers=self._headers,
-                    json=payload,
+                    data=body,
                     timeout=self._settings.llm_timeout,
                 )
             except requests.RequestException as exc:
@@ -130,7 +211,7 @@ class OpenAILLMAdapter:
                     "OpenAI LLM request error (attempt %d/%d): %s",
                     attempt, retries, exc,
                 )
-                time.sleep(delay)
+                time.sleep(jittered(delay))
                 delay *= 2
                 continue
 
@@ -141,35 +222,126 @@ class OpenAILLMAdapter:
                 )
 
             if resp.status_code in (429, 500, 503):
+                wait = retry_after(resp.headers, jittered(delay))
                 logger.warning(
                     "OpenAI LLM %d (attempt %d/%d) — back-off %.1fs",
-                    resp.status_code, attempt, retries, delay,
+                    resp.status_code, attempt, retries, wait,
                 )
-                time.sleep(delay)
+                time.sleep(wait)
                 delay *= 2
                 continue
 
             if not resp.ok:
                 logger.error(
                     "OpenAI LLM HTTP %d: %s",
-                    resp.status_code, resp.text[:300],
+                    resp.status_code, body_snippet(resp),
                 )
                 return None
 
-            return self._extract_text(resp.json())
+            return _extract_text(orjson.loads(resp.content))
 
         logger.error("OpenAI LLM failed after %d attempts", retries)
         return None
 
-    def _extract_text(self, response_json: dict) -> str | None:
-        """Pull the content string out of the chat completions response."""
-        try:
-            choices = response_json.get("choices", [])
-            if not choices:
-                logger.warning("OpenAI response contained no choices")
-                return None
-            content = choices[0].get("message", {}).get("content", "").strip()
-            return content if content else None
-        except (KeyError, IndexError, TypeError) as exc:
-            logger.error("Failed to parse OpenAI response structure: %s", exc)
+
+class AsyncOpenAILLMAdapter:
+    """asyncio variant of OpenAILLMAdapter satisfying AsyncLLMPort.
+
+    One event loop can drive hundreds of in-flight chat completions through a
+    single pooled httpx.AsyncClient; back-off uses ``asyncio.sleep`` so no
+    thread is parked while waiting.  The client is bound to the loop it is
+    first used on — create one adapter per loop and ``await aclose()`` it.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        if not settings.openai_api_key:
+            raise AuthenticationError(
+                "OPENAI_API_KEY is not set. "
+                "Add it to your .env file or environment."
+            )
+        self._settings = settings
+        self._client = build_async_client(
+            headers={
+                "Authorization": f"Bearer {settings.openai_api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=settings.llm_timeout,
+        )
+        self._payload_template = _payload_template(settings)
+        logger.debug("AsyncOpenAILLMAdapter ready | model=%s", settings.openai_llm_model)
+
+    # ── AsyncLLMPort implementation ────────────────────────────────────────
+
+    @property
+    def model_name(self) -> str:
+        """Name of the underlying OpenAI chat model."""
+        return self._settings.openai_llm_model
+
+    async def generate_json(
+        self,
+        system_prompt: str,
+        user_message: str,
+    ) -> str | None:
+        """Awaitable counterpart of OpenAILLMAdapter.generate_json()."""
+        if not user_message or not user_message.strip():
+            logger.warning("Blank user message — skipping OpenAI LLM call")
             return None
+        payload = _build_payload(self._payload_template, system_prompt, user_message)
+        return await self._post_with_retry(payload)
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client."""
+        await self._client.aclose()
+
+    # ── Private helpers ────────────────────────────────────────────────────
+
+    async def _post_with_retry(
+        self,
+        payload: dict,
+        retries: int = 3,
+    ) -> str | None:
+        """POST to the OpenAI API with awaitable back-off on 429 / 500."""
+        import httpx
+
+        delay = 2.0
+        body = orjson.dumps(payload)
+
+        for attempt in range(1, retries + 1):
+            try:
+                resp = await self._client.post(_OPENAI_CHAT_URL, content=body)
+            except httpx.HTTPError as exc:
+                logger.warning(
+                    "OpenAI LLM request error (attempt %d/%d): %s",
+                    attempt, retries, exc,
+                )
+                await asyncio.sleep(jittered(delay))
+                delay *= 2
+                continue
+
+            if resp.status_code == 401:
+                raise AuthenticationError(
+                    "OpenAI returned 401 Unauthorised. "
+                    "Check that OPENAI_API_KEY is valid."
+                )
+
+            if resp.status_code in (429, 500, 503):
+                wait = retry_after(resp.headers, jittered(delay))
+                logger.warning(
+                    "OpenAI LLM %d (attempt %d/%d) — back-off %.1fs",
+                    resp.status_code, attempt, retries, wait,
+                )
+                await asyncio.sleep(wait)
+                delay *= 2
+                continue
+
+            if not resp.is_success:
+                logger.error(
+                    "OpenAI LLM HTTP %d: %s",
+                    resp.status_code, body_snippet(resp),
+                )
+                return None
+
+            return _extract_text(orjson.loads(resp.content))
+
+        logger.error("OpenAI LLM failed after %d attempts", retries)
+        return None
@@ -7,7 +7,8 @@ Database layout (from ingest.py):
   Table : anzsic_codes
   Cols  : anzsic_code (PK), anzsic_desc, class_code, class_desc,
           group_code, group_desc, subdivision_desc, division_desc,
-          class_exclusions, enriched_text, embedding vector(768), fts_vector
+          class_exclusions, enriched_text, embedding vector(768) | halfvec(768),
+          fts_vector
   Index : HNSW cosine (embedding), GIN (fts_vector)
 
 Three atomic methods match DatabasePort:
@@ -15,12 +16,61 @@ Three atomic methods match DatabasePort:
   fts_search     → FTS via tsquery
   fetch_by_codes → bulk SELECT by primary key list
 
+hybrid_search runs all three as one CTE statement (one network round trip
+instead of three) and is what HybridRetriever calls per query.  Given
+rrf_k, the statement also ranks the union by RRF score and joins / ships
+only the top `limit` records; HybridRetriever still computes the scores
+(compute_rrf), so SQL only decides which rows cross the wire.
+
+vector_search_batch / fts_search_batch answer many queries in one
+statement each (unnest … WITH ORDINALITY + LATERAL search), for
+HybridRetriever.retrieve_many.
+
+AsyncPostgresDatabaseAdapter is an asyncio sibling on an asyncpg pool
+(optional dependency: pip install -e ".[async]") used by
+AsyncClassifierPipeline, which awaits the vector and FTS legs concurrently.
+It runs the same statement bodies; asyncpg prepares each once per
+connection and reuses it from its statement cache.
+
+Prepared statements:
+  The hot-path SQL is PREPAREd once per pooled connection (anzsic_vec /
+  anzsic_fts / anzsic_fetch / anzsic_hybrid and the *_batch variants) and
+  executed by name.
+  The server parses and plans each once per connection, and the query vector
+  is serialised once per call instead of twice.
+
+halfvec storage (DB_VECTOR_TYPE=halfvec):
+  Storing the embedding as halfvec(768) halves the bytes each HNSW hop
+  streams (1,536 vs 3,072 per neighbour) for negligible recall loss.  Query
+  vectors stay float32 client-side; the prepared statements declare their
+  parameter as halfvec, so the server casts once per query.  Migration SQL
+  is in docs/decisions/002-pgvector-hybrid-search.md.
+
+Vector parameters:
+  psycopg2 only speaks the text protocol, so query vectors travel as
+  '[…]' literals.  pgvector's stock adapter prints each float32 through its
+  float64 repr ("0.10000000149011612"); _Float32VectorAdapter prints '%.9g'
+  instead — the shortest format that still round-trips float32 exactly —
+  which makes the literal ~35 % smaller and about twice as fast to build.
+  Query vectors are wrapped in it at the call site (it adapts itself via
+  __conform__), so the process-wide ndarray adapter is left to pgvector.
+
+Row cache:
+  anzsic_codes is read-only at serving time (~5k rows), so every record an
+  adapter fetches is kept in a per-adapter dict keyed by code.
+  fetch_by_codes only goes to the database for codes it has not seen, and
+  after warm-up it is a pure dict lookup.  Repeated hierarchy strings
+  (class / group / subdivision / division) are interned on the way in.
+  Restart the process after a re-ingest.
+
 Connection management:
-  - A single connection is opened lazily and reused.
-  - On OperationalError the connection is reset and one retry is attempted.
-  - For Streamlit (single-process, single-thread) this is sufficient.
-  - For FastAPI: replace with a psycopg2 connection pool (e.g. psycopg2.pool.
-    ThreadedConnectionPool) — change only this file.
+  - A ThreadedConnectionPool (DB_POOL_MIN..DB_POOL_MAX) is created lazily;
+    concurrent vector / FTS / fetch calls each borrow their own warm
+    connection, so FastAPI and Streamlit threads do not serialise on one.
+  - Every new connection is initialised once (pgvector, hnsw.ef_search =
+    HNSW_EF_SEARCH, prepared statements).
+  - On OperationalError the stale connection is discarded and the query is
+    retried once on a fresh one.
 
 To swap the database engine (e.g. to Weaviate or Pinecone):
   1. Write WeaviateDatabaseAdapter implementing DatabasePort
@@ -28,20 +78,31 @@ To swap the database engine (e.g. to Weaviate or Pinecone):
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import psycopg2
-import psycopg2.extras
+import psycopg2.errors
+import psycopg2.extensions
 import psycopg2.pool
 from pgvector.psycopg2 import register_vector
 
 from prod.config.settings import Settings
-from prod.domain.exceptions import DatabaseError
+from prod.domain.exceptions import ConfigurationError, DatabaseError
+from prod.ports.embedding_port import Vector
 
 logger = logging.getLogger(__name__)
 
-# Columns returned for every ANZSIC record (must match domain/models.py Candidate)
+# Columns returned for every ANZSIC record (must match domain/models.py Candidate).
+# Queries select them in this order; rows are mapped back positionally.
 _RECORD_COLS = (
     "anzsic_code",
     "anzsic_desc",
@@ -56,13 +117,176 @@ _RECORD_COLS = (
 )
 _SELECT_COLS = ", ".join(_RECORD_COLS)
 
+# Hierarchy columns shared by many codes: ~31k values over ~5k codes, only
+# ~1.5k of them distinct.
+_INTERNED_COLS = frozenset({
+    "class_code",
+    "class_desc",
+    "group_code",
+    "group_desc",
+    "subdivision_desc",
+    "division_desc",
+})
+
+# Default name PostgreSQL gives `CREATE INDEX ON anzsic_codes (embedding)`.
+_VECTOR_INDEX = "anzsic_codes_embedding_idx"
+
+# Column types the embedding may be stored as (DB_VECTOR_TYPE).
+_VECTOR_TYPES = ("vector", "halfvec")
+
+# ── Hot-path statements ────────────────────────────────────────────────────
+# name → (parameter types, body).  Bodies use $n placeholders, so the same
+# SQL is PREPAREd on every psycopg2 connection and run by the asyncpg
+# adapter.  {vector_type} is filled from DB_VECTOR_TYPE so the query
+# parameter matches the column type and the HNSW index is used.
+# The FTS legs score each match with ts_rank_cd once, in a LIMITed inner
+# query, and number only the surviving rows.
+_STATEMENTS: dict[str, tuple[str, str]] = {
+    "anzsic_vec": ("{vector_type}, int", """
+        SELECT anzsic_code,
+               ROW_NUMBER() OVER (ORDER BY embedding <=> $1) AS rank
+        FROM   anzsic_codes
+        WHERE  embedding IS NOT NULL
+        ORDER  BY embedding <=> $1
+        LIMIT  $2
+    """),
+    "anzsic_fts": ("text, int", """
+        SELECT anzsic_code,
+               ROW_NUMBER() OVER (ORDER BY score DESC) AS rank
+        FROM   (SELECT anzsic_code, ts_rank_cd(fts_vector, query) AS score
+                FROM   anzsic_codes,
+                       (SELECT to_tsquery(string_agg(lexeme, ' | '))
+                        FROM   unnest(to_tsvector('english', $1))
+                       ) AS t(query)
+                WHERE  query IS NOT NULL
+                  AND  fts_vector @@ query
+                ORDER  BY score DESC
+                LIMIT  $2
+               ) AS s
+        ORDER  BY score DESC
+    """),
+    # Batch legs: one row per (query ordinal, hit); $1 is an array of
+    # query vectors / texts, each searched exactly as by the single leg.
+    "anzsic_vec_batch": ("{vector_type}[], int", """
+        SELECT q.ord, h.anzsic_code, h.rank
+        FROM   unnest($1) WITH ORDINALITY AS q(emb, ord)
+        CROSS  JOIN LATERAL (
+                SELECT anzsic_code,
+                       ROW_NUMBER() OVER (ORDER BY embedding <=> q.emb) AS rank
+                FROM   anzsic_codes
+                WHERE  embedding IS NOT NULL
+                ORDER  BY embedding <=> q.emb
+                LIMIT  $2
+               ) AS h
+        ORDER  BY q.ord, h.rank
+    """),
+    "anzsic_fts_batch": ("text[], int", """
+        SELECT q.ord, h.anzsic_code, h.rank
+        FROM   unnest($1) WITH ORDINALITY AS q(txt, ord)
+        CROSS  JOIN LATERAL (
+                SELECT anzsic_code,
+                       ROW_NUMBER() OVER (ORDER BY score DESC) AS rank
+                FROM   (SELECT anzsic_code, ts_rank_cd(fts_vector, query) AS score
+                        FROM   anzsic_codes,
+                               (SELECT to_tsquery(string_agg(lexeme, ' | '))
+                                FROM   unnest(to_tsvector('english', q.txt))
+                               ) AS t(query)
+                        WHERE  query IS NOT NULL
+                          AND  fts_vector @@ query
+                        ORDER  BY score DESC
+                        LIMIT  $2
+                       ) AS s
+               ) AS h
+        ORDER  BY q.ord, h.rank
+    """),
+    "anzsic_fetch": ("text[]", f"""
+        SELECT {_SELECT_COLS}
+        FROM   anzsic_codes
+        WHERE  anzsic_code = ANY($1)
+    """),
+    "anzsic_hybrid": ("{vector_type}, text, int, int", f"""
+        WITH v AS (
+            SELECT anzsic_code,
+                   ROW_NUMBER() OVER (ORDER BY embedding <=> $1) AS vector_rank
+            FROM   anzsic_codes
+            WHERE  $1 IS NOT NULL
+              AND  embedding IS NOT NULL
+            ORDER  BY embedding <=> $1
+            LIMIT  $3
+        ),
+        f AS (
+            SELECT anzsic_code,
+                   ROW_NUMBER() OVER (ORDER BY score DESC) AS fts_rank
+            FROM   (SELECT anzsic_code, ts_rank_cd(fts_vector, query) AS score
+                    FROM   anzsic_codes,
+                           (SELECT to_tsquery(string_agg(lexeme, ' | '))
+                            FROM   unnest(to_tsvector('english', $2))
+                           ) AS t(query)
+                    WHERE  query IS NOT NULL
+                      AND  fts_vector @@ query
+                    ORDER  BY score DESC
+                    LIMIT  $3
+                   ) AS s
+        )
+        SELECT {_SELECT_COLS}, vector_rank, fts_rank
+        FROM   (SELECT anzsic_code, vector_rank, fts_rank
+                FROM   v FULL JOIN f USING (anzsic_code)
+                -- RRF pre-fusion: with $4 = k, keep only the top $3 codes
+                -- by fused score; with $4 NULL, keep every code.  Ties go
+                -- to the lower code, as in retriever.compute_rrf_topk().
+                ORDER  BY COALESCE(1.0 / ($4 + vector_rank), 0)
+                        + COALESCE(1.0 / ($4 + fts_rank), 0) DESC,
+                          anzsic_code
+                LIMIT  CASE WHEN $4 IS NULL THEN NULL ELSE $3 END
+               ) AS fused
+        JOIN   anzsic_codes USING (anzsic_code)
+    """),
+}
+
+
+@lru_cache(maxsize=2)
+def _prepare_statements(vector_type: str) -> tuple[str, ...]:
+    """PREPARE statements for an embedding column of *vector_type*."""
+    return tuple(
+        f"PREPARE {name} ({types.format(vector_type=vector_type)}) AS{body}"
+        for name, (types, body) in _STATEMENTS.items()
+    )
+
+
+class _Float32VectorAdapter:
+    """psycopg2 adapter: 1-D ndarray → compact pgvector text literal.
+
+    Wrap a query parameter in it explicitly; nothing is registered globally.
+    """
+
+    def __init__(self, value: np.ndarray) -> None:
+        self._value = value
+
+    def __conform__(self, proto: Any) -> _Float32VectorAdapter | None:
+        return self if proto is psycopg2.extensions.ISQLQuote else None
+
+    def getquoted(self) -> bytes:
+        return psycopg2.extensions.QuotedString(_vector_text(self._value)).getquoted()
+
 
-# ── Connection pool settings ──────────────────────────────────────────────
-# minconn=2   — keep 2 warm connections at all times (avoids cold-start latency)
-# maxconn=20  — cap at 20 to stay within PostgreSQL's max_connections limit
-#               (raise if you add more Uvicorn workers)
-_POOL_MINCONN = 2
-_POOL_MAXCONN = 20
+def _vector_text(value: np.ndarray) -> str:
+    """'[…]' pgvector literal, each float32 printed with '%.9g'."""
+    values = np.asarray(value, dtype=np.float32).tolist()
+    return "[" + ",".join(["%.9g"] * len(values)) % tuple(values) + "]"
+
+
+def _vector_array_text(vectors: list[Vector]) -> str:
+    """'{"[…]","[…]"}' literal; the server parses it straight into the
+    statement's vector[] / halfvec[] parameter."""
+    return "{" + ",".join(f'"{_vector_text(v)}"' for v in vectors) + "}"
+
+
+def _group_hits(rows: list[tuple], n_queries: int) -> list[list[tuple[str, int]]]:
+    """(ordinal, code, rank) rows → one hit list per query (ordinal is 1-based)."""
+    grouped: list[list[tuple[str, int]]] = [[] for _ in range(n_queries)]
+    for ordinal, code, rank in rows:
+        grouped[ordinal - 1].append((code, rank))
+    return grouped
 
 
 class PostgresDatabaseAdapter:
@@ -77,33 +301,40 @@ class PostgresDatabaseAdapter:
 
     def __init__(self, settings: Settings) -> None:
         self._dsn = settings.db_dsn
+        self._pool_min = settings.db_pool_min
+        self._pool_max = settings.db_pool_max
+        self._ef_search = settings.hnsw_ef_search
+        if settings.db_vector_type not in _VECTOR_TYPES:
+            raise ConfigurationError(
+                f"Unknown DB_VECTOR_TYPE '{settings.db_vector_type}'. "
+                f"Valid values: {', '.join(map(repr, _VECTOR_TYPES))}."
+            )
+        self._vector_type = settings.db_vector_type
+        self._settings = settings
+        self._row_cache: dict[str, dict] = {}
         self._pool: Any = None
-        # Legacy single-connection attribute kept for close() backward compat
-        self._conn: Any = None
+        self._pool_lock = threading.Lock()
+        # ThreadedConnectionPool.getconn raises PoolError once maxconn are
+        # out; callers beyond that wait here for a connection to come back.
+        self._pool_slots = threading.BoundedSemaphore(self._pool_max)
         logger.debug("PostgresDatabaseAdapter ready | dsn=%s", self._dsn)
 
     # ── DatabasePort implementation ────────────────────────────────────────
 
     def vector_search(
         self,
-        embedding: list[float],
+        embedding: Vector,
         limit: int,
     ) -> list[tuple[str, int]]:
         """Approximate nearest-neighbour search via pgvector HNSW index.
 
         Returns list of (anzsic_code, rank) tuples, rank starting at 1.
         """
-        sql = """
-            SELECT anzsic_code,
-                   ROW_NUMBER() OVER (ORDER BY embedding <=> %s::vector) AS rank
-            FROM   anzsic_codes
-            WHERE  embedding IS NOT NULL
-            ORDER  BY embedding <=> %s::vector
-            LIMIT  %s
-        """
         try:
-            rows = self._execute(sql, (embedding, embedding, limit))
-            return [(row["anzsic_code"], row["rank"]) for row in rows]
+            rows = self._execute(
+                "EXECUTE anzsic_vec (%s, %s)", (_Float32VectorAdapter(embedding), limit)
+            )
+            return rows
         except Exception as exc:
             raise DatabaseError(f"vector_search failed: {exc}") from exc
 
@@ -123,66 +354,199 @@ class PostgresDatabaseAdapter:
         Falls back to an empty list rather than raising if no FTS results
         (colloquial queries often produce zero FTS hits — vector covers it).
         """
-        sql = """
-            SELECT anzsic_code,
-                   ROW_NUMBER() OVER (
-                       ORDER BY ts_rank_cd(fts_vector, query) DESC
-                   ) AS rank
-            FROM   anzsic_codes,
-                   (SELECT to_tsquery(string_agg(lexeme, ' | '))
-                    FROM   unnest(to_tsvector('english', %s))
-                   ) AS t(query)
-            WHERE  query IS NOT NULL
-              AND  fts_vector @@ query
-            ORDER  BY ts_rank_cd(fts_vector, query) DESC
-            LIMIT  %s
-        """
         try:
-            rows = self._execute(sql, (query_text, limit))
-            return [(row["anzsic_code"], row["rank"]) for row in rows]
+            rows = self._execute("EXECUTE anzsic_fts (%s, %s)", (query_text, limit))
+            return rows
         except Exception as exc:
             logger.warning("fts_search error (returning empty): %s", exc)
             return []
 
+    def vector_search_batch(
+        self,
+        embeddings: list[Vector],
+        limit: int,
+    ) -> list[list[tuple[str, int]]]:
+        """vector_search() for many query vectors in one round trip."""
+        if not embeddings:
+            return []
+        try:
+            rows = self._execute(
+                "EXECUTE anzsic_vec_batch (%s, %s)", (_vector_array_text(embeddings), limit)
+            )
+        except Exception as exc:
+            raise DatabaseError(f"vector_search_batch failed: {exc}") from exc
+        return _group_hits(rows, len(embeddings))
+
+    def fts_search_batch(
+        self,
+        query_texts: list[str],
+        limit: int,
+    ) -> list[list[tuple[str, int]]]:
+        """fts_search() for many queries in one round trip.
+
+        If the batch statement fails, each query is retried alone so one bad
+        query only empties its own hit list (fts_search's lenient contract).
+        """
+        if not query_texts:
+            return []
+        try:
+            rows = self._execute("EXECUTE anzsic_fts_batch (%s, %s)", (query_texts, limit))
+        except Exception as exc:
+            logger.warning("fts_search_batch failed (%s) — searching one by one", exc)
+            return [self.fts_search(text, limit) for text in query_texts]
+        return _group_hits(rows, len(query_texts))
+
     def fetch_by_codes(self, codes: list[str]) -> dict[str, dict]:
         """Fetch full records for a list of ANZSIC codes.
 
         Returns a dict keyed by anzsic_code.  Missing codes are absent.
+        Only codes not yet in the row cache go to the database.
         """
-        if not codes:
-            return {}
-        sql = f"""
-            SELECT {_SELECT_COLS}
-            FROM   anzsic_codes
-            WHERE  anzsic_code = ANY(%s)
+        missing = [code for code in codes if code not in self._row_cache]
+        if missing:
+            try:
+                rows = self._execute("EXECUTE anzsic_fetch (%s)", (missing,))
+            except Exception as exc:
+                raise DatabaseError(f"fetch_by_codes failed: {exc}") from exc
+            for row in rows:
+                self._row_cache[row[0]] = _record(row)
+        return _cached_records(self._row_cache, codes)
+
+    def hybrid_search(
+        self,
+        embedding: Vector | None,
+        query_text: str,
+        limit: int,
+        rrf_k: int | None = None,
+    ) -> tuple[list[tuple[str, int]], list[tuple[str, int]], dict[str, dict]]:
+        """Vector search + FTS + record fetch in a single round trip.
+
+        Pass ``embedding=None`` to skip the vector leg (FTS-only mode).  With
+        ``rrf_k`` the server pre-fuses the two legs and returns only the top
+        ``limit`` codes (≤ limit rows instead of ≤ 2·limit).  If the server
+        cannot run the fused statement (not prepared, or a function it needs
+        is missing), falls back to the three separate calls; any other error
+        propagates.
         """
         try:
-            rows = self._execute(sql, (codes,))
-            return {row["anzsic_code"]: dict(row) for row in rows}
-        except Exception as exc:
-            raise DatabaseError(f"fetch_by_codes failed: {exc}") from exc
+            rows = self._execute(
+                "EXECUTE anzsic_hybrid (%s, %s, %s, %s)",
+                (
+                    _Float32VectorAdapter(embedding) if embedding is not None else None,
+                    query_text,
+                    limit,
+                    rrf_k,
+                ),
+            )
+        except (
+            psycopg2.errors.UndefinedFunction,
+            psycopg2.errors.InvalidSqlStatementName,
+        ) as exc:
+            logger.warning("hybrid_search failed (%s) — falling back to separate queries", exc)
+            vec_only = self.vector_search(embedding, limit) if embedding is not None else []
+            fts_only = self.fts_search(query_text, limit)
+            codes = list(dict.fromkeys(code for code, _ in vec_only + fts_only))
+            return vec_only, fts_only, self.fetch_by_codes(codes)
+
+        vec_hits: list[tuple[str, int]] = []
+        fts_hits: list[tuple[str, int]] = []
+        records: dict[str, dict] = {}
+        n_cols = len(_RECORD_COLS)
+        for row in rows:
+            code = row[0]
+            vector_rank, fts_rank = row[n_cols], row[n_cols + 1]
+            if vector_rank is not None:
+                vec_hits.append((code, vector_rank))
+            if fts_rank is not None:
+                fts_hits.append((code, fts_rank))
+            record = self._row_cache.get(code)
+            if record is None:
+                record = self._row_cache[code] = _record(row)
+            records[code] = record
+        vec_hits.sort(key=lambda hit: hit[1])
+        fts_hits.sort(key=lambda hit: hit[1])
+        return vec_hits, fts_hits, records
+
+    # ── Maintenance (not part of DatabasePort) ─────────────────────────────
+
+    def rebuild_vector_index(self) -> None:
+        """Rebuild the HNSW index with the configured build params.
+
+        Uses HNSW_M / HNSW_EF_CONSTRUCTION, and raises maintenance_work_mem
+        and max_parallel_maintenance_workers for the session so the graph is
+        built in memory and in parallel.  Run after (re-)ingesting.
+
+        The new index is built CONCURRENTLY under a temporary name, then
+        swapped in (drop old + rename) in one transaction, so the table keeps
+        a vector index and accepts writes for the whole build.  The raised
+        session settings are reset even if the build fails, so they never
+        leak onto a pooled connection.
+
+        Raises:
+            DatabaseError: If the rebuild fails.
+        """
+        cfg = self._settings
+        building = f"{_VECTOR_INDEX}_rebuild"
+        ddl = (
+            f"CREATE INDEX CONCURRENTLY {building} ON anzsic_codes "
+            f"USING hnsw (embedding {self._vector_type}_cosine_ops) "
+            f"WITH (m = {int(cfg.hnsw_m)}, ef_construction = {int(cfg.hnsw_ef_construction)})"
+        )
+        _t0 = time.perf_counter()
+        try:
+            # Autocommit connection: CONCURRENTLY cannot run in a transaction.
+            with self._borrow() as conn, conn.cursor() as cur:
+                try:
+                    cur.execute(
+                        "SET maintenance_work_mem = %s", (cfg.db_maintenance_work_mem,)
+                    )
+                    cur.execute(
+                        "SET max_parallel_maintenance_workers = %s",
+                        (cfg.db_max_parallel_maintenance_workers,),
+                    )
+                    # An earlier failed concurrent build leaves an INVALID index.
+                    cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {building}")
+                    cur.execute(ddl)
+                    # One multi-statement query runs as a single transaction.
+                    cur.execute(
+                        f"DROP INDEX IF EXISTS {_VECTOR_INDEX}; "
+                        f"ALTER INDEX {building} RENAME TO {_VECTOR_INDEX}"
+                    )
+                finally:
+                    if not conn.closed:
+                        cur.execute("RESET maintenance_work_mem")
+                        cur.execute("RESET max_parallel_maintenance_workers")
+        except psycopg2.Error as exc:
+            raise DatabaseError(f"rebuild_vector_index failed: {exc}") from exc
+        logger.info(
+            "HNSW index rebuilt | m=%d ef_construction=%d elapsed=%.1fs",
+            cfg.hnsw_m, cfg.hnsw_ef_construction, time.perf_counter() - _t0,
+        )
 
     # ── Connection pool helpers ────────────────────────────────────────────
 
     def _get_pool(self) -> Any:
         """Return (or lazily create) the ThreadedConnectionPool."""
-        if self._pool is None:
+        if self._pool is not None:
+            return self._pool
+        with self._pool_lock:
+            if self._pool is not None:
+                return self._pool
             try:
                 pool = psycopg2.pool.ThreadedConnectionPool(
-                    _POOL_MINCONN,
-                    _POOL_MAXCONN,
+                    self._pool_min,
+                    self._pool_max,
                     self._dsn,
                 )
-                # Register pgvector on every connection in the pool
-                for _ in range(_POOL_MINCONN):
-                    conn = pool.getconn()
-                    conn.autocommit = True
-                    register_vector(conn)
+                # Initialise every warm connection (borrow all, then return)
+                conns = [pool.getconn() for _ in range(self._pool_min)]
+                for conn in conns:
+                    self._init_conn(conn)
                     pool.putconn(conn)
                 logger.info(
                     "PostgresDatabaseAdapter: pool created min=%d max=%d",
-                    _POOL_MINCONN,
-                    _POOL_MAXCONN,
+                    self._pool_min,
+                    self._pool_max,
                 )
                 self._pool = pool
             except psycopg2.Error as exc:
@@ -193,41 +557,191 @@ class PostgresDatabaseAdapter:
         """Open a single connection with pgvector registered (pool bootstrap)."""
         try:
             conn = psycopg2.connect(self._dsn)
-            conn.autocommit = True
-            register_vector(conn)
+            self._init_conn(conn)
             logger.debug("PostgresDatabaseAdapter: new connection opened")
             return conn
         except psycopg2.Error as exc:
             raise DatabaseError(f"Cannot connect to database: {exc}") from exc
 
-    def _execute(self, sql: str, params: tuple) -> list[dict]:
-        """Execute a query borrowing a connection from the pool.
+    def _init_conn(self, conn: Any) -> None:
+        """Prepare a fresh connection: autocommit, pgvector, HNSW search
+        breadth, hot-path statements."""
+        conn.autocommit = True
+        register_vector(conn)
+        with conn.cursor() as cur:
+            cur.execute("SET hnsw.ef_search = %s", (self._ef_search,))
+            for statement in _prepare_statements(self._vector_type):
+                cur.execute(statement)
+
+    @contextmanager
+    def _borrow(self) -> Iterator[Any]:
+        """Borrow an initialised connection from the pool for one query.
 
-        The connection is returned to the pool after use, whether the query
-        succeeds or fails — so the pool is never exhausted by exceptions.
+        The connection is always returned — closed instead of recycled if it
+        raised OperationalError — so the pool is never exhausted by exceptions.
+        Blocks while all db_pool_max connections are borrowed.
         """
         pool = self._get_pool()
-        conn = pool.getconn()
+        with self._pool_slots:
+            conn = pool.getconn()
+            try:
+                if conn.autocommit is False:
+                    # Opened by the pool since bootstrap — not yet initialised
+                    self._init_conn(conn)
+                yield conn
+            except psycopg2.OperationalError:
+                pool.putconn(conn, close=True)
+                raise
+            except BaseException:
+                pool.putconn(conn)
+                raise
+            else:
+                pool.putconn(conn)
+
+    def _execute(self, sql: str, params: tuple) -> list[tuple]:
+        """Execute a query on a pooled connection; retry once if it was stale."""
         try:
-            if conn.autocommit is False:
-                conn.autocommit = True
-                register_vector(conn)
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                cur.execute(sql, params)
-                rows = list(cur.fetchall())
-            pool.putconn(conn)
-            return rows
+            return self._query(sql, params)
         except psycopg2.OperationalError as exc:
-            # Connection may have gone stale — discard it and open a fresh one
-            logger.warning("DB OperationalError — replacing stale connection: %s", exc)
-            pool.putconn(conn, close=True)
-            raise DatabaseError(f"DB query failed (stale connection discarded): {exc}") from exc
-        except Exception:
-            pool.putconn(conn)
-            raise
+            logger.warning("DB OperationalError — retrying on a fresh connection: %s", exc)
+        try:
+            return self._query(sql, params)
+        except psycopg2.OperationalError as exc:
+            raise DatabaseError(f"DB query failed after reconnect: {exc}") from exc
+
+    def _query(self, sql: str, params: tuple) -> list[tuple]:
+        # Plain tuple cursor: callers map columns positionally (_RECORD_COLS
+        # order), avoiding a per-row dict build by column-name lookup.
+        with self._borrow() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                return list(cur.fetchall())
 
     def close(self) -> None:
         """Close all connections in the pool (called on process shutdown)."""
         if self._pool:
             self._pool.closeall()
             logger.debug("PostgresDatabaseAdapter: pool closed")
+
+
+class AsyncPostgresDatabaseAdapter:
+    """asyncpg + pgvector implementation of AsyncDatabasePort.
+
+    The pool (DB_POOL_MIN..DB_POOL_MAX) is created on first use, so it binds
+    to the event loop that awaits it — create one adapter per loop and
+    ``await aclose()`` it on shutdown.  Requires the ``async`` extra.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        if settings.db_vector_type not in _VECTOR_TYPES:
+            raise ConfigurationError(
+                f"Unknown DB_VECTOR_TYPE '{settings.db_vector_type}'. "
+                f"Valid values: {', '.join(map(repr, _VECTOR_TYPES))}."
+            )
+        self._settings = settings
+        self._row_cache: dict[str, dict] = {}
+        self._pool: Any = None
+        self._pool_lock: asyncio.Lock | None = None
+        logger.debug("AsyncPostgresDatabaseAdapter ready | dsn=%s", settings.db_dsn)
+
+    # ── AsyncDatabasePort implementation ───────────────────────────────────
+
+    async def vector_search(self, embedding: Vector, limit: int) -> list[tuple[str, int]]:
+        """Awaitable counterpart of PostgresDatabaseAdapter.vector_search()."""
+        try:
+            rows = await self._fetch("anzsic_vec", embedding, limit)
+        except Exception as exc:
+            raise DatabaseError(f"vector_search failed: {exc}") from exc
+        return [tuple(row) for row in rows]
+
+    async def fts_search(self, query_text: str, limit: int) -> list[tuple[str, int]]:
+        """Awaitable counterpart of PostgresDatabaseAdapter.fts_search()."""
+        try:
+            rows = await self._fetch("anzsic_fts", query_text, limit)
+        except Exception as exc:
+            logger.warning("fts_search error (returning empty): %s", exc)
+            return []
+        return [tuple(row) for row in rows]
+
+    async def fetch_by_codes(self, codes: list[str]) -> dict[str, dict]:
+        """Awaitable counterpart of PostgresDatabaseAdapter.fetch_by_codes()."""
+        missing = [code for code in codes if code not in self._row_cache]
+        if missing:
+            try:
+                rows = await self._fetch("anzsic_fetch", missing)
+            except Exception as exc:
+                raise DatabaseError(f"fetch_by_codes failed: {exc}") from exc
+            for row in rows:
+                self._row_cache[row[0]] = _record(row)
+        return _cached_records(self._row_cache, codes)
+
+    async def aclose(self) -> None:
+        """Close the asyncpg pool."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            logger.debug("AsyncPostgresDatabaseAdapter: pool closed")
+
+    # ── Private helpers ────────────────────────────────────────────────────
+
+    async def _fetch(self, name: str, *args: Any) -> list[Any]:
+        """Run statement *name* on a pooled connection (prepared on first use)."""
+        pool = await self._get_pool()
+        return await pool.fetch(_STATEMENTS[name][1], *args)
+
+    async def _get_pool(self) -> Any:
+        """Return (or lazily create) the asyncpg pool."""
+        if self._pool is not None:
+            return self._pool
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        async with self._pool_lock:
+            if self._pool is None:
+                try:
+                    import asyncpg
+                except ImportError as exc:
+                    raise ImportError(
+                        'asyncpg is not installed. Run: pip install -e ".[async]"'
+                    ) from exc
+                try:
+                    self._pool = await asyncpg.create_pool(
+                        self._settings.db_dsn,
+                        min_size=self._settings.db_pool_min,
+                        max_size=self._settings.db_pool_max,
+                        init=_init_async_conn,
+                        # A startup parameter, not SET: asyncpg runs RESET ALL
+                        # whenever a connection goes back to the pool.
+                        server_settings={"hnsw.ef_search": str(self._settings.hnsw_ef_search)},
+                    )
+                except (OSError, asyncpg.PostgresError) as exc:
+                    raise DatabaseError(f"Cannot create connection pool: {exc}") from exc
+                logger.info(
+                    "AsyncPostgresDatabaseAdapter: pool created min=%d max=%d",
+                    self._settings.db_pool_min,
+                    self._settings.db_pool_max,
+                )
+        return self._pool
+
+
+def _record(row: tuple) -> dict[str, Any]:
+    """Row-cache record for a row whose leading columns are _RECORD_COLS.
+
+    Repeated hierarchy strings are interned, so the whole cache shares one
+    copy of each description (and equality checks hit the identity path).
+    """
+    return {
+        col: sys.intern(value) if col in _INTERNED_COLS and value else value
+        for col, value in zip(_RECORD_COLS, row)
+    }
+
+
+def _cached_records(cache: dict[str, dict], codes: list[str]) -> dict[str, dict]:
+    """The cached records for *codes*; codes not in the table are omitted."""
+    return {code: cache[code] for code in codes if code in cache}
+
+
+async def _init_async_conn(conn: Any) -> None:
+    """Register pgvector's binary vector / halfvec codecs on a new connection."""
+    from pgvector.asyncpg import register_vector as register_vector_async
+
+    await register_vector_async(conn)
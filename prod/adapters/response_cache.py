@@ -0,0 +1,364 @@
+"""
+adapters/response_cache.py
+──────────────────────────────────────────────────────────────────────────────
+Process-local LRU caches in front of any EmbeddingPort / LLMPort.
+
+  CachedEmbeddingAdapter  → wraps an EmbeddingPort (embed_query[_batch] /
+                            embed_document)
+  CachedLLMAdapter        → wraps an LLMPort       (generate_json)
+  DiskCachedEmbeddingAdapter → persists query embeddings across restarts
+                            (diskcache; pip install -e ".[cache]")
+
+Both are decorators in the hexagonal sense: they implement the same Port as
+the adapter they wrap, so services never know a cache is present.  Wiring
+happens in services/container.py when ENABLE_RESPONSE_CACHE is on.
+
+Why cache?
+  Reranking and evaluation runs see the same occupation strings again and
+  again.  A hit costs one dict lookup instead of an HTTPS round-trip and a
+  billed API call.
+
+Keys:
+  Embeddings → (model_name, dimensions, kind, text[, title])
+               query text is normalised (case-folded, whitespace collapsed)
+               so "Plumber " and "plumber" share one entry
+  LLM        → (model_name, blake2b(system_prompt), blake2b(user_message))
+  Prompts are hashed so multi-KB system prompts are not held as keys.
+
+Singleflight:
+  Concurrent misses for the same key are coalesced — the first caller makes
+  the network call, the rest block on its Future and share the result (or
+  exception).  N Streamlit sessions asking for the same cold query cost one
+  API call, not N.
+
+Disk tier:
+  With EMBED_DISK_CACHE_DIR set, query embeddings are also stored on disk
+  (size-bounded by EMBED_DISK_CACHE_SIZE_MB, LRU-evicted by diskcache) and
+  the in-memory LRU sits in front of it: memory → disk → provider.  A
+  popular query costs a local read, not an API call, after a restart.
+
+Failed LLM calls (None) are never cached, so a transient outage is retried
+on the next request.  Cached vectors are frozen read-only and shared, so a
+hit is zero-copy and a caller cannot mutate the cached value in place.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from prod.ports.embedding_port import EmbeddingPort, Vector
+from prod.ports.llm_port import LLMPort
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Minimal thread-safe bounded LRU mapping."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._data.move_to_end(key)
+            return value
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of get() calls served from the cache (0.0 before any)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run *fn* once per key at a time; concurrent callers share its result."""
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future: Future = Future()
+                self._inflight[key] = future
+        if inflight is not None:
+            return inflight.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
+class CachedEmbeddingAdapter:
+    """EmbeddingPort decorator that memoises single-text embeddings.
+
+    embed_documents_batch() is passed straight through — it is an offline
+    ingestion path whose texts are already unique.
+    """
+
+    def __init__(self, inner: EmbeddingPort, maxsize: int) -> None:
+        self._inner = inner
+        self._cache = LRUCache(maxsize)
+        self._flight = SingleFlight()
+
+    # ── EmbeddingPort implementation ───────────────────────────────────────
+
+    @property
+    def model_name(self) -> str:
+        return self._inner.model_name
+
+    @property
+    def dimensions(self) -> int:
+        return self._inner.dimensions
+
+    def embed_query(self, text: str) -> Vector:
+        key = (self._inner.model_name, self._inner.dimensions, "query", _normalise(text))
+        vector = self._cache.get(key)
+        if vector is None:
+            vector = self._flight.do(key, lambda: self._fill(key, self._inner.embed_query, text))
+        else:
+            logger.debug("Embedding cache hit (query) | hit_rate=%.2f", self._cache.hit_rate)
+        return vector
+
+    def embed_queries_batch(self, texts: list[str]) -> list[Vector | None]:
+        """Serve cached queries; embed the distinct misses in one inner batch."""
+        keys = [
+            (self._inner.model_name, self._inner.dimensions, "query", _normalise(t))
+            for t in texts
+        ]
+        results = [self._cache.get(key) for key in keys]
+        misses: dict[Hashable, str] = {}
+        for key, text, vector in zip(keys, texts, results):
+            if vector is None:
+                misses.setdefault(key, text)
+        if misses:
+            filled = dict(zip(misses, self._inner.embed_queries_batch(list(misses.values()))))
+            for key, vector in filled.items():
+                if vector is not None:
+                    filled[key] = _frozen(vector)
+                    self._cache.put(key, filled[key])
+            results = [filled[k] if v is None else v for k, v in zip(keys, results)]
+        return results
+
+    def embed_document(self, text: str, title: str = "") -> Vector:
+        key = (self._inner.model_name, self._inner.dimensions, "document", text, title)
+        vector = self._cache.get(key)
+        if vector is None:
+            vector = self._flight.do(
+                key, lambda: self._fill(key, self._inner.embed_document, text, title)
+            )
+        else:
+            logger.debug("Embedding cache hit (document)")
+        return vector
+
+    def embed_documents_batch(
+        self,
+        texts: list[str],
+        titles: list[str] | None = None,
+    ) -> list[Vector | None]:
+        return self._inner.embed_documents_batch(texts, titles)
+
+    def _fill(self, key: Hashable, embed: Callable[..., Vector], *args: str) -> Vector:
+        """Embed and cache before the in-flight entry is released."""
+        vector = _frozen(embed(*args))
+        self._cache.put(key, vector)
+        return vector
+
+
+class DiskCachedEmbeddingAdapter:
+    """EmbeddingPort decorator that persists query embeddings on disk.
+
+    Keys are blake2b(model_name|dimensions|normalised text); values are
+    (dtype, raw bytes).  Document embedding is passed straight through.
+    Requires the ``cache`` extra.
+    """
+
+    def __init__(self, inner: EmbeddingPort, directory: str, size_limit_mb: int) -> None:
+        try:
+            import diskcache
+        except ImportError as exc:
+            raise ImportError(
+                'diskcache is not installed. Run: pip install -e ".[cache]"'
+            ) from exc
+        self._inner = inner
+        self._disk = diskcache.Cache(
+            str(Path(directory).expanduser()), size_limit=size_limit_mb * 1024 * 1024
+        )
+
+    # ── EmbeddingPort implementation ───────────────────────────────────────
+
+    @property
+    def model_name(self) -> str:
+        return self._inner.model_name
+
+    @property
+    def dimensions(self) -> int:
+        return self._inner.dimensions
+
+    def embed_query(self, text: str) -> Vector:
+        key = self._key(text)
+        stored = self._disk.get(key)
+        if stored is not None:
+            logger.debug("Embedding disk cache hit (query)")
+            return _from_stored(stored)
+        vector = self._inner.embed_query(text)
+        self._store(key, vector)
+        return vector
+
+    def embed_queries_batch(self, texts: list[str]) -> list[Vector | None]:
+        keys = [self._key(t) for t in texts]
+        results: list[Vector | None] = []
+        miss_idxs: list[int] = []
+        for i, key in enumerate(keys):
+            stored = self._disk.get(key)
+            results.append(None if stored is None else _from_stored(stored))
+            if stored is None:
+                miss_idxs.append(i)
+        if miss_idxs:
+            filled = self._inner.embed_queries_batch([texts[i] for i in miss_idxs])
+            for i, vector in zip(miss_idxs, filled):
+                results[i] = vector
+                if vector is not None:
+                    self._store(keys[i], vector)
+        return results
+
+    def embed_document(self, text: str, title: str = "") -> Vector:
+        return self._inner.embed_document(text, title)
+
+    def embed_documents_batch(
+        self,
+        texts: list[str],
+        titles: list[str] | None = None,
+    ) -> list[Vector | None]:
+        return self._inner.embed_documents_batch(texts, titles)
+
+    def close(self) -> None:
+        self._disk.close()
+
+    def _key(self, text: str) -> str:
+        raw = f"{self._inner.model_name}|{self._inner.dimensions}|{_normalise(text)}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _store(self, key: str, vector: Vector) -> None:
+        """Persist a non-empty vector (empty = FTS-only / blank, never stored)."""
+        vector = np.asarray(vector)
+        if len(vector):
+            self._disk.set(key, (vector.dtype.str, vector.tobytes()))
+
+
+class CachedLLMAdapter:
+    """LLMPort decorator that memoises successful generate_json() results."""
+
+    def __init__(self, inner: LLMPort, maxsize: int) -> None:
+        self._inner = inner
+        self._cache = LRUCache(maxsize)
+        self._flight = SingleFlight()
+
+    # ── LLMPort implementation ─────────────────────────────────────────────
+
+    @property
+    def model_name(self) -> str:
+        return self._inner.model_name
+
+    def generate_json(self, system_prompt: str, user_message: str) -> str | None:
+        key = self._key(system_prompt, user_message)
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.debug("LLM cache hit")
+            return cached
+        return self._flight.do(key, lambda: self._fill(key, system_prompt, user_message))
+
+    def generate_json_batch(
+        self, system_prompt: str, user_messages: list[str]
+    ) -> list[str | None]:
+        """Serve cached messages; send only the misses to the inner batch."""
+        keys = [self._key(system_prompt, m) for m in user_messages]
+        results = [self._cache.get(key) for key in keys]
+        misses = [i for i, r in enumerate(results) if r is None]
+        if misses:
+            fresh = self._inner.generate_json_batch(
+                system_prompt, [user_messages[i] for i in misses]
+            )
+            for i, result in zip(misses, fresh):
+                results[i] = result
+                if result is not None:
+                    self._cache.put(keys[i], result)
+        logger.debug("LLM batch cache | hits=%d misses=%d", len(keys) - len(misses), len(misses))
+        return results
+
+    def _key(self, system_prompt: str, user_message: str) -> Hashable:
+        return (
+            self._inner.model_name,
+            hashlib.blake2b(system_prompt.encode(), digest_size=16).digest(),
+            hashlib.blake2b(user_message.encode(), digest_size=16).digest(),
+        )
+
+    def _fill(self, key: Hashable, system_prompt: str, user_message: str) -> str | None:
+        """Call the LLM and cache a successful result."""
+        result = self._inner.generate_json(system_prompt, user_message)
+        if result is not None:
+            self._cache.put(key, result)
+        return result
+
+
+# ── Private helpers ────────────────────────────────────────────────────────
+
+def _normalise(text: str) -> str:
+    """Cache-key form of a search query: case-folded, whitespace collapsed."""
+    return " ".join(text.split()).casefold()
+
+
+def _from_stored(stored: tuple[str, bytes]) -> Vector:
+    """Read-only vector over a (dtype, bytes) disk-cache value."""
+    dtype, raw = stored
+    return np.frombuffer(raw, dtype=np.dtype(dtype))
+
+
+def _frozen(vector: Vector) -> Vector:
+    """Mark *vector* read-only so the shared cached copy cannot be mutated."""
+    vector = np.asarray(vector)
+    vector.setflags(write=False)
+    return vector
@@ -6,11 +6,19 @@ Implements EmbeddingPort using Vertex AI text-embedding-005.
 Key behaviour:
   - embed_query  → RETRIEVAL_QUERY  task type (asymmetric retrieval)
   - embed_document → RETRIEVAL_DOCUMENT task type
-  - embed_documents_batch → single API call for up to embed_batch_size items
+  - embed_documents_batch / embed_queries_batch → one API call per
+    embed_batch_size items, up to EMBED_PARALLELISM calls in flight at once
   - Retries on transient HTTP errors (429, 503) with exponential back-off
+    (or the server's Retry-After)
   - Corporate proxy support via settings.https_proxy
+  - Shares the process-wide Session for the regional aiplatform host with
+    GeminiLLMAdapter (TLS handshake paid once per process, not per call)
   - Token 401 → triggers GCPAuthManager.invalidate() then retries once
 
+AsyncVertexEmbeddingAdapter is an asyncio sibling for the per-query path
+(embed_query over an HTTP/2 httpx.AsyncClient, awaitable back-off) used by
+AsyncClassifierPipeline.
+
 To swap to a different embedding model (e.g. OpenAI text-embedding-3-large):
   1. Write OpenAIEmbeddingAdapter implementing EmbeddingPort
   2. Change ONE import in services/container.py
@@ -18,15 +26,33 @@ To swap to a different embedding model (e.g. OpenAI text-embedding-3-large):
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any
 
-import requests
+import numpy as np
+import orjson
 
 from prod.adapters.gcp_auth import GCPAuthManager
+from prod.adapters.http_session import (
+    acquire_session,
+    aiplatform_base_url,
+    body_snippet,
+    build_async_client,
+    jittered,
+    proxies_for,
+    release_session,
+    retry_after,
+)
 from prod.config.settings import Settings
 from prod.domain.exceptions import AuthenticationError, EmbeddingError
+from prod.ports.embedding_port import Vector
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +60,14 @@ _TASK_QUERY = "RETRIEVAL_QUERY"
 _TASK_DOCUMENT = "RETRIEVAL_DOCUMENT"
 
 
-def _build_embed_url(settings: Settings) -> str:
+@lru_cache(maxsize=4)
+def _build_embed_url(location: str, project: str, model: str) -> str:
+    """Predict endpoint — memoised per (location, project, model)."""
     return (
-        f"https://{settings.gcp_location_id}-aiplatform.googleapis.com"
-        f"/v1/projects/{settings.gcp_project_id}"
-        f"/locations/{settings.gcp_location_id}"
-        f"/publishers/google/models/{settings.gcp_embed_model}:predict"
+        f"{aiplatform_base_url(location)}"
+        f"/v1/projects/{project}"
+        f"/locations/{location}"
+        f"/publishers/google/models/{model}:predict"
     )
 
 
@@ -52,12 +80,15 @@ class VertexEmbeddingAdapter:
     def __init__(self, auth: GCPAuthManager, settings: Settings) -> None:
         self._auth = auth
         self._settings = settings
-        self._url = _build_embed_url(settings)
-        self._proxies = (
-            {"https": f"http://{settings.https_proxy}"}
-            if settings.https_proxy
-            else {}
+        self._base_url = aiplatform_base_url(settings.gcp_location_id)
+        self._url = _build_embed_url(
+            settings.gcp_location_id, settings.gcp_project_id, settings.gcp_embed_model
         )
+        self._dtype = np.dtype(settings.embed_dtype)
+        # Read on every request / retry attempt — hoisted off Settings.
+        self._timeout = settings.embed_timeout
+        self._batch_retries = settings.embed_retries
+        self._proxies = proxies_for(settings.https_proxy)
         logger.debug("VertexEmbeddingAdapter ready | url=%s", self._url)
 
     # ── EmbeddingPort implementation ───────────────────────────────────────
@@ -70,11 +101,16 @@ class VertexEmbeddingAdapter:
     def dimensions(self) -> int:
         return self._settings.embed_dim
 
-    def embed_query(self, text: str) -> list[float]:
+    def embed_query(self, text: str) -> Vector:
         """Embed a query with RETRIEVAL_QUERY task type."""
         return self._embed_single(text, task_type=_TASK_QUERY)
 
-    def embed_document(self, text: str, title: str = "") -> list[float]:
+    def embed_queries_batch(self, texts: list[str]) -> list[Vector | None]:
+        """Embed queries with RETRIEVAL_QUERY task type, batched like
+        embed_documents_batch()."""
+        return self._embed_many(texts, [""] * len(texts), _TASK_QUERY)
+
+    def embed_document(self, text: str, title: str = "") -> Vector:
         """Embed a document with RETRIEVAL_DOCUMENT task type."""
         return self._embed_single(text, task_type=_TASK_DOCUMENT, title=title)
 
@@ -82,66 +118,117 @@ class VertexEmbeddingAdapter:
         self,
         texts: list[str],
         titles: list[str] | None = None,
-    ) -> list[list[float] | None]:
-        """Embed multiple documents in batches."""
+    ) -> list[Vector | None]:
+        """Embed multiple documents in batches (duplicates embedded once).
+
+        Batches are sent concurrently, up to ``EMBED_PARALLELISM`` at a time.
+
+        Blank texts are never sent; their slots come back as ``None``.
+        """
+        return self._embed_many(texts, titles or [""] * len(texts), _TASK_DOCUMENT)
+
+    def close(self) -> None:
+        """Release this adapter's reference to the shared regional session."""
+        if self.__dict__.pop("_session", None) is not None:
+            release_session(self._base_url)
+
+    # ── Private helpers ────────────────────────────────────────────────────
+
+    @cached_property
+    def _session(self) -> requests.Session:
+        """Process-wide session for the regional aiplatform host, acquired on
+        first use.  Headers (including the rotating token) go per request."""
+        return acquire_session(self._base_url)
+
+    def _embed_many(
+        self,
+        texts: list[str],
+        titles: list[str],
+        task_type: str,
+    ) -> list[Vector | None]:
+        """Shared body of the *_batch methods for one task type."""
         if not texts:
             return []
-        titles = titles or [""] * len(texts)
-        batch_size = self._settings.embed_batch_size
-        all_results: list[list[float] | None] = []
 
-        for start in range(0, len(texts), batch_size):
-            chunk_texts = texts[start : start + batch_size]
-            chunk_titles = titles[start : start + batch_size]
-            batch_results = self._embed_batch(chunk_texts, _TASK_DOCUMENT, chunk_titles)
-            all_results.extend(batch_results)
+        # Embed each distinct non-blank (text, title) once, then scatter back.
+        unique_to_idxs: dict[tuple[str, str], list[int]] = {}
+        for i, pair in enumerate(zip(texts, titles)):
+            if pair[0] and pair[0].strip():
+                unique_to_idxs.setdefault(pair, []).append(i)
+        if not unique_to_idxs:
+            return [None] * len(texts)
+        unique_texts = [text for text, _ in unique_to_idxs]
+        unique_titles = [title for _, title in unique_to_idxs]
 
+        batch_size = self._settings.embed_batch_size
+        starts = range(0, len(unique_texts), batch_size)
+        text_chunks = [unique_texts[start : start + batch_size] for start in starts]
+        title_chunks = [unique_titles[start : start + batch_size] for start in starts]
+        workers = min(self._settings.embed_parallelism, len(text_chunks))
+
+        # Batches are independent Predict calls, so overlap them on a thread
+        # pool.  map() yields in submission order, preserving input ordering.
+        def embed_chunk(chunk_texts: list[str], chunk_titles: list[str]) -> list[Vector | None]:
+            return self._embed_batch(chunk_texts, task_type, chunk_titles)
+
+        if workers <= 1:
+            batch_results = list(map(embed_chunk, text_chunks, title_chunks))
+        else:
+            _ = self._session  # acquire once, before the workers race for it
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                batch_results = list(pool.map(embed_chunk, text_chunks, title_chunks))
+        vectors = [vec for batch in batch_results for vec in batch]
+
+        all_results: list[Vector | None] = [None] * len(texts)
+        for idxs, vec in zip(unique_to_idxs.values(), vectors):
+            for i in idxs:
+                all_results[i] = vec
         return all_results
 
-    # ── Private helpers ────────────────────────────────────────────────────
-
     def _embed_single(
         self,
         text: str,
         task_type: str,
         title: str = "",
         retries: int = 3,
-    ) -> list[float]:
-        """Call the Vertex AI Predict endpoint for a single text."""
-        instance: dict[str, Any] = {"content": text, "task_type": task_type}
-        if title:
-            instance["title"] = title
-        payload = {"instances": [instance]}
-
+    ) -> Vector:
+        """Call the Vertex AI Predict endpoint for a single text.
+
+        Blank text returns an empty vector without a network call.
+        """
+        if not text or not text.strip():
+            logger.debug("Blank text — skipping Vertex embed call")
+            return np.empty(0, dtype=self._dtype)
+        payload = _single_payload(text, task_type, title)
         response_json = self._post_with_retry(payload, retries=retries)
-        try:
-            return response_json["predictions"][0]["embeddings"]["values"]
-        except (KeyError, IndexError, TypeError) as exc:
-            raise EmbeddingError(
-                f"Unexpected embed response shape: {list(response_json.keys())}"
-            ) from exc
+        return _single_vector(response_json, self._dtype)
 
     def _embed_batch(
         self,
         texts: list[str],
         task_type: str,
         titles: list[str],
-    ) -> list[list[float] | None]:
+    ) -> list[Vector | None]:
         """Call Predict for a batch of texts; returns None for failed items."""
-        instances = [
-            {"content": t, "task_type": task_type, **({"title": tl} if tl else {})}
-            for t, tl in zip(texts, titles)
-        ]
+        instances = [{"content": t, "task_type": task_type} for t in texts]
+        if any(titles):
+            for instance, title in zip(instances, titles):
+                if title:
+                    instance["title"] = title
         payload = {"instances": instances}
         try:
-            response_json = self._post_with_retry(payload, retries=self._settings.embed_retries)
+            response_json = self._post_with_retry(payload, retries=self._batch_retries)
             predictions = response_json.get("predictions", [])
-            results: list[list[float] | None] = []
-            for pred in predictions:
-                try:
-                    results.append(pred["embeddings"]["values"])
-                except (KeyError, TypeError):
-                    results.append(None)
+            results: list[Vector | None]
+            try:
+                # One (n, dim) conversion instead of n small ones; each
+                # result is a row view of the block.
+                block = np.asarray(
+                    [pred["embeddings"]["values"] for pred in predictions], dtype=self._dtype
+                )
+                results = list(block) if block.ndim == 2 else []
+            except (KeyError, TypeError, ValueError):
+                results = [_prediction_vector(pred, self._dtype) for pred in predictions]
             # Pad with None if fewer predictions returned than requested
             while len(results) < len(texts):
                 results.append(None)
@@ -156,8 +243,11 @@ class VertexEmbeddingAdapter:
         retries: int = 3,
     ) -> dict:
         """POST to Vertex AI with retry and token refresh on 401."""
+        import requests
+
         delay = 1.0
         last_exc: Exception | None = None
+        body = orjson.dumps(payload)  # serialised once, reused across retries
 
         for attempt in range(1, retries + 1):
             token = self._auth.get_token()
@@ -166,17 +256,17 @@ class VertexEmbeddingAdapter:
                 "Content-Type": "application/json",
             }
             try:
-                resp = requests.post(
+                resp = self._session.post(
                     self._url,
                     headers=headers,
-                    json=payload,
+                    data=body,
                     proxies=self._proxies,
-                    timeout=self._settings.embed_timeout,
+                    timeout=self._timeout,
                 )
             except requests.RequestException as exc:
                 last_exc = exc
                 logger.warning("Embed HTTP error (attempt %d/%d): %s", attempt, retries, exc)
-                time.sleep(delay)
+                time.sleep(jittered(delay))
                 delay *= 2
                 continue
 
@@ -186,19 +276,145 @@ class VertexEmbeddingAdapter:
                 continue
 
             if resp.status_code in (429, 503):
+                wait = retry_after(resp.headers, jittered(delay))
                 logger.warning("Embed %d (attempt %d/%d) — back-off %.1fs",
-                               resp.status_code, attempt, retries, delay)
-                time.sleep(delay)
+                               resp.status_code, attempt, retries, wait)
+                time.sleep(wait)
                 delay *= 2
                 continue
 
             if not resp.ok:
                 raise EmbeddingError(
-                    f"Vertex AI Embed returned HTTP {resp.status_code}: {resp.text[:200]}"
+                    f"Vertex AI Embed returned HTTP {resp.status_code}: {body_snippet(resp, 200)}"
+                )
+
+            return orjson.loads(resp.content)
+
+        raise EmbeddingError(
+            f"Embed failed after {retries} attempts"
+        ) from last_exc
+
+
+class AsyncVertexEmbeddingAdapter:
+    """asyncio variant of VertexEmbeddingAdapter satisfying AsyncEmbeddingPort.
+
+    Only embed_query() is provided — document embedding is an offline,
+    batch path served by the sync adapter.  Shares the GCPAuthManager with
+    the sync adapters.  Create one adapter per event loop and
+    ``await aclose()`` it on shutdown.
+    """
+
+    def __init__(self, auth: GCPAuthManager, settings: Settings) -> None:
+        self._auth = auth
+        self._settings = settings
+        self._url = _build_embed_url(
+            settings.gcp_location_id, settings.gcp_project_id, settings.gcp_embed_model
+        )
+        self._dtype = np.dtype(settings.embed_dtype)
+        self._client = build_async_client(
+            headers={"Content-Type": "application/json"},
+            proxy=f"http://{settings.https_proxy}" if settings.https_proxy else None,
+            timeout=settings.embed_timeout,
+            http2=True,
+        )
+        logger.debug("AsyncVertexEmbeddingAdapter ready | url=%s", self._url)
+
+    # ── AsyncEmbeddingPort implementation ──────────────────────────────────
+
+    @property
+    def model_name(self) -> str:
+        return self._settings.gcp_embed_model
+
+    @property
+    def dimensions(self) -> int:
+        return self._settings.embed_dim
+
+    async def embed_query(self, text: str) -> Vector:
+        """Awaitable counterpart of VertexEmbeddingAdapter.embed_query()."""
+        if not text or not text.strip():
+            logger.debug("Blank text — skipping Vertex embed call")
+            return np.empty(0, dtype=self._dtype)
+        response_json = await self._post_with_retry(_single_payload(text, _TASK_QUERY))
+        return _single_vector(response_json, self._dtype)
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client."""
+        await self._client.aclose()
+
+    # ── Private helpers ────────────────────────────────────────────────────
+
+    async def _post_with_retry(self, payload: dict, retries: int = 3) -> dict:
+        """POST to Vertex AI with token refresh on 401 and awaitable back-off."""
+        import httpx
+
+        delay = 1.0
+        last_exc: Exception | None = None
+        body = orjson.dumps(payload)
+
+        for attempt in range(1, retries + 1):
+            token = await self._auth.aget_token()
+            try:
+                resp = await self._client.post(
+                    self._url,
+                    headers={"Authorization": f"Bearer {token}"},
+                    content=body,
+                )
+            except httpx.HTTPError as exc:
+                last_exc = exc
+                logger.warning("Embed HTTP error (attempt %d/%d): %s", attempt, retries, exc)
+                await asyncio.sleep(jittered(delay))
+                delay *= 2
+                continue
+
+            if resp.status_code == 401:
+                logger.warning("Embed 401 — invalidating token and retrying")
+                self._auth.invalidate()
+                continue
+
+            if resp.status_code in (429, 503):
+                wait = retry_after(resp.headers, jittered(delay))
+                logger.warning("Embed %d (attempt %d/%d) — back-off %.1fs",
+                               resp.status_code, attempt, retries, wait)
+                await asyncio.sleep(wait)
+                delay *= 2
+                continue
+
+            if not resp.is_success:
+                raise EmbeddingError(
+                    f"Vertex AI Embed returned HTTP {resp.status_code}: {body_snippet(resp, 200)}"
                 )
 
-            return resp.json()
+            return orjson.loads(resp.content)
 
         raise EmbeddingError(
             f"Embed failed after {retries} attempts"
         ) from last_exc
+
+
+# ── Private helpers ────────────────────────────────────────────────────────
+
+def _single_payload(text: str, task_type: str, title: str = "") -> dict:
+    """Predict request body for one text."""
+    instance: dict[str, Any] = {"content": text, "task_type": task_type}
+    if title:
+        instance["title"] = title
+    return {"instances": [instance]}
+
+
+def _prediction_vector(pred: Any, dtype: np.dtype) -> Vector | None:
+    """One batch prediction's vector, or None if it is malformed."""
+    try:
+        return np.asarray(pred["embeddings"]["values"], dtype=dtype)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _single_vector(response_json: dict, dtype: np.dtype) -> Vector:
+    """Extract the one embedding from a single-text Predict response."""
+    try:
+        values = response_json["predictions"][0]["embeddings"]["values"]
+    except (KeyError, IndexError, TypeError) as exc:
+        raise EmbeddingError(
+            f"Unexpected embed response shape: {list(response_json.keys())}"
+        ) from exc
+    return np.asarray(values, dtype=dtype)
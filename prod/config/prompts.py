@@ -13,6 +13,13 @@ To support a different output schema: change RERANK_OUTPUT_SCHEMA.
 """
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from prod.domain.models import Candidate
+
 # ── Re-ranking system prompt ───────────────────────────────────────────────────
 RERANK_SYSTEM_BASE = """\
 You are an expert ANZSIC (Australian and New Zealand Standard Industrial \
@@ -65,6 +72,7 @@ All 5,236 codes are listed below as:  CODE: description
 Use this reference to find the best match for the user's input.
 {divider}
 """
+_CSV_HEADER = CSV_REFERENCE_HEADER.format(divider="─" * 77)
 
 # ── User message template ──────────────────────────────────────────────────────
 RERANK_USER_TEMPLATE = """\
@@ -77,21 +85,38 @@ Return the top {top_k} matches as a JSON array.\
 """
 
 # ── Candidate block line template ──────────────────────────────────────────────
+# Fields are read straight off the Candidate model ({c.<field>}).
 CANDIDATE_BLOCK_TEMPLATE = """\
-[{idx}] Code: {anzsic_code}
-    Occupation: {anzsic_desc}
-    Class: {class_desc}
-    Group: {group_desc}
-    Subdivision: {subdivision_desc}
-    Division: {division_desc}
+[{idx}] Code: {c.anzsic_code}
+    Occupation: {c.anzsic_desc}
+    Class: {c.class_desc}
+    Group: {c.group_desc}
+    Subdivision: {c.subdivision_desc}
+    Division: {c.division_desc}
 """
 
 CANDIDATE_EXCLUSION_LINE = "    Not included: {exclusions}\n"
 
+# ── Batched user message (several queries in one LLM turn) ─────────────────────
+BATCH_USER_HEADER = """\
+The {n} requests below are independent.  Answer each one exactly as if it \
+had been sent on its own.
+Return ONE JSON object of the form {{"answers": [<answer 1>, ..., <answer {n}>]}} \
+with exactly {n} elements, in request order; each element is the JSON array \
+that request asks for.
+"""
+
+BATCH_QUERY_DELIMITER = "---QUERY {idx}---"
 
+
+@lru_cache(maxsize=4)
 def build_system_prompt(include_reference: bool, csv_reference: str) -> str:
     """Assembles the Gemini system prompt, optionally appending the full CSV.
 
+    Memoised: the reranker passes the same csv_reference object on every
+    call, so after the first call this is a dict hit (str caches its hash)
+    instead of a multi-hundred-KB concatenation per LLM turn.
+
     Args:
         include_reference: When True, appends all 5,236 ANZSIC codes as a
                            fallback lookup table for low-confidence queries.
@@ -103,45 +128,32 @@ def build_system_prompt(include_reference: bool, csv_reference: str) -> str:
     if not include_reference or not csv_reference:
         return RERANK_SYSTEM_BASE
 
-    divider = "─" * 77
-    header = CSV_REFERENCE_HEADER.format(divider=divider)
-    return RERANK_SYSTEM_BASE + header + csv_reference
+    return RERANK_SYSTEM_BASE + _CSV_HEADER + csv_reference
 
 
-def build_candidate_block(candidates: list[dict]) -> str:
+def build_candidate_block(candidates: Sequence[Candidate]) -> str:
     """Renders the numbered candidate list for the LLM user message.
 
     Args:
-        candidates: List of candidate dicts (from Candidate.model_dump()).
+        candidates: Candidate models, rendered in order.
 
     Returns:
         Formatted multi-line string.
     """
-    lines = []
-    for i, c in enumerate(candidates, 1):
-        block = CANDIDATE_BLOCK_TEMPLATE.format(
-            idx=i,
-            anzsic_code=c.get("anzsic_code", ""),
-            anzsic_desc=c.get("anzsic_desc", ""),
-            class_desc=c.get("class_desc", ""),
-            group_desc=c.get("group_desc", ""),
-            subdivision_desc=c.get("subdivision_desc", ""),
-            division_desc=c.get("division_desc", ""),
-        )
-        if c.get("class_exclusions"):
-            block += CANDIDATE_EXCLUSION_LINE.format(
-                exclusions=c["class_exclusions"]
-            )
-        lines.append(block)
-    return "\n".join(lines)
-
-
-def build_user_message(query: str, candidates: list[dict], top_k: int) -> str:
+    return "\n".join(
+        CANDIDATE_BLOCK_TEMPLATE.format(idx=i, c=c)
+        + (CANDIDATE_EXCLUSION_LINE.format(exclusions=c.class_exclusions)
+           if c.class_exclusions else "")
+        for i, c in enumerate(candidates, 1)
+    )
+
+
+def build_user_message(query: str, candidates: Sequence[Candidate], top_k: int) -> str:
     """Assembles the user-turn message for the LLM.
 
     Args:
         query:      Raw input description from the user.
-        candidates: List of candidate dicts.
+        candidates: Candidate models from Stage 1.
         top_k:      Number of results to request from the LLM.
 
     Returns:
@@ -153,3 +165,18 @@ def build_user_message(query: str, candidates: list[dict], top_k: int) -> str:
         candidate_block=build_candidate_block(candidates),
         top_k=top_k,
     )
+
+
+def build_batch_user_message(user_messages: Sequence[str]) -> str:
+    """Packs several build_user_message() turns into one batched turn.
+
+    Args:
+        user_messages: Independent user messages, answered in order.
+
+    Returns:
+        Header plus each message under its ``---QUERY i---`` delimiter.
+    """
+    parts = [BATCH_USER_HEADER.format(n=len(user_messages))]
+    for i, message in enumerate(user_messages, 1):
+        parts.append(f"{BATCH_QUERY_DELIMITER.format(idx=i)}\n{message}")
+    return "\n\n".join(parts)
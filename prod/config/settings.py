@@ -41,7 +41,7 @@ def _env_float(key: str, default: float) -> float:
     return float(os.getenv(key, str(default)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Immutable application settings loaded from environment variables."""
 
@@ -87,6 +87,13 @@ class Settings:
             "/Users/s748779/gemini_local/google-cloud-sdk/bin/gcloud",
         )
     )
+    # Set GCP_AUTH_USE_GCLOUD=true to skip google-auth and always mint access
+    # tokens via the gcloud subprocess (e.g. when oauth2.googleapis.com is
+    # unreachable through the corporate proxy).
+    gcp_auth_use_gcloud: bool = field(
+        default_factory=lambda: _env("GCP_AUTH_USE_GCLOUD", "").lower()
+        in ("1", "true", "yes")
+    )
 
     # ── Network ────────────────────────────────────────────────────────────
     https_proxy: str = field(
@@ -97,6 +104,42 @@ class Settings:
     db_dsn: str = field(
         default_factory=lambda: _env("DB_DSN", "dbname=anzsic_db")
     )
+    # ThreadedConnectionPool bounds.  Keep db_pool_max × worker processes
+    # below PostgreSQL's max_connections.
+    db_pool_min: int = field(
+        default_factory=lambda: _env_int("DB_POOL_MIN", 2)
+    )
+    db_pool_max: int = field(
+        default_factory=lambda: _env_int("DB_POOL_MAX", 20)
+    )
+    # pgvector HNSW search breadth (hnsw.ef_search), set on every pooled
+    # connection.  pgvector's default of 40 caps recall below RETRIEVAL_N=50;
+    # keep it ≥ the largest retrieval_n.  Higher = better recall, slower.
+    hnsw_ef_search: int = field(
+        default_factory=lambda: _env_int("HNSW_EF_SEARCH", 100)
+    )
+    # Column type of anzsic_codes.embedding: "vector" | "halfvec" (pgvector
+    # ≥ 0.7).  Must match the database — see the halfvec migration in
+    # docs/decisions/002-pgvector-hybrid-search.md.
+    db_vector_type: str = field(
+        default_factory=lambda: _env("DB_VECTOR_TYPE", "vector")
+    )
+    # HNSW build parameters, used by PostgresDatabaseAdapter.rebuild_vector_index().
+    # Higher m / ef_construction = better recall, slower and larger build.
+    hnsw_m: int = field(
+        default_factory=lambda: _env_int("HNSW_M", 24)
+    )
+    hnsw_ef_construction: int = field(
+        default_factory=lambda: _env_int("HNSW_EF_CONSTRUCTION", 128)
+    )
+    # Session settings for the index build (keep the graph in memory, build
+    # in parallel).
+    db_maintenance_work_mem: str = field(
+        default_factory=lambda: _env("DB_MAINTENANCE_WORK_MEM", "2GB")
+    )
+    db_max_parallel_maintenance_workers: int = field(
+        default_factory=lambda: _env_int("DB_MAX_PARALLEL_MAINTENANCE_WORKERS", 7)
+    )
 
     # ── Retrieval pipeline ─────────────────────────────────────────────────
     rrf_k: int = field(
@@ -114,6 +157,66 @@ class Settings:
     embed_batch_size: int = field(
         default_factory=lambda: _env_int("EMBED_BATCH_SIZE", 50)
     )
+    # Max concurrent HTTP requests when embed_documents_batch spans several
+    # batches.  Keep ≤ the HTTP pool size in adapters/http_session.py (32).
+    embed_parallelism: int = field(
+        default_factory=lambda: _env_int("EMBED_PARALLELISM", 8)
+    )
+    # numpy dtype of returned embedding vectors: "float32" | "float16".
+    # float16 halves memory but needs a halfvec column to store losslessly.
+    embed_dtype: str = field(
+        default_factory=lambda: _env("EMBED_DTYPE", "float32")
+    )
+
+    # Serve the FastAPI app from AsyncClassifierPipeline (asyncpg + httpx
+    # async adapters, needs the "async" extra) instead of running the sync
+    # pipeline in worker threads.
+    async_pipeline: bool = field(
+        default_factory=lambda: _env("ASYNC_PIPELINE", "").lower()
+        in ("1", "true", "yes")
+    )
+
+    # ── Response caching ───────────────────────────────────────────────────
+    # Process-local LRU in front of the embedder and LLM (see
+    # adapters/response_cache.py).  Set ENABLE_RESPONSE_CACHE=false to disable.
+    enable_response_cache: bool = field(
+        default_factory=lambda: _env("ENABLE_RESPONSE_CACHE", "true").lower()
+        in ("1", "true", "yes")
+    )
+    embed_cache_size: int = field(
+        default_factory=lambda: _env_int("EMBED_CACHE_SIZE", 4096)
+    )
+    llm_cache_size: int = field(
+        default_factory=lambda: _env_int("LLM_CACHE_SIZE", 1024)
+    )
+    # Optional on-disk tier for query embeddings, behind the in-memory LRU
+    # (needs the "cache" extra).  Empty = disabled.
+    embed_disk_cache_dir: str = field(
+        default_factory=lambda: _env("EMBED_DISK_CACHE_DIR", "")
+    )
+    embed_disk_cache_size_mb: int = field(
+        default_factory=lambda: _env_int("EMBED_DISK_CACHE_SIZE_MB", 512)
+    )
+    # Whole-response cache in ClassifierPipeline (services/query_cache.py):
+    # exact LRU + optional semantic tier over query embeddings.  The semantic
+    # tier is lossy — a near-duplicate query gets the earlier query's results —
+    # so it is opt-in: set SEMANTIC_CACHE_SIZE > 0 to enable it.
+    query_cache_size: int = field(
+        default_factory=lambda: _env_int("QUERY_CACHE_SIZE", 1024)
+    )
+    semantic_cache_size: int = field(
+        default_factory=lambda: _env_int("SEMANTIC_CACHE_SIZE", 0)
+    )
+    semantic_cache_threshold: float = field(
+        default_factory=lambda: _env_float("SEMANTIC_CACHE_THRESHOLD", 0.97)
+    )
+    # Stage 2 output keyed by (query, candidate codes, top_k); TTL in seconds.
+    rerank_cache_size: int = field(
+        default_factory=lambda: _env_int("RERANK_CACHE_SIZE", 4096)
+    )
+    rerank_cache_ttl_s: float = field(
+        default_factory=lambda: _env_float("RERANK_CACHE_TTL_S", 7 * 24 * 3600)
+    )
 
     # ── Data paths ─────────────────────────────────────────────────────────
     master_csv_path: Path = field(
@@ -128,6 +231,15 @@ class Settings:
     llm_timeout: int   = field(default_factory=lambda: _env_int("LLM_TIMEOUT", 90))
     embed_retries: int = field(default_factory=lambda: _env_int("EMBED_RETRIES", 3))
 
+    # ── LLM batching ───────────────────────────────────────────────────────
+    # User messages packed into one LLM turn by generate_json_batch().
+    llm_batch_size: int = field(default_factory=lambda: _env_int("LLM_BATCH_SIZE", 8))
+    # Coalesce concurrent single-query re-ranks (API / Streamlit traffic) for
+    # this many milliseconds into one batched LLM call.  0 disables.
+    rerank_batch_window_ms: float = field(
+        default_factory=lambda: _env_float("RERANK_BATCH_WINDOW_MS", 0.0)
+    )
+
     # ── GENI LLM (internal IAG platform) ──────────────────────────────────────
     # Only required when LLM_PROVIDER=geni.
     geni_base_url: str = field(
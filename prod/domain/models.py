@@ -75,6 +75,16 @@ class Candidate(BaseModel):
     vector_rank: Optional[int] = None
     fts_rank:    Optional[int] = None
 
+    @classmethod
+    def from_db_row(cls, row: dict[str, Any], **fusion: Any) -> Candidate:
+        """Build a Candidate from a trusted database record without validation.
+
+        Args:
+            row:    Record dict keyed by column name (DatabasePort.fetch_by_codes).
+            fusion: RRF metadata fields (rrf_score, in_vector, …).
+        """
+        return cls.model_construct(**row, **fusion)
+
     @property
     def source_label(self) -> str:
         """Human-readable source badge: BOTH / VEC / FTS."""
@@ -7,8 +7,12 @@ Designed for multi-tenant, API-first usage (e.g. called by an upstream
 platform serving 30-40 concurrent users).
 
 Key design decisions:
-  - Blocking pipeline calls run via asyncio.to_thread() so the event loop
-    never stalls.  Uvicorn's default thread-pool handles concurrency.
+  - Requests go through ClassifierPipeline.classify_async(): blocking
+    adapter calls run on the default thread pool, so the event loop never
+    stalls, and the FTS query overlaps embedding + vector search.
+  - ASYNC_PIPELINE=true serves requests from AsyncClassifierPipeline
+    instead: every DB / HTTP call is awaited on the event loop, so one
+    worker interleaves many requests without a thread each.
   - The ClassifierPipeline singleton is shared across all requests in a
     process (stateless between calls — safe to share).
   - PostgresDatabaseAdapter uses ThreadedConnectionPool (see postgres_db.py)
@@ -39,8 +43,9 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 # Domain models — already Pydantic, serialise straight to JSON
+from prod.config.settings import get_settings
 from prod.domain.models import ClassifyResponse, SearchMode, SearchRequest
-from prod.services.container import get_pipeline
+from prod.services.container import build_async_pipeline, get_pipeline, shutdown
 
 logger = logging.getLogger(__name__)
 
@@ -64,16 +69,28 @@ app.add_middleware(
 )
 
 
-# ── Startup ────────────────────────────────────────────────────────────────
+# ── Startup / shutdown ─────────────────────────────────────────────────────
 
 @app.on_event("startup")
 async def _startup() -> None:
     """Warm up the pipeline singleton so the first real request is not slow."""
+    if get_settings().async_pipeline:
+        app.state.async_pipeline = build_async_pipeline()
+        return
     logger.info("Warming up ClassifierPipeline…")
     await asyncio.to_thread(get_pipeline)
     logger.info("ClassifierPipeline ready")
 
 
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    """Close pooled HTTP sessions, the DB pool and the GCP refresh timer."""
+    async_pipeline = getattr(app.state, "async_pipeline", None)
+    if async_pipeline is not None:
+        await async_pipeline.aclose()
+    await asyncio.to_thread(shutdown)
+
+
 # ── Request model ──────────────────────────────────────────────────────────
 
 class ClassifyRequest(BaseModel):
@@ -107,16 +124,13 @@ class ClassifyRequest(BaseModel):
 
 # ── Helpers ────────────────────────────────────────────────────────────────
 
-def _run_classify(body: ClassifyRequest) -> ClassifyResponse:
-    """Run the blocking pipeline synchronously (called via asyncio.to_thread)."""
-    pipeline = get_pipeline()
-    req = SearchRequest(
+def _search_request(body: ClassifyRequest) -> SearchRequest:
+    return SearchRequest(
         query=body.query,
         mode=SearchMode(body.mode),
         top_k=body.top_k,
         retrieval_n=body.retrieval_n,
     )
-    return pipeline.classify(req)
 
 
 # ── Endpoints ──────────────────────────────────────────────────────────────
@@ -125,7 +139,7 @@ def _run_classify(body: ClassifyRequest) -> ClassifyResponse:
 async def classify(body: ClassifyRequest) -> ClassifyResponse:
     """Classify an occupation or business description into ANZSIC codes.
 
-    Runs the blocking pipeline in a thread pool worker so many concurrent
+    Blocking adapter calls run on thread pool workers so many concurrent
     requests are handled without blocking the Uvicorn event loop.
 
     Returns the full ClassifyResponse domain object as JSON.
@@ -133,8 +147,12 @@ async def classify(body: ClassifyRequest) -> ClassifyResponse:
     t0 = time.perf_counter()
     logger.info("classify | query=%r mode=%s top_k=%d", body.query, body.mode, body.top_k)
 
+    async_pipeline = getattr(app.state, "async_pipeline", None)
     try:
-        response = await asyncio.to_thread(_run_classify, body)
+        if async_pipeline is not None:
+            response = await async_pipeline.classify(_search_request(body))
+        else:
+            response = await get_pipeline().classify_async(_search_request(body))
     except Exception as exc:
         logger.exception("classify failed for query=%r", body.query)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -158,6 +176,8 @@ async def health() -> JSONResponse:
 @app.get("/readiness")
 async def readiness() -> JSONResponse:
     """Readiness probe — verifies the pipeline singleton is initialised."""
+    if getattr(app.state, "async_pipeline", None) is not None:
+        return JSONResponse({"status": "ready"})
     try:
         await asyncio.to_thread(get_pipeline)
         return JSONResponse({"status": "ready"})
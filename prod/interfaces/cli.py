@@ -10,8 +10,8 @@ Usage:
   # Single query, fast mode, 3 results
   python -m prod.interfaces.cli --query "plumber" --mode fast --top-k 3
 
-  # Batch file (one query per line)
-  python -m prod.interfaces.cli --file queries.txt --top-k 5
+  # Batch file (one query per line), batched through 8 parallel workers
+  python -m prod.interfaces.cli --file queries.txt --top-k 5 --concurrency 8
 
   # JSON output
   python -m prod.interfaces.cli --query "nurse" --json
@@ -27,12 +27,17 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
-import json
 import logging
+import mmap
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from prod.domain.models import SearchMode, SearchRequest
+import orjson
+
+from prod.domain.models import ClassifyResponse, SearchMode, SearchRequest
 from prod.services.container import get_pipeline
 
 logger = logging.getLogger(__name__)
@@ -77,6 +82,12 @@ def _build_parser() -> argparse.ArgumentParser:
         dest="retrieval_n",
         help="Retrieval pool size (Stage 1 candidates). (default: 20)",
     )
+    p.add_argument(
+        "--concurrency", "-j",
+        type=int,
+        default=8,
+        help="Parallel workers for batch query chunks. (default: 8)",
+    )
     p.add_argument(
         "--json",
         action="store_true",
@@ -91,39 +102,70 @@ def _build_parser() -> argparse.ArgumentParser:
     return p
 
 
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """The parser, built once per process (parse_args() does not mutate it)."""
+    return _build_parser()
+
+
 # ── Formatting helpers ─────────────────────────────────────────────────────
 
 def _print_results_text(response) -> None:
-    """Pretty-print a ClassifyResponse to stdout."""
-    print(f"\n{'─' * 60}")
-    print(f"Query : {response.query}")
-    print(f"Mode  : {response.mode}  |  Candidates: {response.candidates_retrieved}")
-    print(f"{'─' * 60}")
+    """Pretty-print a ClassifyResponse to stdout (one write per response)."""
+    rule = "─" * 60
+    parts = [
+        f"\n{rule}",
+        f"Query : {response.query}",
+        f"Mode  : {response.mode}  |  Candidates: {response.candidates_retrieved}",
+        rule,
+    ]
     for r in response.results:
-        print(f"  #{r.rank}  [{r.anzsic_code}] {r.anzsic_desc}")
+        parts.append(f"  #{r.rank}  [{r.anzsic_code}] {r.anzsic_desc}")
         if r.class_desc:
-            print(f"       Class: {r.class_desc}")
+            parts.append(f"       Class: {r.class_desc}")
         if r.division_desc:
-            print(f"       Division: {r.division_desc}")
+            parts.append(f"       Division: {r.division_desc}")
         if r.reason:
-            print(f"       Reason: {r.reason}")
-    print()
+            parts.append(f"       Reason: {r.reason}")
+    parts.append("\n")
+    sys.stdout.write("\n".join(parts))
 
 
 def _print_results_json(response) -> None:
-    """Print a ClassifyResponse as JSON to stdout."""
-    print(json.dumps(response.to_dict(), indent=2, ensure_ascii=False))
+    """Print a ClassifyResponse as JSON to stdout (one write per response)."""
+    sys.stdout.write(
+        orjson.dumps(
+            response.to_dict(),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+        ).decode()
+    )
 
 
 # ── Main logic ─────────────────────────────────────────────────────────────
 
+# Files at least this large are scanned through mmap with _QUERY_LINE_RE.
+_MMAP_MIN_BYTES = 64 * 1024
+
+# A non-blank line not starting with "#", captured without surrounding
+# whitespace — the same lines the small-file path keeps.
+_QUERY_LINE_RE = re.compile(rb"(?m)^(?!#)[^\S\n]*(\S[^\n]*?)[^\S\n]*$")
+
+# Upper bound on queries per classify_many() call in batch mode.
+_BATCH_CHUNK = 32
+
+
 def _load_queries_from_file(path: Path) -> list[str]:
     """Read queries from a text file, one per line, skip blank/comment lines."""
     if not path.exists():
         print(f"ERROR: File not found: {path}", file=sys.stderr)
         sys.exit(2)
-    lines = path.read_text(encoding="utf-8").splitlines()
-    return [l.strip() for l in lines if l.strip() and not l.startswith("#")]
+    if path.stat().st_size < _MMAP_MIN_BYTES:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        return [l.strip() for l in lines if l.strip() and not l.startswith("#")]
+    # Large batch files: one C-level regex scan over the mapped bytes, no
+    # intermediate full-file str or line list.
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return [m.decode("utf-8") for m in _QUERY_LINE_RE.findall(mm)]
 
 
 def run(args: argparse.Namespace) -> int:
@@ -151,35 +193,93 @@ def run(args: argparse.Namespace) -> int:
         print(f"ERROR: Pipeline initialisation failed: {exc}", file=sys.stderr)
         return 1
 
-    exit_code = 0
-    for query in queries:
+    def request_for(query: str) -> SearchRequest:
+        return SearchRequest(
+            query=query,
+            mode=mode,
+            top_k=args.top_k,
+            retrieval_n=args.retrieval_n,
+        )
+
+    def classify_chunk(chunk: list[str]) -> list[ClassifyResponse | Exception]:
+        """classify_many() over one chunk; if the batch call fails, classify
+        each query on its own so one bad query only fails itself."""
         try:
-            request = SearchRequest(
-                query=query,
-                mode=mode,
-                top_k=args.top_k,
-                retrieval_n=args.retrieval_n,
-            )
-            response = pipeline.classify(request)
-            printer(response)
-        except Exception as exc:
-            logger.exception("Classification failed for query %r", query)
-            print(f"ERROR [{query!r}]: {exc}", file=sys.stderr)
-            exit_code = 1
-
+            return list(pipeline.classify_many([request_for(q) for q in chunk]))
+        except Exception:
+            logger.exception("Batch of %d failed — classifying one by one", len(chunk))
+        outcomes: list[ClassifyResponse | Exception] = []
+        for query in chunk:
+            try:
+                outcomes.append(pipeline.classify(request_for(query)))
+            except Exception as exc:
+                outcomes.append(exc)
+        return outcomes
+
+    # Duplicate lines are classified once and their outcome repeated at
+    # every position.
+    unique = list(dict.fromkeys(queries))
+    if not unique:
+        logger.warning("No queries found in %s", args.file)
+        return 0
+    if len(unique) < len(queries):
+        logger.info(
+            "Batch dedup | %d queries → %d unique (%.0f%% duplicates)",
+            len(queries), len(unique), 100 * (1 - len(unique) / len(queries)),
+        )
+
+    # The pipeline is I/O-bound and thread-safe.  Queries go out in chunks
+    # through classify_many(), which batches embedding, DB searches and LLM
+    # re-ranking per chunk, and chunks overlap their round trips across
+    # workers.  Results print in input order as each chunk completes.
+    workers = max(1, min(args.concurrency, len(unique)))
+    size = min(_BATCH_CHUNK, -(-len(unique) // workers))
+    chunks = [unique[i:i + size] for i in range(0, len(unique), size)]
+    outcomes: dict[str, ClassifyResponse | Exception] = {}
+    printed = exit_code = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(classify_chunk, chunk) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            outcomes.update(zip(chunk, future.result()))
+            while printed < len(queries) and queries[printed] in outcomes:
+                query = queries[printed]
+                outcome = outcomes[query]
+                printed += 1
+                if isinstance(outcome, Exception):
+                    logger.error("Classification failed for query %r: %s", query, outcome)
+                    print(f"ERROR [{query!r}]: {outcome}", file=sys.stderr)
+                    exit_code = 1
+                else:
+                    printer(outcome)
+
+    sys.stdout.flush()
     return exit_code
 
 
+# Shared by every handler _configure_logging() installs.
+_LOG_FORMATTER = logging.Formatter("%(asctime)s  %(levelname)-8s  %(name)s  %(message)s")
+
+
+def _configure_logging(level: int) -> None:
+    """Set the root level; add a stderr handler only if none is configured.
+
+    main() may be called repeatedly by wrappers, and an embedding
+    application may already own the root handlers.
+    """
+    root = logging.getLogger()
+    root.setLevel(level)
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(_LOG_FORMATTER)
+        root.addHandler(handler)
+
+
 def main() -> None:
     """Entry point for the anzsic-classify console script."""
-    parser = _build_parser()
+    parser = _get_parser()
     args = parser.parse_args()
 
-    log_level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s  %(levelname)-8s  %(name)s  %(message)s",
-    )
+    _configure_logging(logging.DEBUG if args.verbose else logging.INFO)
 
     if not args.query and not args.file:
         parser.print_help()
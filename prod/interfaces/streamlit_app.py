@@ -8,20 +8,26 @@ Run:
 
 Features:
   • Single query mode: text input → metrics → Cards / Table / JSON tabs
-  • Batch mode: .txt file upload → progress bar → aggregated results
+  • Batch mode: .txt file upload → concurrent classification → progress bar
+    → aggregated results
   • Fast mode (Stage 1 only) vs High Fidelity mode (Stage 1 + Gemini)
   • CSV download of results
   • Colour scheme: navy sidebar / light grey canvas (matches original app.py)
 """
 from __future__ import annotations
 
+import asyncio
+import csv
+import html
 import io
-import json
 import logging
 import sys
 import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import orjson
 import pandas as pd
 import streamlit as st
 
@@ -31,6 +37,7 @@ _REPO_ROOT = Path(__file__).parent.parent.parent
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
+from prod.config.settings import get_settings
 from prod.domain.models import SearchMode, SearchRequest
 from prod.services.container import get_pipeline
 
@@ -158,6 +165,20 @@ def _render_sidebar() -> dict:
             help="Number of Stage 1 candidates before re-ranking.",
         )
 
+        concurrency = 1
+        if search_type.startswith("Batch"):
+            # More parallel batches than DB_POOL_MAX connections would only
+            # queue on the pool.
+            max_concurrency = max(2, min(16, get_settings().db_pool_max))
+            concurrency = st.slider(
+                "Concurrency",
+                min_value=1,
+                max_value=max_concurrency,
+                value=min(8, max_concurrency),
+                key="concurrency",
+                help="Query batches classified in parallel.",
+            )
+
         st.markdown("---")
         st.markdown(
             "<small style='color:#8facc8'>ANZSIC Classifier v1.0<br>"
@@ -170,41 +191,76 @@ def _render_sidebar() -> dict:
         "mode": mode_enum,
         "top_k": int(top_k),
         "retrieval_n": retrieval_n,
+        "concurrency": concurrency,
     }
 
 
 # ── Result rendering ───────────────────────────────────────────────────────
 
-def _results_to_df(results) -> pd.DataFrame:
-    rows = []
-    for r in results:
-        rows.append(
-            {
-                "Rank": r.rank,
-                "ANZSIC Code": r.anzsic_code,
-                "ANZSIC Description": r.anzsic_desc,
-                "Class": r.class_desc or "",
-                "Division": r.division_desc or "",
-                "Reason": r.reason or "",
-            }
+def _result_rows(results) -> tuple[tuple, ...]:
+    """Hashable (rank, code, desc, class, division, reason) rows — the
+    st.cache_data key for the renderers below."""
+    return tuple(
+        (
+            r.rank,
+            r.anzsic_code,
+            r.anzsic_desc,
+            r.class_desc or "",
+            r.division_desc or "",
+            r.reason or "",
         )
-    return pd.DataFrame(rows)
+        for r in results
+    )
 
 
-def _render_cards(results) -> None:
-    for r in results:
-        rank_class = "rank-1" if r.rank == 1 else "rank-2" if r.rank == 2 else ""
-        st.markdown(
-            f"""
-            <div class="anzsic-card {rank_class}">
-                <div class="code">#{r.rank} &nbsp;·&nbsp; {r.anzsic_code}</div>
-                <div class="title">{r.anzsic_desc}</div>
-                <div class="meta">{r.class_desc or ''} &nbsp;·&nbsp; {r.division_desc or ''}</div>
-                <div class="reason">{r.reason or ''}</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+# Every widget interaction re-runs the script; the cached renderers return
+# the same DataFrame / CSV / card HTML for an unchanged result set.
+@st.cache_data(max_entries=64, show_spinner=False)
+def _results_table(rows: tuple[tuple, ...]) -> tuple[pd.DataFrame, bytes]:
+    """DataFrame and CSV bytes for a result set."""
+    df = pd.DataFrame(
+        rows,
+        columns=["Rank", "ANZSIC Code", "ANZSIC Description", "Class", "Division", "Reason"],
+    )
+    return df, df.to_csv(index=False).encode()
+
+
+_CARD_TPL = (
+    '<div class="anzsic-card {rank_class}">'
+    '<div class="code">#{rank} &nbsp;·&nbsp; {code}</div>'
+    '<div class="title">{desc}</div>'
+    '<div class="meta">{class_desc} &nbsp;·&nbsp; {division_desc}</div>'
+    '<div class="reason">{reason}</div>'
+    "</div>"
+)
+_RANK_CLASS = {1: "rank-1", 2: "rank-2"}
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cards_html(rows: tuple[tuple, ...]) -> str:
+    """All result cards as one HTML string (field text escaped)."""
+    return "".join(
+        _CARD_TPL.format(
+            rank_class=_RANK_CLASS.get(rank, ""),
+            rank=rank,
+            code=html.escape(code),
+            desc=html.escape(desc),
+            class_desc=html.escape(class_desc),
+            division_desc=html.escape(division_desc),
+            reason=html.escape(reason),
         )
+        for rank, code, desc, class_desc, division_desc, reason in rows
+    )
+
+
+def _render_cards(results) -> None:
+    # One st.markdown element for every card instead of one per result.
+    st.markdown(_cards_html(_result_rows(results)), unsafe_allow_html=True)
+
+
+def _json_text(obj) -> str:
+    """orjson-serialised JSON; st.json renders a str body without re-encoding it."""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
 
 
 def _render_response_tabs(response, query_label: str = "") -> None:
@@ -215,14 +271,13 @@ def _render_response_tabs(response, query_label: str = "") -> None:
         _render_cards(response.results)
 
     with tab_table:
-        df = _results_to_df(response.results)
+        df, csv_bytes = _results_table(_result_rows(response.results))
         st.dataframe(df, use_container_width=True)
-        csv_bytes = df.to_csv(index=False).encode()
         label = f"results_{query_label}.csv" if query_label else "results.csv"
         st.download_button("⬇ Download CSV", csv_bytes, file_name=label, mime="text/csv")
 
     with tab_json:
-        st.json(response.to_dict())
+        st.json(_json_text(response.to_dict()))
 
 
 # ── Single query mode ──────────────────────────────────────────────────────
@@ -248,10 +303,29 @@ def _run_single(options: dict) -> None:
         retrieval_n=options["retrieval_n"],
     )
 
-    with st.spinner("Classifying …"):
-        t0 = time.perf_counter()
-        response = pipeline.classify(request)
-        elapsed = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    if options["mode"] == SearchMode.HIGH_FIDELITY:
+        # Show Stage 1 (retrieval-only) cards as soon as they exist, then
+        # swap in the Gemini re-ranking when Stage 2 finishes.
+        with st.spinner("Retrieving candidates …"):
+            candidates = pipeline.retrieve_only(request)
+        placeholder = st.empty()
+        with placeholder.container():
+            preview = pipeline.rerank(
+                request.model_copy(update={"mode": SearchMode.FAST, "evaluate": False}),
+                candidates,
+            )
+            st.caption("Retrieval results — re-ranking with Gemini …")
+            _render_cards(preview.results)
+        with st.status("Re-ranking with Gemini …") as stage2:
+            response = pipeline.rerank(request, candidates)
+            stage2.update(label="Re-ranked with Gemini", state="complete")
+        placeholder.empty()
+    else:
+        with st.spinner("Classifying …"):
+            # FAST mode: overlap FTS with embedding + vector search.
+            response = asyncio.run(pipeline.classify_async(request))
+    elapsed = time.perf_counter() - t0
 
     # Metrics row
     c1, c2, c3, c4 = st.columns(4)
@@ -266,6 +340,20 @@ def _run_single(options: dict) -> None:
 
 # ── Batch mode ─────────────────────────────────────────────────────────────
 
+# Batch CSV columns — every row is a plain tuple in this order (error rows
+# fill only Query + Error) — and how many of the most recent rows the
+# on-page preview keeps.
+_BATCH_FIELDS = (
+    "Query", "Rank", "ANZSIC Code", "ANZSIC Description",
+    "Class", "Division", "Reason", "Error",
+)
+_BATCH_PREVIEW_ROWS = 200
+# Upper bound on queries per classify_many() call.
+_BATCH_CHUNK = 32
+# Minimum seconds between progress redraws (each one is a websocket message).
+_PROGRESS_INTERVAL_S = 0.05
+
+
 def _run_batch(options: dict) -> None:
     st.markdown("### 📂 Upload a query file")
     st.caption("Plain text file, one query per line. Lines starting with # are ignored.")
@@ -291,60 +379,127 @@ def _run_batch(options: dict) -> None:
         return
 
     pipeline = _load_pipeline()
-    all_rows: list[dict] = []
     progress = st.progress(0, text="Starting …")
     status = st.empty()
 
-    for idx, query in enumerate(queries):
-        status.markdown(f"**[{idx + 1}/{len(queries)}]** Classifying: *{query}*")
-        try:
-            request = SearchRequest(
-                query=query,
-                mode=options["mode"],
-                top_k=options["top_k"],
-                retrieval_n=options["retrieval_n"],
+    def request_for(query: str) -> SearchRequest:
+        return SearchRequest(
+            query=query,
+            mode=options["mode"],
+            top_k=options["top_k"],
+            retrieval_n=options["retrieval_n"],
+        )
+
+    def rows_for(query: str, response) -> list[tuple]:
+        return [
+            (
+                query,
+                r.rank,
+                r.anzsic_code,
+                r.anzsic_desc,
+                r.class_desc or "",
+                r.division_desc or "",
+                r.reason or "",
+                "",
             )
-            response = pipeline.classify(request)
-            for r in response.results:
-                all_rows.append(
-                    {
-                        "Query": query,
-                        "Rank": r.rank,
-                        "ANZSIC Code": r.anzsic_code,
-                        "ANZSIC Description": r.anzsic_desc,
-                        "Class": r.class_desc or "",
-                        "Division": r.division_desc or "",
-                        "Reason": r.reason or "",
-                    }
-                )
-        except Exception as exc:
-            logger.exception("Batch query failed: %r", query)
-            all_rows.append({"Query": query, "Error": str(exc)})
-
-        progress.progress((idx + 1) / len(queries), text=f"{idx + 1}/{len(queries)} complete")
+            for r in response.results
+        ]
+
+    def classify_chunk(chunk: list[str]) -> list[list[tuple]]:
+        """Worker: classify a chunk into result rows per query (no Streamlit
+        calls).  One classify_many() call; if it fails, each query is
+        classified on its own so a bad query only fails its own row."""
+        try:
+            responses = pipeline.classify_many([request_for(q) for q in chunk])
+            return [rows_for(q, r) for q, r in zip(chunk, responses)]
+        except Exception:
+            logger.exception("Batch of %d failed — classifying one by one", len(chunk))
+        out = []
+        for query in chunk:
+            try:
+                out.append(rows_for(query, pipeline.classify(request_for(query))))
+            except Exception as exc:
+                logger.exception("Batch query failed: %r", query)
+                out.append([(query, "", "", "", "", "", "", str(exc))])
+        return out
+
+    # Duplicate lines are classified once; their rows are repeated at every
+    # position and dropped after the last one is written.
+    unique = list(dict.fromkeys(queries))
+    remaining = Counter(queries)
+    if len(unique) < len(queries):
+        logger.info(
+            "Batch dedup | %d queries → %d unique (%.0f%% duplicates)",
+            len(queries), len(unique), 100 * (1 - len(unique) / len(queries)),
+        )
+
+    # Unique queries go out in chunks through classify_many(), which
+    # batches embedding, DB searches and LLM re-ranking per chunk; chunks
+    # run concurrently and the progress bar advances as they finish, redrawn
+    # at most every _PROGRESS_INTERVAL_S plus once at the end (UI updates
+    # stay on this script thread).  Rows stream straight into the CSV buffer
+    # in input order — out-of-order results wait in `pending` only until the
+    # queries before them finish — and the page keeps just the last
+    # _BATCH_PREVIEW_ROWS rows.
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(_BATCH_FIELDS)
+    preview: deque[tuple] = deque(maxlen=_BATCH_PREVIEW_ROWS)
+    pending: dict[str, list[tuple]] = {}
+    next_idx = n_rows = done = 0
+    last_update = 0.0
+
+    workers = max(1, min(options["concurrency"], len(unique)))
+    size = min(_BATCH_CHUNK, -(-len(unique) // workers))
+    chunks = [unique[i:i + size] for i in range(0, len(unique), size)]
+    status.markdown(f"Classifying {len(unique)} queries ({workers} batches at a time) …")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(classify_chunk, chunk): idx for idx, chunk in enumerate(chunks)}
+        for future in as_completed(futures):
+            idx = futures[future]
+            pending.update(zip(chunks[idx], future.result()))
+            while next_idx < len(queries) and queries[next_idx] in pending:
+                query = queries[next_idx]
+                rows = pending[query]
+                remaining[query] -= 1
+                if not remaining[query]:
+                    del pending[query]
+                writer.writerows(rows)
+                preview.extend(rows)
+                n_rows += len(rows)
+                next_idx += 1
+            done += len(chunks[idx])
+            now = time.monotonic()
+            if done < len(unique) and now - last_update < _PROGRESS_INTERVAL_S:
+                continue
+            last_update = now
+            status.markdown(f"**[{done}/{len(unique)}]** Classified: *{chunks[idx][-1]}*")
+            progress.progress(done / len(unique), text=f"{done}/{len(unique)} complete")
 
     status.markdown(f"✅ Batch complete — {len(queries)} queries processed.")
     progress.empty()
 
-    if not all_rows:
+    if not n_rows:
         st.error("No results generated.")
         return
 
-    df = pd.DataFrame(all_rows)
+    df = pd.DataFrame(list(preview), columns=_BATCH_FIELDS)
     st.markdown("---")
+    if n_rows > len(preview):
+        st.caption(f"Showing the last {len(preview)} of {n_rows} rows — download for all.")
     tab_table, tab_json = st.tabs(["📋 Table", "{ } JSON"])
 
     with tab_table:
         st.dataframe(df, use_container_width=True)
         st.download_button(
             "⬇ Download CSV",
-            df.to_csv(index=False).encode(),
+            buf.getvalue().encode(),
             file_name="batch_results.csv",
             mime="text/csv",
         )
 
     with tab_json:
-        st.json(df.to_dict(orient="records"))
+        st.json(_json_text(df.to_dict(orient="records")))
 
 
 # ── Main ───────────────────────────────────────────────────────────────────
@@ -8,6 +8,11 @@ The port deliberately separates the three database concerns:
   2. fts_search      — keyword / full-text search
   3. fetch_by_codes  — bulk record retrieval by primary key
 
+plus hybrid_search, which answers 1–3 in a single round trip for the
+latency-bound per-query path.  It still returns the two ranked lists
+separately, so fusion stays in Python.  vector_search_batch and
+fts_search_batch run 1 and 2 for many queries at once (batch mode).
+
 This separation means:
   • RRF fusion is done in pure Python (services/retriever.py), making it
     trivially unit-testable with no database dependency.
@@ -16,11 +21,20 @@ This separation means:
 Current implementation: PostgresDatabaseAdapter (psycopg2 + pgvector)
 To swap: write a new adapter (e.g. WeaviateDatabaseAdapter) implementing
 this Protocol and change ONE line in services/container.py.
+
+AsyncDatabasePort is the asyncio counterpart (AsyncPostgresDatabaseAdapter)
+used by AsyncClassifierPipeline, which runs the search legs concurrently
+instead of folding them into hybrid_search.
 """
 from __future__ import annotations
 
 from typing import Protocol, runtime_checkable
 
+from prod.ports.embedding_port import Vector
+
+# (anzsic_code, rank) pairs, rank 1 = best
+RankedHits = list[tuple[str, int]]
+
 
 @runtime_checkable
 class DatabasePort(Protocol):
@@ -28,7 +42,7 @@ class DatabasePort(Protocol):
 
     def vector_search(
         self,
-        embedding: list[float],
+        embedding: Vector,
         limit: int,
     ) -> list[tuple[str, int]]:
         """Run approximate nearest-neighbour search over stored embeddings.
@@ -80,3 +94,79 @@ class DatabasePort(Protocol):
             DatabaseError: On connection or query failure.
         """
         ...
+
+    def vector_search_batch(
+        self,
+        embeddings: list[Vector],
+        limit: int,
+    ) -> list[RankedHits]:
+        """Run vector_search for several query vectors in one call.
+
+        Returns:
+            One hit list per embedding, in input order.
+
+        Raises:
+            DatabaseError: On connection or query failure.
+        """
+        ...
+
+    def fts_search_batch(
+        self,
+        query_texts: list[str],
+        limit: int,
+    ) -> list[RankedHits]:
+        """Run fts_search for several queries in one call.
+
+        Returns:
+            One hit list per query, in input order (empty on no match or
+            failure, as fts_search).
+        """
+        ...
+
+    def hybrid_search(
+        self,
+        embedding: Vector | None,
+        query_text: str,
+        limit: int,
+        rrf_k: int | None = None,
+    ) -> tuple[RankedHits, RankedHits, dict[str, dict]]:
+        """Run vector + FTS search and fetch the union's records in one call.
+
+        Args:
+            embedding:  Query vector, or ``None`` to skip the vector leg.
+            query_text: Natural-language search string.
+            limit:      Maximum hits per search leg.
+            rrf_k:      If given, the backend may drop every code outside
+                        the top ``limit`` by RRF score (this k) before
+                        returning.  Kept codes keep their original ranks.
+
+        Returns:
+            ``(vec_hits, fts_hits, records)`` — the same values
+            vector_search, fts_search and fetch_by_codes would return, with
+            records covering every code in either hit list.
+
+        Raises:
+            DatabaseError: On connection or query failure.
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncDatabasePort(Protocol):
+    """Contract for an asyncio hybrid search database backend."""
+
+    async def vector_search(self, embedding: Vector, limit: int) -> RankedHits:
+        """Awaitable counterpart of DatabasePort.vector_search()."""
+        ...
+
+    async def fts_search(self, query_text: str, limit: int) -> RankedHits:
+        """Awaitable counterpart of DatabasePort.fts_search()."""
+        ...
+
+    async def fetch_by_codes(self, codes: list[str]) -> dict[str, dict]:
+        """Awaitable counterpart of DatabasePort.fetch_by_codes()."""
+        ...
+
+    async def aclose(self) -> None:
+        """Close the adapter's connection pool."""
+        ...
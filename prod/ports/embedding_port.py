@@ -8,11 +8,20 @@ is a valid EmbeddingPort — no inheritance required.
 
 Current implementation: VertexEmbeddingAdapter (Vertex AI text-embedding-005)
 To swap: write a new adapter implementing this Protocol and change container.py
+
+AsyncEmbeddingPort is the asyncio counterpart (AsyncVertexEmbeddingAdapter).
+It covers only the per-request query path; ingestion stays synchronous.
 """
 from __future__ import annotations
 
 from typing import Protocol, runtime_checkable
 
+import numpy as np
+import numpy.typing as npt
+
+# A 1-D embedding vector.  float32 by default; float16 when EMBED_DTYPE=float16.
+Vector = npt.NDArray[np.floating]
+
 
 @runtime_checkable
 class EmbeddingPort(Protocol):
@@ -28,7 +37,7 @@ class EmbeddingPort(Protocol):
         """Number of dimensions in the output vectors."""
         ...
 
-    def embed_query(self, text: str) -> list[float]:
+    def embed_query(self, text: str) -> Vector:
         """Embed a search query.
 
         Uses asymmetric retrieval task type (RETRIEVAL_QUERY) so the vector
@@ -38,14 +47,29 @@ class EmbeddingPort(Protocol):
             text: Natural-language query string.
 
         Returns:
-            Dense vector of floats.
+            Dense 1-D numpy vector.
 
         Raises:
             EmbeddingError: On API failure or empty response.
         """
         ...
 
-    def embed_document(self, text: str, title: str = "") -> list[float]:
+    def embed_queries_batch(self, texts: list[str]) -> list[Vector | None]:
+        """Embed multiple search queries in as few API calls as possible.
+
+        Same task type as embed_query(); the batch counterpart used by
+        HybridRetriever.retrieve_many().
+
+        Args:
+            texts: Natural-language query strings.
+
+        Returns:
+            List of vectors in the same order as input.
+            Individual elements may be None if that item failed.
+        """
+        ...
+
+    def embed_document(self, text: str, title: str = "") -> Vector:
         """Embed a document for storage.
 
         Uses RETRIEVAL_DOCUMENT task type.
@@ -55,7 +79,7 @@ class EmbeddingPort(Protocol):
             title: Optional document title (improves quality).
 
         Returns:
-            Dense vector of floats.
+            Dense 1-D numpy vector.
         """
         ...
 
@@ -63,7 +87,7 @@ class EmbeddingPort(Protocol):
         self,
         texts: list[str],
         titles: list[str] | None = None,
-    ) -> list[list[float] | None]:
+    ) -> list[Vector | None]:
         """Embed multiple documents in a single API call.
 
         Args:
@@ -75,3 +99,30 @@ class EmbeddingPort(Protocol):
             Individual elements may be None if that item failed.
         """
         ...
+
+
+@runtime_checkable
+class AsyncEmbeddingPort(Protocol):
+    """Contract for an asyncio query-embedding provider."""
+
+    @property
+    def model_name(self) -> str:
+        """Identifier of the underlying embedding model."""
+        ...
+
+    @property
+    def dimensions(self) -> int:
+        """Number of dimensions in the output vectors."""
+        ...
+
+    async def embed_query(self, text: str) -> Vector:
+        """Awaitable counterpart of EmbeddingPort.embed_query().
+
+        Raises:
+            EmbeddingError: On API failure or empty response.
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """Release pooled connections held by the adapter."""
+        ...
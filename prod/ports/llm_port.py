@@ -6,6 +6,9 @@ Abstract interface for LLM (large language model) providers.
 Current implementation: GeminiLLMAdapter (Vertex AI Gemini)
 To swap to OpenAI GPT: write OpenAILLMAdapter implementing this Protocol,
 then change ONE line in services/container.py.
+
+AsyncLLMPort is the asyncio counterpart (AsyncGeminiLLMAdapter,
+AsyncOpenAILLMAdapter) for orchestrators that gather many calls on one loop.
 """
 from __future__ import annotations
 
@@ -43,3 +46,51 @@ class LLMPort(Protocol):
             LLMError: On unrecoverable API failure.
         """
         ...
+
+    def generate_json_batch(
+        self,
+        system_prompt: str,
+        user_messages: list[str],
+    ) -> list[str | None]:
+        """generate_json() for many independent user messages at once.
+
+        Adapters may pack several messages into one model turn
+        (adapters/llm_batch.py); the result is the same as calling
+        generate_json() once per message.
+
+        Returns:
+            Raw JSON string (or None) per message, in input order.
+
+        Raises:
+            LLMError: On unrecoverable API failure.
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncLLMPort(Protocol):
+    """Contract for an asyncio JSON-generating LLM provider."""
+
+    @property
+    def model_name(self) -> str:
+        """Identifier of the underlying LLM."""
+        ...
+
+    async def generate_json(
+        self,
+        system_prompt: str,
+        user_message: str,
+    ) -> str | None:
+        """Awaitable counterpart of LLMPort.generate_json().
+
+        Returns:
+            Raw JSON string, or None if the call failed.
+
+        Raises:
+            LLMError: On unrecoverable API failure.
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """Release pooled connections held by the adapter."""
+        ...
@@ -14,9 +14,28 @@ SearchMode.FAST:
 SearchMode.HIGH_FIDELITY:
   Stage 1 + Stage 2. RRF candidates are re-ranked by the LLM, which adds a
   natural-language reason for each match. Recommended for production.
+
+retrieve_only() and rerank() expose the two stages separately, so a UI can
+render Stage 1 results while Stage 2 is still running.
+
+classify_many() is the batch form used by the CLI and Streamlit batch modes:
+Stage 1 is batched through retrieve_many() and Stage 2 through
+LLMReranker.rerank_many(), which packs several queries per LLM call.
+
+ClassifierPipeline.classify_async() awaits the same sync adapters from an
+event loop, overlapping FTS with embedding + vector search on worker threads.
+
+With a QueryCache injected (services/query_cache.py), classify() first
+checks the exact tier, then (if enabled) embeds once and checks the semantic
+tier; the same embedding is handed to the retriever on a miss.
+
+AsyncClassifierPipeline is the asyncio sibling for async servers: every
+I/O step is awaited, so one worker can interleave many requests, and
+Stage 1 overlaps its embed, vector and FTS round trips.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from datetime import datetime, timezone
@@ -29,9 +48,11 @@ from prod.domain.models import (
     SearchMode,
     SearchRequest,
 )
+from prod.ports.embedding_port import Vector
 from prod.services.evaluator import ANZSICEvaluator
-from prod.services.retriever import HybridRetriever
-from prod.services.reranker import LLMReranker
+from prod.services.query_cache import QueryCache, RerankCache
+from prod.services.reranker import AsyncLLMReranker, Reranker
+from prod.services.retriever import AsyncHybridRetriever, HybridRetriever
 
 logger = logging.getLogger(__name__)
 
@@ -44,22 +65,28 @@ class ClassifierPipeline:
 
     Args:
         retriever:  HybridRetriever (Stage 1).
-        reranker:   LLMReranker (Stage 2).
+        reranker:   LLMReranker or BatchingLLMReranker (Stage 2).
         evaluator:  ANZSICEvaluator (Stage 3, optional quality check).
         settings:   Shared application settings.
+        cache:      QueryCache for whole responses (optional).
+        rerank_cache: RerankCache for Stage 2 output (optional).
     """
 
     def __init__(
         self,
         retriever: HybridRetriever,
-        reranker: LLMReranker,
+        reranker: Reranker,
         settings: Settings,
         evaluator: ANZSICEvaluator | None = None,
+        cache: QueryCache | None = None,
+        rerank_cache: RerankCache | None = None,
     ) -> None:
         self._retriever = retriever
         self._reranker = reranker
         self._settings = settings
         self._evaluator = evaluator
+        self._cache = cache
+        self._rerank_cache = rerank_cache
 
     # ── Public API ─────────────────────────────────────────────────────────
 
@@ -81,76 +108,361 @@ class ClassifierPipeline:
         )
         _t_total = time.perf_counter()
 
-        # ── Stage 1: Hybrid Retrieval ──────────────────────────────────────
+        # ── Response cache: exact, then semantic on the query embedding ────
+        embedding = None
+        if self._cache is not None:
+            cached = self._cache.get(request)
+            if cached is None and self._cache.semantic_enabled:
+                embedding = self._retriever.embed_query(request.query)
+                cached = self._cache.get_similar(request, embedding)
+            if cached is not None:
+                logger.info(
+                    "⏱ [Classifier] stage=cache_hit elapsed=%.3fs",
+                    time.perf_counter() - _t_total,
+                )
+                return cached
+
+        _t1 = time.perf_counter()
+        candidates = self.retrieve_only(request, embedding=embedding)
+        _stage1_elapsed = time.perf_counter() - _t1
+        response = self.rerank(request, candidates)
+        _total_elapsed = time.perf_counter() - _t_total
+        logger.info(
+            "⏱ [Classifier] stage=total elapsed=%.3fs "
+            "stage1=%.3fs stage2=%.3fs mode=%s",
+            _total_elapsed,
+            _stage1_elapsed,
+            _total_elapsed - _stage1_elapsed,
+            request.mode.value,
+        )
+        if self._cache is not None:
+            self._cache.put(request, response, embedding)
+        return response
+
+    def retrieve_only(
+        self, request: SearchRequest, embedding: Vector | None = None
+    ) -> list[Candidate]:
+        """Stage 1 alone: hybrid retrieval of ``request.retrieval_n`` candidates.
+
+        With rerank() this lets a UI show retrieval results while Stage 2
+        is still running; classify() is the two called back to back.
+        """
         _t1 = time.perf_counter()
         candidates = self._retriever.retrieve(
             query=request.query,
             n=request.retrieval_n,
+            embedding=embedding,
         )
-        _stage1_elapsed = time.perf_counter() - _t1
         logger.info(
             "⏱ [Classifier] stage=1_retrieval elapsed=%.3fs candidates=%d",
-            _stage1_elapsed,
+            time.perf_counter() - _t1,
             len(candidates),
         )
+        return candidates
+
+    def rerank(
+        self, request: SearchRequest, candidates: list[Candidate]
+    ) -> ClassifyResponse:
+        """Stage 2 over retrieve_only() output, assembled into a response.
 
-        # ── Stage 2 (optional): LLM Re-ranking ────────────────────────────
+        HIGH_FIDELITY re-ranks with the LLM; FAST formats the top-k
+        candidates directly (no LLM call).
+        """
+        results = None
         if request.mode == SearchMode.HIGH_FIDELITY:
             _t2 = time.perf_counter()
-            results = self._reranker.rerank(
-                query=request.query,
-                candidates=candidates,
-                top_k=request.top_k,
-            )
-            _stage2_elapsed = time.perf_counter() - _t2
+            results = self._llm_rerank(request, candidates)
             logger.info(
                 "⏱ [Classifier] stage=2_llm_rerank elapsed=%.3fs results=%d",
-                _stage2_elapsed,
+                time.perf_counter() - _t2,
                 len(results),
             )
-            llm_model = self._reranker._llm.model_name
-        else:
+        return self._respond(request, candidates, results)
+
+    def classify_many(self, requests: list[SearchRequest]) -> list[ClassifyResponse]:
+        """classify() for a batch of requests, sharing round trips.
+
+        Stage 1 runs through HybridRetriever.retrieve_many() (one embed call
+        and one DB call per search leg for each distinct retrieval_n), and
+        Stage 2 for every HIGH_FIDELITY request through
+        LLMReranker.rerank_many(), which packs several queries per LLM call.
+        Both caches are consulted and filled as in classify(); the semantic
+        tier is skipped, since batch embeddings happen inside retrieve_many().
+
+        Returns:
+            One ClassifyResponse per request, in input order.
+        """
+        _t_total = time.perf_counter()
+        cached_responses: list[ClassifyResponse | None] = [
+            self._cache.get(r) if self._cache is not None else None for r in requests
+        ]
+        todo = [i for i, r in enumerate(cached_responses) if r is None]
+
+        # ── Stage 1: one retrieve_many() per retrieval_n ───────────────────
+        _t1 = time.perf_counter()
+        by_n: dict[int, list[int]] = {}
+        for i in todo:
+            by_n.setdefault(requests[i].retrieval_n, []).append(i)
+        candidates: dict[int, list[Candidate]] = {}
+        for n, idxs in by_n.items():
+            batch = self._retriever.retrieve_many([requests[i].query for i in idxs], n)
+            candidates.update(zip(idxs, batch))
+        _stage1_elapsed = time.perf_counter() - _t1
+
+        # ── Stage 2: HIGH_FIDELITY requests re-ranked together ─────────────
+        results: dict[int, list[ClassifyResult]] = {}
+        pending: list[int] = []
+        for i in todo:
+            request = requests[i]
+            if request.mode != SearchMode.HIGH_FIDELITY:
+                continue
+            cached = (
+                self._rerank_cache.get(request.query, candidates[i], request.top_k)
+                if self._rerank_cache is not None else None
+            )
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+        if pending:
+            reranked = self._reranker.rerank_many(
+                [(requests[i].query, candidates[i], requests[i].top_k) for i in pending]
+            )
+            for i, ranked in zip(pending, reranked):
+                results[i] = ranked
+                if self._rerank_cache is not None:
+                    self._rerank_cache.put(
+                        requests[i].query, candidates[i], requests[i].top_k, ranked
+                    )
+
+        fresh: dict[int, ClassifyResponse] = {}
+        for i in todo:
+            response = self._respond(requests[i], candidates[i], results.get(i))
+            if self._cache is not None:
+                self._cache.put(requests[i], response)
+            fresh[i] = response
+        responses = [
+            fresh[i] if hit is None else hit
+            for i, hit in enumerate(cached_responses)
+        ]
+
+        _total_elapsed = time.perf_counter() - _t_total
+        logger.info(
+            "⏱ [Classifier] stage=total_many elapsed=%.3fs stage1=%.3fs "
+            "stage2=%.3fs requests=%d cached=%d llm=%d",
+            _total_elapsed,
+            _stage1_elapsed,
+            _total_elapsed - _stage1_elapsed,
+            len(requests),
+            len(requests) - len(todo),
+            len(pending),
+        )
+        return responses
+
+    def _respond(
+        self,
+        request: SearchRequest,
+        candidates: list[Candidate],
+        results: list[ClassifyResult] | None,
+    ) -> ClassifyResponse:
+        """Assemble the response; ``results=None`` formats FAST results."""
+        if results is None:
             # FAST mode: convert top-k candidates directly to ClassifyResult
             results = [
                 _candidate_to_result(c, rank=i + 1)
                 for i, c in enumerate(candidates[: request.top_k])
             ]
-            _stage2_elapsed = 0.0
+            llm_model = ""
+        else:
+            llm_model = self._reranker.model_name
+
+        return _build_response(
+            request, candidates, results,
+            embed_model=self._retriever.embed_model,
+            llm_model=llm_model,
+            evaluator=self._evaluator,
+        )
+
+    def _llm_rerank(
+        self, request: SearchRequest, candidates: list[Candidate]
+    ) -> list[ClassifyResult]:
+        """LLMReranker.rerank() behind the optional RerankCache."""
+        if self._rerank_cache is not None:
+            cached = self._rerank_cache.get(request.query, candidates, request.top_k)
+            if cached is not None:
+                return cached
+        results = self._reranker.rerank(
+            query=request.query,
+            candidates=candidates,
+            top_k=request.top_k,
+        )
+        if self._rerank_cache is not None:
+            self._rerank_cache.put(request.query, candidates, request.top_k, results)
+        return results
+
+    async def classify_async(self, request: SearchRequest) -> ClassifyResponse:
+        """Awaitable classify() over the same sync adapters.
+
+        Stage 1 goes through HybridRetriever.aretrieve(), which overlaps the
+        FTS query with embedding + vector search on worker threads; Stage 2
+        runs on a worker thread.  The event loop is never blocked.  With a
+        semantic QueryCache tier the query is embedded once up front for the
+        lookup and that embedding is reused by aretrieve().
+        """
+        _t_total = time.perf_counter()
+        embedding = None
+        if self._cache is not None:
+            cached = self._cache.get(request)
+            if cached is None and self._cache.semantic_enabled:
+                embedding = await asyncio.to_thread(
+                    self._retriever.embed_query, request.query
+                )
+                cached = self._cache.get_similar(request, embedding)
+            if cached is not None:
+                return cached
+
+        candidates = await self._retriever.aretrieve(
+            query=request.query,
+            n=request.retrieval_n,
+            embedding=embedding,
+        )
+        _stage1_elapsed = time.perf_counter() - _t_total
+
+        results = None
+        if request.mode == SearchMode.HIGH_FIDELITY:
+            results = await asyncio.to_thread(self._llm_rerank, request, candidates)
+
+        logger.info(
+            "⏱ [Classifier] stage=total_async elapsed=%.3fs stage1=%.3fs mode=%s",
+            time.perf_counter() - _t_total,
+            _stage1_elapsed,
+            request.mode.value,
+        )
+        response = self._respond(request, candidates, results)
+        if self._cache is not None:
+            self._cache.put(request, response, embedding)
+        return response
+
+
+class AsyncClassifierPipeline:
+    """asyncio variant of ClassifierPipeline.
+
+    Built by services/container.py (build_async_pipeline) — one instance per
+    event loop; ``await aclose()`` it when the loop shuts down.
+
+    Args:
+        retriever:  AsyncHybridRetriever (Stage 1).
+        reranker:   AsyncLLMReranker (Stage 2).
+        evaluator:  ANZSICEvaluator (Stage 3, optional quality check).
+        settings:   Shared application settings.
+        resources:  Adapters to close in aclose().
+    """
+
+    def __init__(
+        self,
+        retriever: AsyncHybridRetriever,
+        reranker: AsyncLLMReranker,
+        settings: Settings,
+        evaluator: ANZSICEvaluator | None = None,
+        resources: tuple = (),
+    ) -> None:
+        self._retriever = retriever
+        self._reranker = reranker
+        self._settings = settings
+        self._evaluator = evaluator
+        self._resources = resources
+
+    # ── Public API ─────────────────────────────────────────────────────────
+
+    async def classify(self, request: SearchRequest) -> ClassifyResponse:
+        """Awaitable counterpart of ClassifierPipeline.classify()."""
+        logger.info(
+            "classify | query=%r mode=%s top_k=%d retrieval_n=%d",
+            request.query[:80],
+            request.mode.value,
+            request.top_k,
+            request.retrieval_n,
+        )
+        _t_total = time.perf_counter()
+
+        candidates = await self._retriever.retrieve(
+            query=request.query,
+            n=request.retrieval_n,
+        )
+        _stage1_elapsed = time.perf_counter() - _t_total
+
+        if request.mode == SearchMode.HIGH_FIDELITY:
+            results = await self._reranker.rerank(
+                query=request.query,
+                candidates=candidates,
+                top_k=request.top_k,
+            )
+            llm_model = self._reranker.model_name
+        else:
+            results = [
+                _candidate_to_result(c, rank=i + 1)
+                for i, c in enumerate(candidates[: request.top_k])
+            ]
             llm_model = ""
 
         _total_elapsed = time.perf_counter() - _t_total
         logger.info(
-            "⏱ [Classifier] stage=total elapsed=%.3fs "
+            "⏱ [AsyncClassifier] stage=total elapsed=%.3fs "
             "stage1=%.3fs stage2=%.3fs mode=%s",
             _total_elapsed,
             _stage1_elapsed,
-            _stage2_elapsed,
+            _total_elapsed - _stage1_elapsed,
             request.mode.value,
         )
 
-        return ClassifyResponse(
-            query=request.query,
-            mode=request.mode.value,
-            results=results,
-            candidates_retrieved=len(candidates),
-            generated_at=datetime.now(tz=timezone.utc),
-            embed_model=self._retriever._embedder.model_name,
+        return _build_response(
+            request, candidates, results,
+            embed_model=self._retriever.embed_model,
             llm_model=llm_model,
-            evaluation=(
-                self._evaluator.evaluate(
-                    query=request.query,
-                    results=results,
-                    candidates=candidates,
-                    top_k=request.top_k,
-                )
-                if self._evaluator and request.evaluate
-                else None
-            ),
+            evaluator=self._evaluator,
         )
 
+    async def aclose(self) -> None:
+        """Close every adapter this pipeline owns (newest first)."""
+        for resource in reversed(self._resources):
+            try:
+                await resource.aclose()
+            except Exception:
+                logger.exception("Error closing %s", type(resource).__name__)
+
 
 # ── Helper ─────────────────────────────────────────────────────────────────
 
+def _build_response(
+    request: SearchRequest,
+    candidates: list[Candidate],
+    results: list[ClassifyResult],
+    embed_model: str,
+    llm_model: str,
+    evaluator: ANZSICEvaluator | None,
+) -> ClassifyResponse:
+    """Assemble the ClassifyResponse (plus optional evaluation) for a run."""
+    return ClassifyResponse(
+        query=request.query,
+        mode=request.mode.value,
+        results=results,
+        candidates_retrieved=len(candidates),
+        generated_at=datetime.now(tz=timezone.utc),
+        embed_model=embed_model,
+        llm_model=llm_model,
+        evaluation=(
+            evaluator.evaluate(
+                query=request.query,
+                results=results,
+                candidates=candidates,
+                top_k=request.top_k,
+            )
+            if evaluator and request.evaluate
+            else None
+        ),
+    )
+
+
 def _candidate_to_result(candidate: Candidate, rank: int) -> ClassifyResult:
     """Convert a Stage 1 Candidate to a ClassifyResult for FAST mode."""
     return ClassifyResult(
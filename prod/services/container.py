@@ -18,37 +18,84 @@ changes are needed to switch between providers:
   LLM_PROVIDER=langchain_gemini            → GeminiLangChainLLMAdapter
 
 Mix-and-match is supported (e.g. OpenAI embeddings + Gemini LLM).
-GCPAuthManager is only instantiated when at least one GCP adapter is used.
+GCPAuthManager is only instantiated when at least one GCP adapter is used,
+and then exactly once — the Vertex embedder and the Gemini LLM share it, so
+the process holds one token and one refresh timer.
 
-Replace the database:
+ENABLE_RESPONSE_CACHE=true (default) wraps the embedder and LLM in the LRU
+decorators from adapters/response_cache.py (plus the on-disk query
+embedding tier when EMBED_DISK_CACHE_DIR is set).
+
+Replace the database (imported inside get_pipeline(), like every adapter,
+so importing this module stays cheap):
   - from prod.adapters.postgres_db import PostgresDatabaseAdapter
   + from prod.adapters.weaviate_db import WeaviateDatabaseAdapter
 
+Async pipeline:
+  build_async_pipeline() wires AsyncClassifierPipeline from the Async*
+  adapters (asyncpg, httpx.AsyncClient).  It is not a singleton — asyncio
+  clients bind to one event loop — so the caller owns the instance and
+  awaits its aclose().  Supported providers: EMBED_PROVIDER=vertex|none,
+  LLM_PROVIDER=vertex|openai.
+
+Shutdown:
+  shutdown() closes every adapter the pipeline opened (HTTP sessions, the
+  DB pool, the GCP refresh timer) and clears the singletons.  The FastAPI
+  app calls it from its shutdown hook; CLI runs rely on atexit.
+
 Thread safety:
-  @lru_cache(maxsize=1) makes get_pipeline() return the same instance across
-  calls.  For Streamlit this is fine (single process, one pipeline per run).
-  For FastAPI with multiple workers, each worker process gets its own pipeline
-  instance (one per process — correct behaviour for psycopg2 connections).
+  get_pipeline() returns the same instance across calls.  The first build
+  runs under a lock with a double check, so concurrent first requests
+  (FastAPI thread pool, several Streamlit sessions) never build two
+  pipelines.  For FastAPI with multiple workers, each worker process gets
+  its own pipeline instance (one per process — correct behaviour for
+  psycopg2 connections).
 """
 from __future__ import annotations
 
 import logging
+import threading
 from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from prod.adapters.postgres_db import PostgresDatabaseAdapter
-from prod.config.settings import get_settings
+from prod.config.settings import Settings, get_settings
 from prod.domain.exceptions import ConfigurationError
-from prod.ports.embedding_port import EmbeddingPort
-from prod.ports.llm_port import LLMPort
-from prod.services.classifier import ClassifierPipeline
+from prod.ports.embedding_port import AsyncEmbeddingPort, EmbeddingPort
+from prod.ports.llm_port import AsyncLLMPort, LLMPort
+from prod.services.classifier import AsyncClassifierPipeline, ClassifierPipeline
 from prod.services.evaluator import ANZSICEvaluator
-from prod.services.reranker import LLMReranker
-from prod.services.retriever import HybridRetriever
+from prod.services.query_cache import QueryCache, RerankCache
+from prod.services.reranker import (
+    AsyncLLMReranker,
+    BatchingLLMReranker,
+    LLMReranker,
+    Reranker,
+)
+from prod.services.retriever import AsyncHybridRetriever, HybridRetriever
+
+if TYPE_CHECKING:
+    from prod.adapters.gcp_auth import GCPAuthManager
 
 logger = logging.getLogger(__name__)
 
+# Everything get_pipeline() opened, in creation order; closed by shutdown().
+_RESOURCES: list[Any] = []
 
-def _build_embedder(settings) -> EmbeddingPort:
+# The get_pipeline() singleton; built and cleared under _PIPELINE_LOCK.
+_PIPELINE: ClassifierPipeline | None = None
+_PIPELINE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _gcp_auth(settings: Settings) -> GCPAuthManager:
+    """The process-wide GCPAuthManager, shared by every GCP adapter."""
+    from prod.adapters.gcp_auth import GCPAuthManager
+    auth = GCPAuthManager(settings)
+    _RESOURCES.append(auth)
+    return auth
+
+
+def _build_embedder(settings: Settings) -> EmbeddingPort:
     """Instantiate the correct EmbeddingPort adapter based on EMBED_PROVIDER."""
     provider = settings.embed_provider.lower()
     if provider == "openai":
@@ -56,11 +103,9 @@ def _build_embedder(settings) -> EmbeddingPort:
         logger.info("Embedding provider: OpenAI (%s)", settings.openai_embed_model)
         return OpenAIEmbeddingAdapter(settings)
     if provider == "vertex":
-        from prod.adapters.gcp_auth import GCPAuthManager
         from prod.adapters.vertex_embedding import VertexEmbeddingAdapter
         logger.info("Embedding provider: Vertex AI (%s)", settings.gcp_embed_model)
-        auth = GCPAuthManager(settings)
-        return VertexEmbeddingAdapter(auth, settings)
+        return VertexEmbeddingAdapter(_gcp_auth(settings), settings)
     if provider == "none":
         from prod.adapters.null_embedding import NullEmbeddingAdapter
         logger.warning(
@@ -73,7 +118,7 @@ def _build_embedder(settings) -> EmbeddingPort:
     )
 
 
-def _build_llm(settings) -> LLMPort:
+def _build_llm(settings: Settings) -> LLMPort:
     """Instantiate the correct LLMPort adapter based on LLM_PROVIDER."""
     provider = settings.llm_provider.lower()
     if provider == "openai":
@@ -81,11 +126,9 @@ def _build_llm(settings) -> LLMPort:
         logger.info("LLM provider: OpenAI (%s)", settings.openai_llm_model)
         return OpenAILLMAdapter(settings)
     if provider == "vertex":
-        from prod.adapters.gcp_auth import GCPAuthManager
         from prod.adapters.gemini_llm import GeminiLLMAdapter
         logger.info("LLM provider: Vertex AI Gemini (%s)", settings.gcp_gemini_model)
-        auth = GCPAuthManager(settings)
-        return GeminiLLMAdapter(auth, settings)
+        return GeminiLLMAdapter(_gcp_auth(settings), settings)
     if provider == "geni":
         from prod.adapters.geni_llm import GeniLLMAdapter
         logger.info(
@@ -95,24 +138,22 @@ def _build_llm(settings) -> LLMPort:
         )
         return GeniLLMAdapter(settings)
     if provider == "langchain_gemini":
-        from prod.adapters.gcp_auth import GCPAuthManager
         from prod.adapters.gemini_langchain_llm import GeminiLangChainLLMAdapter
         logger.info("LLM provider: LangChain ChatVertexAI (%s)", settings.gcp_gemini_model)
-        auth = GCPAuthManager(settings)
-        return GeminiLangChainLLMAdapter(settings, auth=auth)
+        return GeminiLangChainLLMAdapter(settings, auth=_gcp_auth(settings))
     raise ConfigurationError(
         f"Unknown LLM_PROVIDER '{settings.llm_provider}'. "
         "Valid values: 'vertex', 'openai', 'geni', 'langchain_gemini'."
     )
 
 
-@lru_cache(maxsize=1)
 def get_pipeline() -> ClassifierPipeline:
-    """Build and return the fully wired ClassifierPipeline singleton.
+    """Return the fully wired ClassifierPipeline singleton, building it once.
 
     Provider selection is read from ``EMBED_PROVIDER`` and ``LLM_PROVIDER``
-    environment variables.  The ``@lru_cache`` ensures this runs only once
-    per process lifetime.
+    environment variables.  The first call builds the pipeline under a lock
+    (double-checked), so concurrent first requests share one build instead
+    of each opening its own DB pool and GCP auth.
 
     Returns:
         Fully initialised ClassifierPipeline ready for use.
@@ -121,6 +162,18 @@ def get_pipeline() -> ClassifierPipeline:
         ConfigurationError: If an unknown provider name is given.
         AuthenticationError: If required API keys / credentials are missing.
     """
+    global _PIPELINE
+    pipeline = _PIPELINE
+    if pipeline is None:
+        with _PIPELINE_LOCK:
+            if _PIPELINE is None:
+                _PIPELINE = _build_pipeline()
+            pipeline = _PIPELINE
+    return pipeline
+
+
+def _build_pipeline() -> ClassifierPipeline:
+    """Wire adapters and services into a new ClassifierPipeline."""
     settings = get_settings()
     logger.info(
         "Building ClassifierPipeline | embed_provider=%s llm_provider=%s",
@@ -131,18 +184,51 @@ def get_pipeline() -> ClassifierPipeline:
     # ── Infrastructure adapters (provider-selected) ────────────────────────
     embedder = _build_embedder(settings)   # EmbeddingPort
     llm      = _build_llm(settings)        # LLMPort
+    _RESOURCES.extend((embedder, llm))
+    if settings.enable_response_cache:
+        from prod.adapters.response_cache import (
+            CachedEmbeddingAdapter,
+            CachedLLMAdapter,
+            DiskCachedEmbeddingAdapter,
+        )
+        if settings.embed_disk_cache_dir:
+            embedder = DiskCachedEmbeddingAdapter(
+                embedder, settings.embed_disk_cache_dir, settings.embed_disk_cache_size_mb
+            )
+            _RESOURCES.append(embedder)
+        embedder = CachedEmbeddingAdapter(embedder, settings.embed_cache_size)
+        llm      = CachedLLMAdapter(llm, settings.llm_cache_size)
+    from prod.adapters.postgres_db import PostgresDatabaseAdapter
     db       = PostgresDatabaseAdapter(settings)   # DatabasePort
+    _RESOURCES.append(db)
 
     # ── Services (receive only Port interfaces, not concrete types) ────────
     retriever = HybridRetriever(db=db, embedder=embedder, settings=settings)
-    reranker  = LLMReranker(llm=llm, settings=settings)
+    llm_reranker = LLMReranker(llm=llm, settings=settings)
+    reranker: Reranker = llm_reranker
+    if settings.rerank_batch_window_ms > 0:
+        batching = BatchingLLMReranker(
+            llm_reranker, settings.rerank_batch_window_ms / 1000, settings.llm_batch_size
+        )
+        _RESOURCES.append(batching)
+        reranker = batching
     evaluator = ANZSICEvaluator(settings.master_csv_path)
+    cache = rerank_cache = None
+    if settings.enable_response_cache:
+        cache = QueryCache(
+            settings.query_cache_size,
+            settings.semantic_cache_size,
+            settings.semantic_cache_threshold,
+        )
+        rerank_cache = RerankCache(settings.rerank_cache_size, settings.rerank_cache_ttl_s)
 
     pipeline = ClassifierPipeline(
         retriever=retriever,
         reranker=reranker,
         settings=settings,
         evaluator=evaluator,
+        cache=cache,
+        rerank_cache=rerank_cache,
     )
 
     logger.info(
@@ -151,3 +237,89 @@ def get_pipeline() -> ClassifierPipeline:
         llm.model_name,
     )
     return pipeline
+
+
+def _build_async_embedder(settings: Settings) -> AsyncEmbeddingPort | None:
+    """AsyncEmbeddingPort for EMBED_PROVIDER, or None for FTS-only."""
+    provider = settings.embed_provider.lower()
+    if provider == "vertex":
+        from prod.adapters.vertex_embedding import AsyncVertexEmbeddingAdapter
+        return AsyncVertexEmbeddingAdapter(_gcp_auth(settings), settings)
+    if provider == "none":
+        logger.warning("Async embedding provider: NONE — FTS-only retrieval")
+        return None
+    raise ConfigurationError(
+        f"EMBED_PROVIDER '{settings.embed_provider}' has no async adapter. "
+        "Valid values for the async pipeline: 'vertex', 'none'."
+    )
+
+
+def _build_async_llm(settings: Settings) -> AsyncLLMPort:
+    """AsyncLLMPort for LLM_PROVIDER."""
+    provider = settings.llm_provider.lower()
+    if provider == "vertex":
+        from prod.adapters.gemini_llm import AsyncGeminiLLMAdapter
+        return AsyncGeminiLLMAdapter(_gcp_auth(settings), settings)
+    if provider == "openai":
+        from prod.adapters.openai_llm import AsyncOpenAILLMAdapter
+        return AsyncOpenAILLMAdapter(settings)
+    raise ConfigurationError(
+        f"LLM_PROVIDER '{settings.llm_provider}' has no async adapter. "
+        "Valid values for the async pipeline: 'vertex', 'openai'."
+    )
+
+
+def build_async_pipeline() -> AsyncClassifierPipeline:
+    """Build an AsyncClassifierPipeline for the current event loop.
+
+    Not cached: the caller owns the pipeline and must ``await aclose()`` it.
+    Connections open lazily on first use, inside the caller's loop.
+
+    Raises:
+        ConfigurationError: If a provider has no async adapter.
+    """
+    from prod.adapters.postgres_db import AsyncPostgresDatabaseAdapter
+
+    settings = get_settings()
+    embedder = _build_async_embedder(settings)
+    llm = _build_async_llm(settings)
+    db = AsyncPostgresDatabaseAdapter(settings)
+
+    pipeline = AsyncClassifierPipeline(
+        retriever=AsyncHybridRetriever(db=db, embedder=embedder, settings=settings),
+        reranker=AsyncLLMReranker(llm=llm, settings=settings),
+        settings=settings,
+        evaluator=ANZSICEvaluator(settings.master_csv_path),
+        resources=tuple(r for r in (embedder, llm, db) if r is not None),
+    )
+    logger.info(
+        "AsyncClassifierPipeline ready | embedder=%s llm=%s",
+        embedder.model_name if embedder else "none",
+        llm.model_name,
+    )
+    return pipeline
+
+
+def shutdown() -> None:
+    """Close everything get_pipeline() opened and forget the singletons.
+
+    Adapters are closed newest-first (so the GCP refresh timer outlives the
+    adapters that use it), then any remaining shared HTTP sessions.  Safe to
+    call more than once; the next get_pipeline() rebuilds from scratch.
+    """
+    global _PIPELINE
+    from prod.adapters.http_session import close_shared_sessions
+
+    with _PIPELINE_LOCK:
+        _PIPELINE = None
+        while _RESOURCES:
+            resource = _RESOURCES.pop()
+            close = getattr(resource, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception:
+                logger.exception("Error closing %s", type(resource).__name__)
+        close_shared_sessions()
+        _gcp_auth.cache_clear()
@@ -0,0 +1,242 @@
+"""
+services/query_cache.py
+──────────────────────────────────────────────────────────────────────────────
+Two-tier cache of whole ClassifyResponse objects, consulted by
+ClassifierPipeline.classify() before any stage runs.
+
+  Exact tier    → LRU keyed by (normalised query, mode, top_k, retrieval_n,
+                  evaluate).  A hit costs one dict lookup — no embed, no DB,
+                  no LLM.
+  Semantic tier → the last N query embeddings (unit-normalised, one K×D
+                  matrix).  A miss on the exact tier embeds the query and
+                  compares it to every stored embedding with one mat-vec;
+                  cosine ≥ SEMANTIC_CACHE_THRESHOLD with the same request
+                  parameters returns that response.  FIFO eviction.
+                  Lossy: the hit carries the *earlier* query's candidates
+                  and results, only re-stamped with the new query text.
+
+Hits are returned as copies with the caller's query and a fresh
+generated_at, so cached objects are never mutated.
+
+RerankCache sits one level lower, in front of Stage 2 only: it keys the
+reranker's output on (normalised query, candidate code set, top_k), so
+query variants that retrieve the same candidates share one LLM call even
+when their responses differ.  FIFO eviction plus a TTL
+(RERANK_CACHE_TTL_S); empty results (LLM failure) are never stored.
+
+Wired in services/container.py when ENABLE_RESPONSE_CACHE is on.  The
+semantic tier is opt-in: SEMANTIC_CACHE_SIZE defaults to 0 (disabled).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import numpy as np
+
+from prod.domain.models import Candidate, ClassifyResponse, ClassifyResult, SearchRequest
+from prod.ports.embedding_port import Vector
+
+logger = logging.getLogger(__name__)
+
+# (normalised query, mode, top_k, retrieval_n, evaluate)
+_Key = tuple[str, str, int, int, bool]
+
+
+class QueryCache:
+    """Exact + semantic ClassifyResponse cache (thread-safe).
+
+    Args:
+        maxsize:            Exact-tier capacity (LRU).
+        semantic_size:      Semantic-tier capacity (FIFO); 0 disables it.
+        semantic_threshold: Minimum cosine similarity for a semantic hit.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        semantic_size: int = 0,
+        semantic_threshold: float = 0.97,
+    ) -> None:
+        self._maxsize = maxsize
+        self._exact: OrderedDict[_Key, ClassifyResponse] = OrderedDict()
+        self._semantic_size = semantic_size
+        self._threshold = semantic_threshold
+        self._sem_embs: np.ndarray | None = None          # (K, D) unit rows
+        self._sem_entries: list[tuple[tuple, ClassifyResponse]] = []
+        self._sem_next = 0                                # FIFO write slot
+        self._lock = threading.Lock()
+
+    @property
+    def semantic_enabled(self) -> bool:
+        """True when the semantic tier is on (SEMANTIC_CACHE_SIZE > 0)."""
+        return self._semantic_size > 0
+
+    # ── Exact tier ─────────────────────────────────────────────────────────
+
+    def get(self, request: SearchRequest) -> ClassifyResponse | None:
+        """Exact-tier lookup (no embedding needed)."""
+        key = _key(request)
+        with self._lock:
+            response = self._exact.get(key)
+            if response is None:
+                return None
+            self._exact.move_to_end(key)
+        logger.debug("Query cache hit (exact)")
+        return _refreshed(response, request)
+
+    # ── Semantic tier ──────────────────────────────────────────────────────
+
+    def get_similar(
+        self, request: SearchRequest, embedding: Vector
+    ) -> ClassifyResponse | None:
+        """Semantic-tier lookup against stored query embeddings.
+
+        Lossy by design: a hit returns another query's results, with only
+        ``query`` and ``generated_at`` rewritten.
+        """
+        unit = _unit(embedding)
+        if unit is None:
+            return None
+        params = _key(request)[1:]
+        with self._lock:
+            if self._sem_embs is None or self._sem_embs.shape[1] != unit.shape[0]:
+                return None
+            n = len(self._sem_entries)
+            sims = self._sem_embs[:n] @ unit
+            for idx in np.argsort(sims)[::-1]:
+                if sims[idx] < self._threshold:
+                    return None
+                entry_params, response = self._sem_entries[idx]
+                if entry_params == params:
+                    break
+            else:
+                return None
+        logger.debug("Query cache hit (semantic, cosine=%.4f)", sims[idx])
+        return _refreshed(response, request)
+
+    # ── Fill ───────────────────────────────────────────────────────────────
+
+    def put(
+        self,
+        request: SearchRequest,
+        response: ClassifyResponse,
+        embedding: Vector | None = None,
+    ) -> None:
+        """Store *response* in the exact tier and, given an embedding, the
+        semantic tier."""
+        key = _key(request)
+        unit = _unit(embedding) if self._semantic_size and embedding is not None else None
+        with self._lock:
+            self._exact[key] = response
+            self._exact.move_to_end(key)
+            if len(self._exact) > self._maxsize:
+                self._exact.popitem(last=False)
+            if unit is None:
+                return
+            if self._sem_embs is None or self._sem_embs.shape[1] != unit.shape[0]:
+                self._sem_embs = np.empty((self._semantic_size, unit.shape[0]), np.float32)
+                self._sem_entries = []
+                self._sem_next = 0
+            slot = self._sem_next
+            self._sem_embs[slot] = unit
+            entry = (key[1:], response)
+            if slot < len(self._sem_entries):
+                self._sem_entries[slot] = entry
+            else:
+                self._sem_entries.append(entry)
+            self._sem_next = (slot + 1) % self._semantic_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._exact.clear()
+            self._sem_embs = None
+            self._sem_entries = []
+            self._sem_next = 0
+
+
+class RerankCache:
+    """Stage 2 output keyed by (query, candidate codes, top_k) (thread-safe).
+
+    Args:
+        maxsize: Capacity (FIFO eviction).
+        ttl_s:   Seconds an entry stays valid.
+    """
+
+    def __init__(self, maxsize: int, ttl_s: float) -> None:
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._data: OrderedDict[tuple, tuple[float, list[ClassifyResult]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, query: str, candidates: list[Candidate], top_k: int
+    ) -> list[ClassifyResult] | None:
+        key = _rerank_key(query, candidates, top_k)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._data[key]
+                return None
+        logger.debug("Rerank cache hit")
+        return list(entry[1])
+
+    def put(
+        self,
+        query: str,
+        candidates: list[Candidate],
+        top_k: int,
+        results: list[ClassifyResult],
+    ) -> None:
+        if not results:
+            return
+        key = _rerank_key(query, candidates, top_k)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl_s, list(results))
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# ── Private helpers ────────────────────────────────────────────────────────
+
+def _rerank_key(query: str, candidates: list[Candidate], top_k: int) -> tuple:
+    return (
+        " ".join(query.split()).casefold(),
+        tuple(sorted(c.anzsic_code for c in candidates)),
+        top_k,
+    )
+
+
+def _key(request: SearchRequest) -> _Key:
+    return (
+        " ".join(request.query.split()).casefold(),
+        request.mode.value,
+        request.top_k,
+        request.retrieval_n,
+        request.evaluate,
+    )
+
+
+def _unit(embedding: Vector | None) -> np.ndarray | None:
+    """float32 unit vector, or None for an empty / zero embedding."""
+    if embedding is None or not len(embedding):
+        return None
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else None
+
+
+def _refreshed(response: ClassifyResponse, request: SearchRequest) -> ClassifyResponse:
+    """Copy of a cached response stamped for the current request."""
+    return response.model_copy(
+        update={"query": request.query, "generated_at": datetime.now(tz=timezone.utc)}
+    )
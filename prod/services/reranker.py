@@ -14,27 +14,178 @@ Fallback strategy:
   - Normal call first (no CSV reference) — keeps the prompt concise.
   - If results list is empty, log a warning and retry with CSV injected.
   - Two failed attempts → return empty list (caller handles gracefully).
+  - No CSV reference loaded → no retry (it would resend the same prompt).
 
-The CSV reference is loaded ONCE at construction time and reused across
-all classify calls (amortised startup cost).
+The CSV reference is parsed ONCE per process (memoised on path + mtime)
+and reused across all classify calls and reranker instances.
+
+rerank_many() runs Attempt 1 for a whole batch through
+LLMPort.generate_json_batch() (several queries per LLM call); only the
+queries that come back empty are retried one by one.
+
+BatchingLLMReranker does the same for single rerank() calls that arrive
+from concurrent requests within a few milliseconds of each other.
+
+AsyncLLMReranker runs the same two-attempt flow over an AsyncLLMPort.
+
+Literal lookups skip the LLM entirely: a query that IS an ANZSIC code
+present among the candidates (``S9419_03``), or a quoted phrase found in
+exactly one candidate's description, returns that candidate at rank 1,
+followed by the other candidates in Stage 1 order up to top_k.
 """
 from __future__ import annotations
 
-import json
-import logging
 import csv
+import io
+import logging
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
+from typing import Protocol
+
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from prod.config.prompts import build_system_prompt, build_user_message
 from prod.config.settings import Settings
 from prod.domain.exceptions import RerankError
 from prod.domain.models import Candidate, ClassifyResult
-from prod.ports.llm_port import LLMPort
+from prod.ports.llm_port import AsyncLLMPort, LLMPort
 
 logger = logging.getLogger(__name__)
 
+_RESULT_LIST_ADAPTER = TypeAdapter(list[ClassifyResult])
+
+# An exact ANZSIC code (S9419_03) — checked before any LLM call.
+_CODE_RE = re.compile(r"[A-Z]\d{4}(?:_\d{2})?")
+_QUOTE_PAIRS = frozenset({('"', '"'), ("'", "'"), ("\u201c", "\u201d")})
+
+
+class Reranker(Protocol):
+    """What ClassifierPipeline needs from Stage 2: LLMReranker, or
+    BatchingLLMReranker wrapping one."""
+
+    @property
+    def model_name(self) -> str:
+        """Identifier of the LLM doing the re-ranking."""
+        ...
+
+    def rerank(
+        self, query: str, candidates: list[Candidate], top_k: int
+    ) -> list[ClassifyResult]:
+        ...
+
+    def rerank_many(
+        self, items: list[tuple[str, list[Candidate], int]]
+    ) -> list[list[ClassifyResult]]:
+        ...
+
+
+class _RerankerBase:
+    """State and helpers shared by LLMReranker and AsyncLLMReranker: the CSV
+    reference, both system prompts, literal short-circuits and response
+    parsing."""
+
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        self._csv_reference = self._load_csv_reference()
+        self._system_prompts = _system_prompts(self._csv_reference)
+        self._stats_lock = threading.Lock()
+        self._reranks = self._literal_hits = 0
+
+    def _short_circuit(
+        self, query: str, candidates: list[Candidate], top_k: int
+    ) -> list[ClassifyResult]:
+        """_literal_match() plus the short-circuit rate log; [] = use the LLM.
+
+        Counts one rerank per call, so call it exactly once per query.
+        """
+        results = _literal_match(query, candidates, top_k)
+        with self._stats_lock:
+            self._reranks += 1
+            if results:
+                self._literal_hits += 1
+            hits, total = self._literal_hits, self._reranks
+        if results:
+            logger.info(
+                "Literal lookup %r → %s, LLM skipped (short-circuits=%d/%d)",
+                query, results[0].anzsic_code, hits, total,
+            )
+        return results
+
+    def _parse_response(self, raw: str | None, top_k: int) -> list[ClassifyResult]:
+        """Parse the LLM JSON response into ClassifyResult objects.
+
+        The model may return a bare JSON array or an object wrapping one.
+        Both formats are handled gracefully.
+
+        Returns:
+            List of ClassifyResult objects (empty on parse failure).
+        """
+        if not raw:
+            return []
+        try:
+            parsed = orjson.loads(raw)
+        except (orjson.JSONDecodeError, TypeError):
+            logger.error("LLMReranker: failed to parse JSON: %.200s", raw)
+            return []
+
+        # Unwrap if the model returned {"results": [...]} or similar
+        if isinstance(parsed, dict):
+            items = next(
+                (v for v in parsed.values() if isinstance(v, list)),
+                [],
+            )
+        elif isinstance(parsed, list):
+            items = parsed
+        else:
+            logger.error("LLMReranker: unexpected JSON type %s", type(parsed).__name__)
+            return []
+
+        items = items[:top_k]
+        try:
+            # One pydantic-core pass over the whole list (the common case).
+            return _RESULT_LIST_ADAPTER.validate_python(items)
+        except ValidationError:
+            pass
+
+        # At least one bad item — validate one by one so the rest survive.
+        results: list[ClassifyResult] = []
+        for item in items:
+            try:
+                results.append(ClassifyResult.model_validate(item))
+            except ValidationError as exc:
+                logger.warning("Skipping malformed result item %s: %s", item, exc)
+
+        return results
+
+    def _load_csv_reference(self) -> str:
+        """Load the ANZSIC master CSV as a compact CODE: description string.
 
-class LLMReranker:
+        Loads only anzsic_code + anzsic_desc to keep token count low.
+        Returns empty string if the file is missing (fallback is simply skipped).
+        Parsed once per (path, mtime) per process — see _read_csv_reference().
+        """
+        csv_path = Path(self._settings.master_csv_path)
+        try:
+            mtime_ns = csv_path.stat().st_mtime_ns
+        except OSError:
+            logger.warning(
+                "master_csv_path not found: %s — CSV fallback disabled", csv_path
+            )
+            return ""
+        try:
+            return _read_csv_reference(str(csv_path), mtime_ns)
+        except Exception as exc:
+            logger.error("Failed to load CSV reference: %s", exc)
+            return ""
+
+
+class LLMReranker(_RerankerBase):
     """Re-rank Stage 1 candidates using an LLM.
 
     Args:
@@ -44,8 +195,7 @@ class LLMReranker:
 
     def __init__(self, llm: LLMPort, settings: Settings) -> None:
         self._llm = llm
-        self._settings = settings
-        self._csv_reference = self._load_csv_reference()
+        super().__init__(settings)
         has_ref = bool(self._csv_reference)
         logger.debug(
             "LLMReranker init | model=%s csv_reference_loaded=%s",
@@ -53,6 +203,10 @@ class LLMReranker:
             has_ref,
         )
 
+    @property
+    def model_name(self) -> str:
+        return self._llm.model_name
+
     # ── Public API ─────────────────────────────────────────────────────────
 
     def rerank(
@@ -72,6 +226,55 @@ class LLMReranker:
             Ordered list of ClassifyResult objects (best match first).
             Empty list if both LLM attempts fail.
         """
+        literal = self._short_circuit(query, candidates, top_k)
+        if literal:
+            return literal
+        return self._rerank_with_llm(query, candidates, top_k)
+
+    def rerank_many(
+        self,
+        items: list[tuple[str, list[Candidate], int]],
+    ) -> list[list[ClassifyResult]]:
+        """rerank() for many (query, candidates, top_k) items at once.
+
+        Attempt 1 for every item with candidates goes through
+        LLMPort.generate_json_batch(), so the adapter can pack several
+        queries into one LLM call.  Items that come back empty take the
+        usual CSV-reference retry one by one; items without candidates take
+        rerank()'s CSV-only path.
+
+        Returns:
+            One result list per item, in input order.
+        """
+        results = [self._short_circuit(*item) for item in items]
+        batched = [
+            i for i, (_, candidates, _) in enumerate(items)
+            if candidates and not results[i]
+        ]
+        users = {i: build_user_message(*items[i]) for i in batched}
+        first = self._first_attempt_many([(users[i], items[i][2]) for i in batched])
+        for i, ranked in zip(batched, first):
+            results[i] = ranked
+
+        for i, (query, candidates, top_k) in enumerate(items):
+            if results[i]:
+                continue
+            if candidates:
+                results[i] = self._retry_with_reference(query, users[i], top_k)
+            else:
+                results[i] = self._rerank_with_llm(query, candidates, top_k)
+        return results
+
+    # ── Private helpers ────────────────────────────────────────────────────
+
+    def _rerank_with_llm(
+        self,
+        query: str,
+        candidates: list[Candidate],
+        top_k: int,
+    ) -> list[ClassifyResult]:
+        """rerank() past the literal short-circuit: Attempt 1, then the
+        CSV-reference retry."""
         if not candidates:
             if not self._csv_reference:
                 # No candidates AND no CSV reference — nothing to give the LLM.
@@ -90,18 +293,53 @@ class LLMReranker:
         # ── Attempt 1: candidates only (no full CSV) ─────────────────────
         # Keep the prompt concise — Stage 1 retrieval should already surface
         # the right codes.  Skipping the 5 000-row CSV reference shaves tokens
-        # and latency from every call.
-        results = self._call_llm(query, candidates, top_k, include_reference=False)
+        # and latency from every call.  The user message is rendered once and
+        # reused by the retry.
+        user = build_user_message(query, candidates, top_k)
+        results = self._call_llm(user, top_k, include_reference=False)
         if results:
             return results
+        return self._retry_with_reference(query, user, top_k)
+
+    def _first_attempt_many(
+        self,
+        prompts: list[tuple[str, int]],
+    ) -> list[list[ClassifyResult]]:
+        """Attempt 1 for several (user message, top_k) prompts in one
+        generate_json_batch() call."""
+        if not prompts:
+            return []
+        raws = self._llm.generate_json_batch(
+            self._system_prompts[False], [user for user, _ in prompts]
+        )
+        return [
+            self._parse_response(raw, top_k)
+            for raw, (_, top_k) in zip(raws, prompts)
+        ]
+
+    def _retry_with_reference(
+        self,
+        query: str,
+        user: str,
+        top_k: int,
+    ) -> list[ClassifyResult]:
+        """Attempt 2: retry WITH the full CSV reference.
 
-        # ── Attempt 2: retry WITH full CSV reference ───────────────────────
-        # Only reached when Attempt 1 returns nothing (rare edge case).
-        # The CSV gives the LLM broader context to find an obscure match.
+        Only reached when Attempt 1 returns nothing (rare edge case).
+        The CSV gives the LLM broader context to find an obscure match.
+        Without a loaded reference the retry would resend Attempt 1's
+        prompt, so it is skipped.
+        """
+        if not self._csv_reference:
+            logger.error(
+                "LLMReranker: empty results for %r and no CSV reference loaded "
+                "— skipping fallback", query
+            )
+            return []
         logger.warning(
             "LLM returned empty results for %r — retrying with CSV reference", query
         )
-        results = self._call_llm(query, candidates, top_k, include_reference=True)
+        results = self._call_llm(user, top_k, include_reference=True)
         if results:
             logger.info("Retry succeeded for %r", query)
             return results
@@ -109,95 +347,321 @@ class LLMReranker:
         logger.error("LLMReranker: both attempts failed for query %r", query)
         return []
 
-    # ── Private helpers ────────────────────────────────────────────────────
-
     def _call_llm(
         self,
-        query: str,
-        candidates: list[Candidate],
+        user: str,
         top_k: int,
         include_reference: bool,
     ) -> list[ClassifyResult]:
-        """Build prompt, call LLM, parse response."""
-        candidate_dicts = [c.model_dump() for c in candidates]
-        system = build_system_prompt(
-            include_reference=include_reference,
-            csv_reference=self._csv_reference,
-        )
-        user = build_user_message(query, candidate_dicts, top_k)
-
-        raw = self._llm.generate_json(system, user)
+        """Call the LLM with a rendered user message and parse the response."""
+        raw = self._llm.generate_json(self._system_prompts[include_reference], user)
         if not raw:
             return []
         return self._parse_response(raw, top_k)
 
-    def _parse_response(self, raw: str, top_k: int) -> list[ClassifyResult]:
-        """Parse the LLM JSON response into ClassifyResult objects.
 
-        The model may return a bare JSON array or an object wrapping one.
-        Both formats are handled gracefully.
 
-        Returns:
-            List of ClassifyResult objects (empty on parse failure).
-        """
-        if not raw:
-            return []
-        try:
-            parsed = json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
-            logger.error("LLMReranker: failed to parse JSON: %.200s", raw)
-            return []
 
-        # Unwrap if the model returned {"results": [...]} or similar
-        if isinstance(parsed, dict):
-            items = next(
-                (v for v in parsed.values() if isinstance(v, list)),
-                [],
+def _system_prompts(csv_reference: str) -> dict[bool, str]:
+    """Both system prompts, keyed by include_reference — built once per
+    reranker instead of per LLM call."""
+    return {
+        flag: build_system_prompt(include_reference=flag, csv_reference=csv_reference)
+        for flag in (False, True)
+    }
+
+
+def _literal_match(
+    query: str, candidates: list[Candidate], top_k: int
+) -> list[ClassifyResult]:
+    """The candidate a literal lookup names at rank 1, then the remaining
+    candidates in Stage 1 order up to *top_k*; or [].
+
+    Literal lookups are an exact ANZSIC code among the candidates, or a
+    quoted phrase contained in exactly one candidate's anzsic_desc or
+    class_desc (case-insensitive).  Anything else goes to the LLM.
+    """
+    text = query.strip()
+    if _CODE_RE.fullmatch(text.upper()):
+        code = text.upper()
+        matches = [c for c in candidates if c.anzsic_code == code]
+        reason = "Exact ANZSIC code match"
+    elif len(text) > 2 and (text[0], text[-1]) in _QUOTE_PAIRS:
+        phrase = text[1:-1].strip().casefold()
+        matches = [
+            c for c in candidates
+            if phrase and (
+                phrase in c.anzsic_desc.casefold()
+                or phrase in (c.class_desc or "").casefold()
             )
-        elif isinstance(parsed, list):
-            items = parsed
+        ]
+        reason = f"Only candidate containing the quoted phrase {text}"
+    else:
+        return []
+    if len(matches) != 1:
+        return []
+    match = matches[0]
+    results = [_literal_result(match, 1, reason, 1000)]
+    for candidate in candidates:
+        if len(results) >= top_k:
+            break
+        if candidate is not match:
+            results.append(_literal_result(
+                candidate, len(results) + 1, "Stage 1 order after the literal match", None
+            ))
+    return results
+
+
+def _literal_result(
+    candidate: Candidate, rank: int, reason: str, score: int | None
+) -> ClassifyResult:
+    """ClassifyResult for a short-circuited candidate, keeping its Stage 1
+    RRF and provenance fields."""
+    return ClassifyResult(
+        rank=rank,
+        anzsic_code=candidate.anzsic_code,
+        anzsic_desc=candidate.anzsic_desc,
+        class_desc=candidate.class_desc,
+        division_desc=candidate.division_desc,
+        reason=reason,
+        score=score,
+        group_desc=candidate.group_desc,
+        subdivision_desc=candidate.subdivision_desc,
+        class_exclusions=candidate.class_exclusions,
+        rrf_score=candidate.rrf_score,
+        in_vector=candidate.in_vector,
+        in_fts=candidate.in_fts,
+        vector_rank=candidate.vector_rank,
+        fts_rank=candidate.fts_rank,
+    )
+
+
+@lru_cache(maxsize=8)
+def _read_csv_reference(path: str, mtime_ns: int) -> str:
+    """Parse the CSV reference; memoised so every reranker built in this
+    process (tests, the async pipeline, alternate entry points) shares one
+    parse and one string.  *mtime_ns* is part of the key, so an edited file
+    is re-read.  The shared string also keeps build_system_prompt()'s memo
+    warm across rerankers.  Errors propagate, so a failed read is not cached.
+    """
+    buf = io.StringIO()
+    entries = 0
+    with open(path, encoding="utf-8", newline="") as fh:
+        # Plain csv.reader: two columns by index, no per-row dict.
+        reader = csv.reader(fh)
+        header = next(reader, [])
+        if "anzsic_code" in header and "anzsic_desc" in header:
+            i_code, i_desc = header.index("anzsic_code"), header.index("anzsic_desc")
+            width = max(i_code, i_desc)
+            for row in reader:
+                if len(row) <= width:
+                    continue
+                code, desc = row[i_code].strip(), row[i_desc].strip()
+                if code and desc:
+                    if entries:
+                        buf.write("\n")
+                    buf.write(code)
+                    buf.write(": ")
+                    buf.write(desc)
+                    entries += 1
+    reference = buf.getvalue()
+    logger.info(
+        "CSV reference loaded: %d entries (%d chars)",
+        entries,
+        len(reference),
+    )
+    return reference
+
+
+# (rendered user message, top_k) and the future its rerank() caller waits on.
+_Queued = tuple[tuple[str, int], Future[list[ClassifyResult]]]
+
+
+class BatchingLLMReranker:
+    """LLMReranker whose rerank() calls from concurrent threads share LLM calls.
+
+    Each rerank() with candidates is queued for a background worker.  The
+    worker takes the first waiting item, keeps collecting for up to
+    *window_s* seconds (or until *max_batch* items), then runs Attempt 1 for
+    the whole group through one generate_json_batch() call.  Empty results
+    take the usual CSV-reference retry on the caller's own thread, so one
+    slow retry never holds up the next window.  Calls without candidates
+    and rerank_many() go straight to the wrapped reranker.
+
+    Enabled in services/container.py when RERANK_BATCH_WINDOW_MS > 0.
+
+    Args:
+        reranker:  The LLMReranker to batch for.
+        window_s:  Coalescing window after the first queued item.
+        max_batch: Items per window (normally LLM_BATCH_SIZE).
+    """
+
+    def __init__(self, reranker: LLMReranker, window_s: float, max_batch: int) -> None:
+        self._reranker = reranker
+        self._llm = reranker._llm
+        self._window_s = window_s
+        self._max_batch = max(1, max_batch)
+        self._queue: queue.SimpleQueue[_Queued | None] = queue.SimpleQueue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(
+            target=self._run, name="rerank-batcher", daemon=True
+        )
+        self._worker.start()
+
+    # ── Public API ─────────────────────────────────────────────────────────
+
+    def rerank(
+        self,
+        query: str,
+        candidates: list[Candidate],
+        top_k: int,
+    ) -> list[ClassifyResult]:
+        """Same contract as LLMReranker.rerank()."""
+        if not candidates:
+            return self._reranker.rerank(query, candidates, top_k)
+        literal = self._reranker._short_circuit(query, candidates, top_k)
+        if literal:
+            return literal
+        # Rendered here, on the caller's thread, and reused by the retry.
+        user = build_user_message(query, candidates, top_k)
+        future: Future[list[ClassifyResult]] = Future()
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._queue.put(((user, top_k), future))
+        if closed:
+            results = self._reranker._first_attempt_many([(user, top_k)])[0]
         else:
-            logger.error("LLMReranker: unexpected JSON type %s", type(parsed).__name__)
-            return []
+            results = future.result()
+        if results:
+            return results
+        return self._reranker._retry_with_reference(query, user, top_k)
 
-        results: list[ClassifyResult] = []
-        for item in items[:top_k]:
-            try:
-                results.append(ClassifyResult(**item))
-            except Exception as exc:
-                logger.warning("Skipping malformed result item %s: %s", item, exc)
+    @property
+    def model_name(self) -> str:
+        return self._reranker.model_name
 
-        return results
+    def rerank_many(
+        self,
+        items: list[tuple[str, list[Candidate], int]],
+    ) -> list[list[ClassifyResult]]:
+        """Already batched — delegates to LLMReranker.rerank_many()."""
+        return self._reranker.rerank_many(items)
 
-    def _load_csv_reference(self) -> str:
-        """Load the ANZSIC master CSV as a compact CODE: description string.
+    def close(self) -> None:
+        """Answer everything already queued, then stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
 
-        Loads only anzsic_code + anzsic_desc to keep token count low.
-        Returns empty string if the file is missing (fallback is simply skipped).
-        """
-        csv_path = Path(self._settings.master_csv_path)
-        if not csv_path.exists():
-            logger.warning(
-                "master_csv_path not found: %s — CSV fallback disabled", csv_path
-            )
-            return ""
+    # ── Private helpers ────────────────────────────────────────────────────
 
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self._window_s
+            stop = False
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    queued = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if queued is None:
+                    stop = True
+                    break
+                batch.append(queued)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _flush(self, batch: list[_Queued]) -> None:
+        """One Attempt-1 LLM call for *batch*; resolve every future."""
+        _t = time.perf_counter()
         try:
-            lines: list[str] = []
-            with csv_path.open(encoding="utf-8") as fh:
-                reader = csv.DictReader(fh)
-                for row in reader:
-                    code = (row.get("anzsic_code") or "").strip()
-                    desc = (row.get("anzsic_desc") or "").strip()
-                    if code and desc:
-                        lines.append(f"{code}: {desc}")
-            reference = "\n".join(lines)
-            logger.info(
-                "CSV reference loaded: %d entries (%d chars)",
-                len(lines),
-                len(reference),
-            )
-            return reference
+            results = self._reranker._first_attempt_many([item for item, _ in batch])
         except Exception as exc:
-            logger.error("Failed to load CSV reference: %s", exc)
-            return ""
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), ranked in zip(batch, results):
+            future.set_result(ranked)
+        logger.info(
+            "⏱ [RerankBatcher] operation=flush elapsed=%.3fs batch=%d",
+            time.perf_counter() - _t,
+            len(batch),
+        )
+
+
+class AsyncLLMReranker(_RerankerBase):
+    """asyncio variant of LLMReranker over an AsyncLLMPort.
+
+    Args:
+        llm:      Any object satisfying AsyncLLMPort.
+        settings: Shared application settings.
+    """
+
+    def __init__(self, llm: AsyncLLMPort, settings: Settings) -> None:
+        self._llm = llm
+        super().__init__(settings)
+
+    @property
+    def model_name(self) -> str:
+        return self._llm.model_name
+
+    async def rerank(
+        self,
+        query: str,
+        candidates: list[Candidate],
+        top_k: int,
+    ) -> list[ClassifyResult]:
+        """Awaitable counterpart of LLMReranker.rerank()."""
+        literal = self._short_circuit(query, candidates, top_k)
+        if literal:
+            return literal
+        if not candidates and not self._csv_reference:
+            logger.warning(
+                "AsyncLLMReranker.rerank: no candidates and no CSV reference loaded "
+                "— cannot classify %r", query
+            )
+            return []
+
+        user = build_user_message(query, candidates, top_k)
+        for include_reference in (False, True):
+            results = await self._call_llm(user, top_k, include_reference)
+            if results:
+                return results
+            if not self._csv_reference:
+                logger.error(
+                    "AsyncLLMReranker: empty results for %r and no CSV reference "
+                    "loaded — skipping fallback", query
+                )
+                return []
+            if not include_reference:
+                logger.warning(
+                    "LLM returned empty results for %r — retrying with CSV reference", query
+                )
+
+        logger.error("AsyncLLMReranker: both attempts failed for query %r", query)
+        return []
+
+    async def _call_llm(
+        self,
+        user: str,
+        top_k: int,
+        include_reference: bool,
+    ) -> list[ClassifyResult]:
+        """Await the LLM with a rendered user message and parse the response."""
+        raw = await self._llm.generate_json(self._system_prompts[include_reference], user)
+        if not raw:
+            return []
+        return self._parse_response(raw, top_k)
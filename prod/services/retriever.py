@@ -5,8 +5,13 @@ Stage 1 of the classification pipeline: Hybrid Retrieval with RRF Fusion.
 
 Architecture:
   • Accepts any EmbeddingPort and DatabasePort via constructor injection.
-  • _compute_rrf() is a pure Python function — no I/O, easily unit-tested.
-  • HybridRetriever.retrieve() is the single public entry point.
+  • compute_rrf() / compute_rrf_topk() are pure Python functions — no I/O,
+    easily unit-tested.
+  • HybridRetriever.retrieve() is the single public entry point;
+    aretrieve() is its awaitable form for event-loop callers, and
+    retrieve_many() the batch form (one embedding call for N queries).
+  • AsyncHybridRetriever is the asyncio sibling: it awaits the FTS leg
+    concurrently with embedding + vector search.
 
 Reciprocal Rank Fusion formula:
   score(d) = Σᵢ  1 / (k + rankᵢ(d))
@@ -20,24 +25,35 @@ References:
 """
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 
 from prod.config.settings import Settings
 from prod.domain.exceptions import RetrievalError
 from prod.domain.models import Candidate
-from prod.ports.database_port import DatabasePort
-from prod.ports.embedding_port import EmbeddingPort
+from prod.ports.database_port import AsyncDatabasePort, DatabasePort
+from prod.ports.embedding_port import AsyncEmbeddingPort, EmbeddingPort, Vector
 
 logger = logging.getLogger(__name__)
 
+# Runs the FTS leg of retrieve_many() alongside its embed + vector legs.  Sized for
+# the batch interfaces' default concurrency; keep it within DB_POOL_MAX.
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hybrid-search")
+
 
 # ── RRF intermediate result ────────────────────────────────────────────────
 
-@dataclass(frozen=True)
-class _RRFResult:
-    """Holds the fused score and provenance for a single ANZSIC code."""
+class _RRFResult(NamedTuple):
+    """Holds the fused score and provenance for a single ANZSIC code.
+
+    A NamedTuple rather than a frozen dataclass: no per-instance __dict__
+    and no object.__setattr__ calls in __init__, so the one-per-code
+    construction in compute_rrf() is cheap.
+    """
 
     anzsic_code: str
     rrf_score: float
@@ -78,20 +94,36 @@ class HybridRetriever:
 
     # ── Public API ─────────────────────────────────────────────────────────
 
-    def retrieve(self, query: str, n: int) -> list[Candidate]:
+    @property
+    def embed_model(self) -> str:
+        """Name of the injected embedding model."""
+        return self._embedder.model_name
+
+    def embed_query(self, query: str) -> Vector:
+        """Embed *query* with the injected embedder.
+
+        For callers that need the embedding before retrieval (the semantic
+        response cache); pass it back via ``retrieve(..., embedding=...)``.
+        """
+        return self._embedder.embed_query(query)
+
+    def retrieve(
+        self, query: str, n: int, embedding: Vector | None = None
+    ) -> list[Candidate]:
         """Run hybrid retrieval for a query.
 
         Workflow:
           1. Embed query  (RETRIEVAL_QUERY task type)
-          2. Vector ANN search → top-n (code, rank) pairs
-          3. FTS search        → top-n (code, rank) pairs
-          4. RRF fusion        → merged, scored list (pure Python)
-          5. Fetch full DB records for top-n fused codes
-          6. Assemble and return Candidate objects
+          2. One DB round trip (hybrid_search):
+               vector ANN top-n + FTS top-n, pruned server-side to the
+               top-n codes by RRF, + their full records
+          3. RRF fusion        → merged, scored list (pure Python)
+          4. Assemble and return Candidate objects
 
         Args:
             query: Natural-language query.
             n:     Maximum number of candidates to return.
+            embedding: Precomputed query embedding (step 1 is skipped).
 
         Returns:
             List of Candidate objects sorted by RRF score descending.
@@ -102,48 +134,22 @@ class HybridRetriever:
         """
         logger.info("Retrieving candidates | query=%r n=%d", query[:80], n)
 
-        # ── 1. Embed (skipped when NullEmbeddingAdapter returns []) ───────────
-        query_vec = self._embedder.embed_query(query)
+        # ── 1. Embed (skipped when NullEmbeddingAdapter returns an empty vector)
+        query_vec = self._embedder.embed_query(query) if embedding is None else embedding
 
-        # ── 2 & 3. Search ───────────────────────────────────────────
+        # ── 2. Search + fetch in one round trip ───────────────────────────
         # Empty query_vec = EMBED_PROVIDER=none (NullEmbeddingAdapter).
         # Skip vector search entirely; RRF still works with vec_hits=[].
-        if query_vec:
-            vec_hits = self._db.vector_search(query_vec, limit=n)
-        else:
+        embedding = query_vec if len(query_vec) else None
+        if embedding is None:
             logger.info("Vector search skipped (no embedding) — FTS-only mode")
-            vec_hits = []
-        fts_hits = self._db.fts_search(query, limit=n)
+        vec_hits, fts_hits, records = self._db.hybrid_search(
+            embedding, query, limit=n, rrf_k=self._rrf_k
+        )
         logger.debug("vec_hits=%d  fts_hits=%d", len(vec_hits), len(fts_hits))
 
-        # ── 4. RRF fusion (pure Python — no I/O) ──────────────────────────
-        rrf_results = compute_rrf(vec_hits, fts_hits, k=self._rrf_k)
-        top_rrf = sorted(rrf_results, key=lambda r: r.rrf_score, reverse=True)[:n]
-
-        # ── 5. Fetch full records ──────────────────────────────────────────
-        top_codes = [r.anzsic_code for r in top_rrf]
-        records = self._db.fetch_by_codes(top_codes)
-
-        # ── 6. Assemble Candidate objects ──────────────────────────────────
-        candidates: list[Candidate] = []
-        for rrf in top_rrf:
-            rec = records.get(rrf.anzsic_code)
-            if rec is None:
-                logger.warning(
-                    "Code %s in RRF results but missing from fetch_by_codes",
-                    rrf.anzsic_code,
-                )
-                continue
-            candidates.append(
-                Candidate(
-                    **rec,
-                    rrf_score=round(rrf.rrf_score, 6),
-                    in_vector=rrf.in_vector,
-                    in_fts=rrf.in_fts,
-                    vector_rank=rrf.vector_rank,
-                    fts_rank=rrf.fts_rank,
-                )
-            )
+        # ── 3–4. RRF fusion + Candidate assembly (pure Python — no I/O) ──────
+        candidates = _fuse(vec_hits, fts_hits, records, n, self._rrf_k)
 
         top_score = candidates[0].rrf_score if candidates else 0.0
         logger.info(
@@ -153,6 +159,177 @@ class HybridRetriever:
         )
         return candidates
 
+    def retrieve_many(self, queries: list[str], n: int) -> list[list[Candidate]]:
+        """Run retrieve() for several queries in a fixed number of round trips.
+
+        Workflow:
+          1. fts_search_batch starts on _SEARCH_POOL (needs no embedding)
+          2. One embed_queries_batch() call (a query whose batch slot failed
+             is re-embedded alone, so errors surface as from retrieve())
+          3. vector_search_batch — one statement, then join the FTS leg
+          4. One fetch_by_codes() for the union of every query's hits
+          5. RRF fusion per query (pure Python)
+
+        Stage 1 costs max(embed + vector, FTS) + fetch.
+
+        Returns:
+            One candidate list per query, in input order.
+        """
+        if not queries:
+            return []
+        _t = time.perf_counter()
+        # FTS needs no embedding: it starts first on _SEARCH_POOL and runs
+        # while this thread embeds and runs the vector leg; each leg borrows
+        # its own pooled connection.
+        fts_future = _SEARCH_POOL.submit(self._db.fts_search_batch, queries, n)
+        embeddings = [
+            self._embedder.embed_query(q) if e is None else e
+            for q, e in zip(queries, self._embedder.embed_queries_batch(queries))
+        ]
+        _t_embed = time.perf_counter() - _t
+
+        # Empty vectors (EMBED_PROVIDER=none) skip the vector leg.
+        with_vec = [i for i, e in enumerate(embeddings) if len(e)]
+        vec_hits: list[list[tuple[str, int]]] = [[] for _ in queries]
+        if with_vec:
+            batch = self._db.vector_search_batch([embeddings[i] for i in with_vec], n)
+            for i, hits in zip(with_vec, batch):
+                vec_hits[i] = hits
+        fts_hits = fts_future.result()
+
+        codes = list(
+            dict.fromkeys(code for hits in vec_hits + fts_hits for code, _ in hits)
+        )
+        records = self._db.fetch_by_codes(codes)
+        results = [
+            _fuse(v, f, records, n, self._rrf_k) for v, f in zip(vec_hits, fts_hits)
+        ]
+        logger.info(
+            "⏱ [Retriever] batch elapsed=%.3fs embed=%.3fs queries=%d",
+            time.perf_counter() - _t,
+            _t_embed,
+            len(queries),
+        )
+        return results
+
+    async def aretrieve(
+        self, query: str, n: int, embedding: Vector | None = None
+    ) -> list[Candidate]:
+        """Awaitable retrieve() that overlaps the two search legs.
+
+        The sync ports run on the default executor: FTS starts at once and
+        runs while the query is embedded and the vector search executes, so
+        Stage 1 costs max(embed + vector, FTS) + fetch.  Same results as
+        retrieve(); a precomputed *embedding* skips the embed call.
+        """
+        logger.info("Retrieving candidates (async) | query=%r n=%d", query[:80], n)
+        loop = asyncio.get_running_loop()
+        fts_future = loop.run_in_executor(None, self._db.fts_search, query, n)
+
+        query_vec = embedding
+        if query_vec is None:
+            query_vec = await loop.run_in_executor(None, self._embedder.embed_query, query)
+        if len(query_vec):
+            vec_hits = await loop.run_in_executor(None, self._db.vector_search, query_vec, n)
+        else:
+            logger.info("Vector search skipped (no embedding) — FTS-only mode")
+            vec_hits = []
+        fts_hits = await fts_future
+
+        codes = list(dict.fromkeys(code for code, _ in vec_hits + fts_hits))
+        records = await loop.run_in_executor(None, self._db.fetch_by_codes, codes)
+        return _fuse(vec_hits, fts_hits, records, n, self._rrf_k)
+
+
+class AsyncHybridRetriever:
+    """asyncio variant of HybridRetriever over the Async* ports.
+
+    FTS needs no embedding, so it is started first and runs while the query
+    is embedded and the vector leg executes; Stage 1 latency becomes
+    max(embed + vector, FTS) + fetch instead of their sum.
+
+    Args:
+        db:       Any object satisfying AsyncDatabasePort.
+        embedder: Any object satisfying AsyncEmbeddingPort, or None for
+                  FTS-only retrieval (EMBED_PROVIDER=none).
+        settings: Shared application settings.
+    """
+
+    def __init__(
+        self,
+        db: AsyncDatabasePort,
+        embedder: AsyncEmbeddingPort | None,
+        settings: Settings,
+    ) -> None:
+        self._db = db
+        self._embedder = embedder
+        self._rrf_k = settings.rrf_k
+
+    @property
+    def embed_model(self) -> str:
+        return self._embedder.model_name if self._embedder else "none (FTS-only mode)"
+
+    async def retrieve(self, query: str, n: int) -> list[Candidate]:
+        """Awaitable counterpart of HybridRetriever.retrieve()."""
+        logger.info("Retrieving candidates | query=%r n=%d", query[:80], n)
+
+        fts_task = asyncio.create_task(self._db.fts_search(query, n))
+        try:
+            vec_hits = await self._vector_hits(query, n)
+        except BaseException:
+            fts_task.cancel()
+            raise
+        fts_hits = await fts_task
+        logger.debug("vec_hits=%d  fts_hits=%d", len(vec_hits), len(fts_hits))
+
+        codes = list(dict.fromkeys(code for code, _ in vec_hits + fts_hits))
+        records = await self._db.fetch_by_codes(codes)
+        candidates = _fuse(vec_hits, fts_hits, records, n, self._rrf_k)
+        logger.info("Retrieval complete | candidates=%d", len(candidates))
+        return candidates
+
+    async def _vector_hits(self, query: str, n: int) -> list[tuple[str, int]]:
+        """Embed the query, then run the vector leg (skipped when FTS-only)."""
+        if self._embedder is None:
+            return []
+        query_vec = await self._embedder.embed_query(query)
+        if not len(query_vec):
+            logger.info("Vector search skipped (no embedding) — FTS-only mode")
+            return []
+        return await self._db.vector_search(query_vec, n)
+
+
+def _fuse(
+    vec_hits: list[tuple[str, int]],
+    fts_hits: list[tuple[str, int]],
+    records: dict[str, dict],
+    n: int,
+    k: int,
+) -> list[Candidate]:
+    """RRF-fuse both hit lists and build the top-*n* Candidate objects."""
+    top_rrf = compute_rrf_topk(vec_hits, fts_hits, k, n)
+
+    candidates: list[Candidate] = []
+    for rrf in top_rrf:
+        rec = records.get(rrf.anzsic_code)
+        if rec is None:
+            logger.warning(
+                "Code %s in RRF results but missing from fetched records",
+                rrf.anzsic_code,
+            )
+            continue
+        candidates.append(
+            Candidate.from_db_row(
+                rec,
+                rrf_score=round(rrf.rrf_score, 6),
+                in_vector=rrf.in_vector,
+                in_fts=rrf.in_fts,
+                vector_rank=rrf.vector_rank,
+                fts_rank=rrf.fts_rank,
+            )
+        )
+    return candidates
+
 
 # ── Pure function: RRF fusion ──────────────────────────────────────────────
 # Extracted as a module-level function so unit tests can call it directly
@@ -186,27 +363,68 @@ def compute_rrf(
         >>> scores["A"] > scores["C"]   # A's combined score beats FTS-only C
         True
     """
-    vec_map: dict[str, int] = dict(vec_hits)
-    fts_map: dict[str, int] = dict(fts_hits)
-    all_codes = set(vec_map) | set(fts_map)
-
     results: list[_RRFResult] = []
-    for code in all_codes:
+    for code, (v_rank, f_rank) in _merge_ranks(vec_hits, fts_hits).items():
         score = 0.0
-        v_rank = vec_map.get(code)
-        f_rank = fts_map.get(code)
         if v_rank is not None:
             score += 1.0 / (k + v_rank)
         if f_rank is not None:
             score += 1.0 / (k + f_rank)
-        results.append(
-            _RRFResult(
-                anzsic_code=code,
-                rrf_score=score,
-                in_vector=v_rank is not None,
-                in_fts=f_rank is not None,
-                vector_rank=v_rank,
-                fts_rank=f_rank,
-            )
-        )
+        # Positional: keyword construction of a NamedTuple is much slower.
+        # (anzsic_code, rrf_score, in_vector, in_fts, vector_rank, fts_rank)
+        results.append(_RRFResult(
+            code, score, v_rank is not None, f_rank is not None, v_rank, f_rank
+        ))
     return results
+
+
+def _merge_ranks(
+    vec_hits: list[tuple[str, int]],
+    fts_hits: list[tuple[str, int]],
+) -> dict[str, list[int | None]]:
+    """Map each code to [vector_rank, fts_rank] (None where it is absent).
+
+    One dict filled in one pass per list: no per-system maps, no second
+    probe per code when scoring.  Insertion order is vector hits first,
+    then FTS-only hits.  A code listed twice by one leg keeps its best
+    (lowest) rank.
+    """
+    ranks: dict[str, list[int | None]] = {}
+    for code, rank in vec_hits:
+        entry = ranks.get(code)
+        if entry is None:
+            ranks[code] = [rank, None]
+        elif entry[0] is None or rank < entry[0]:
+            entry[0] = rank
+    for code, rank in fts_hits:
+        entry = ranks.get(code)
+        if entry is None:
+            ranks[code] = [None, rank]
+        elif entry[1] is None or rank < entry[1]:
+            entry[1] = rank
+    return ranks
+
+
+def compute_rrf_topk(
+    vec_hits: list[tuple[str, int]],
+    fts_hits: list[tuple[str, int]],
+    k: int = 60,
+    top_k: int = 50,
+) -> list[_RRFResult]:
+    """The *top_k* best compute_rrf() results, best first.
+
+    For callers that only keep the head of the fused list (the retriever,
+    the reranker's candidate window).  O(m log top_k) partial selection
+    instead of a full sort; equal scores are ordered by code, the same
+    tie-break as the anzsic_hybrid SQL pre-fusion in adapters/postgres_db.py,
+    so both paths keep the same top codes.
+
+    Examples:
+        >>> [r.anzsic_code for r in compute_rrf_topk([("A", 1), ("B", 2)], [("B", 1)], top_k=1)]
+        ['B']
+    """
+    return heapq.nsmallest(
+        top_k,
+        compute_rrf(vec_hits, fts_hits, k),
+        key=lambda r: (-r.rrf_score, r.anzsic_code),
+    )
@@ -8,25 +8,30 @@ NOT inherit from any base class.  pytest uses them to test service logic
 without any real GCP or database connections.
 
 Fixture hierarchy:
+  settings / reranker_settings → session-scoped, immutable
   mock_embedder  → implements EmbeddingPort (deterministic fake vectors)
   mock_llm       → implements LLMPort (returns pre-baked JSON)
   mock_db        → implements DatabasePort (in-memory fixture data)
   mock_retriever → HybridRetriever wired with mock_embedder + mock_db
   mock_reranker  → LLMReranker wired with mock_llm
   pipeline       → ClassifierPipeline wired with both mocks
+  async_pipeline → AsyncClassifierPipeline wired with the async mocks
 """
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import json
 from typing import Any
 
+import numpy as np
 import pytest
 
 from prod.config.settings import Settings
 from prod.domain.models import SearchMode, SearchRequest
-from prod.services.classifier import ClassifierPipeline
-from prod.services.reranker import LLMReranker
-from prod.services.retriever import HybridRetriever
+from prod.services.classifier import AsyncClassifierPipeline, ClassifierPipeline
+from prod.services.reranker import AsyncLLMReranker, LLMReranker
+from prod.services.retriever import AsyncHybridRetriever, HybridRetriever
 
 
 # ── Settings fixture ───────────────────────────────────────────────────────
@@ -50,6 +55,17 @@ def settings() -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def reranker_settings(settings, tmp_path_factory) -> Settings:
+    """*settings* pointing at a non-existent CSV, so rerankers do no file I/O.
+
+    Built once per session.  The mock adapters below stay function-scoped
+    on purpose: tests patch their methods (MagicMock wraps, side effects).
+    """
+    missing = tmp_path_factory.mktemp("reranker") / "nonexistent.csv"
+    return dataclasses.replace(settings, master_csv_path=missing)
+
+
 # ── Mock adapters ──────────────────────────────────────────────────────────
 
 class MockEmbeddingAdapter:
@@ -58,17 +74,20 @@ class MockEmbeddingAdapter:
     model_name = "mock-embedding"
     dimensions = 8
 
-    def embed_query(self, text: str) -> list[float]:
-        return [0.1, 0.2, 0.3, 0.4, 0.1, 0.2, 0.3, 0.4]
+    def embed_query(self, text: str) -> np.ndarray:
+        return np.array([0.1, 0.2, 0.3, 0.4, 0.1, 0.2, 0.3, 0.4], dtype=np.float32)
+
+    def embed_queries_batch(self, texts: list[str]) -> list[np.ndarray | None]:
+        return [self.embed_query(t) for t in texts]
 
-    def embed_document(self, text: str, title: str = "") -> list[float]:
-        return [0.2, 0.1, 0.4, 0.3, 0.2, 0.1, 0.4, 0.3]
+    def embed_document(self, text: str, title: str = "") -> np.ndarray:
+        return np.array([0.2, 0.1, 0.4, 0.3, 0.2, 0.1, 0.4, 0.3], dtype=np.float32)
 
     def embed_documents_batch(
         self,
         texts: list[str],
         titles: list[str] | None = None,
-    ) -> list[list[float] | None]:
+    ) -> list[np.ndarray | None]:
         return [self.embed_document(t) for t in texts]
 
 
@@ -135,6 +154,28 @@ class MockDatabaseAdapter:
     def fetch_by_codes(self, codes: list[str]) -> dict[str, dict]:
         return {c: _DB_RECORDS[c] for c in codes if c in _DB_RECORDS}
 
+    def vector_search_batch(
+        self, embeddings: list[list[float]], limit: int
+    ) -> list[list[tuple[str, int]]]:
+        return [self.vector_search(e, limit) for e in embeddings]
+
+    def fts_search_batch(
+        self, query_texts: list[str], limit: int
+    ) -> list[list[tuple[str, int]]]:
+        return [self.fts_search(q, limit) for q in query_texts]
+
+    def hybrid_search(
+        self,
+        embedding: list[float] | None,
+        query_text: str,
+        limit: int,
+        rrf_k: int | None = None,
+    ) -> tuple[list[tuple[str, int]], list[tuple[str, int]], dict[str, dict]]:
+        vec_hits = self.vector_search(embedding, limit) if embedding is not None else []
+        fts_hits = self.fts_search(query_text, limit)
+        codes = [c for c, _ in vec_hits + fts_hits]
+        return vec_hits, fts_hits, self.fetch_by_codes(codes)
+
 
 class MockLLMAdapter:
     """Returns a pre-baked JSON re-rank response."""
@@ -166,6 +207,11 @@ class MockLLMAdapter:
     def generate_json(self, system_prompt: str, user_message: str) -> str | None:
         return self._RESPONSE
 
+    def generate_json_batch(
+        self, system_prompt: str, user_messages: list[str]
+    ) -> list[str | None]:
+        return [self.generate_json(system_prompt, m) for m in user_messages]
+
 
 class MockLLMAdapterEmpty:
     """Simulates Gemini returning no results (triggers CSV fallback)."""
@@ -182,6 +228,57 @@ class MockLLMAdapterEmpty:
         return MockLLMAdapter._RESPONSE
 
 
+class AsyncMockEmbeddingAdapter:
+    """AsyncEmbeddingPort over MockEmbeddingAdapter; yields to the loop once."""
+
+    model_name = "mock-embedding"
+    dimensions = 8
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        await asyncio.sleep(0)
+        return MockEmbeddingAdapter().embed_query(text)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class AsyncMockDatabaseAdapter:
+    """AsyncDatabasePort over MockDatabaseAdapter; records call order."""
+
+    def __init__(self) -> None:
+        self._db = MockDatabaseAdapter()
+        self.calls: list[str] = []
+        self.closed = False
+
+    async def vector_search(self, embedding: Any, limit: int) -> list[tuple[str, int]]:
+        self.calls.append("vector")
+        return self._db.vector_search(embedding, limit)
+
+    async def fts_search(self, query_text: str, limit: int) -> list[tuple[str, int]]:
+        self.calls.append("fts")
+        await asyncio.sleep(0)
+        return self._db.fts_search(query_text, limit)
+
+    async def fetch_by_codes(self, codes: list[str]) -> dict[str, dict]:
+        self.calls.append("fetch")
+        return self._db.fetch_by_codes(codes)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class AsyncMockLLMAdapter:
+    """AsyncLLMPort returning the MockLLMAdapter response."""
+
+    model_name = "mock-llm"
+
+    async def generate_json(self, system_prompt: str, user_message: str) -> str | None:
+        return MockLLMAdapter._RESPONSE
+
+    async def aclose(self) -> None:
+        pass
+
+
 # ── pytest fixtures ────────────────────────────────────────────────────────
 
 @pytest.fixture
@@ -211,25 +308,9 @@ def mock_retriever(mock_embedder, mock_db, settings):
 
 
 @pytest.fixture
-def mock_reranker(mock_llm, settings, tmp_path):
+def mock_reranker(mock_llm, reranker_settings):
     """LLMReranker backed by mock LLM; CSV reference disabled (empty path)."""
-    # Patch settings to point to a non-existent CSV so no file I/O occurs
-    patched = Settings(
-        gcp_project_id=settings.gcp_project_id,
-        gcp_location_id=settings.gcp_location_id,
-        gcp_embed_model=settings.gcp_embed_model,
-        gcp_gemini_model=settings.gcp_gemini_model,
-        gcloud_path=settings.gcloud_path,
-        https_proxy=settings.https_proxy,
-        db_dsn=settings.db_dsn,
-        rrf_k=settings.rrf_k,
-        retrieval_n=settings.retrieval_n,
-        top_k=settings.top_k,
-        embed_dim=settings.embed_dim,
-        embed_batch_size=settings.embed_batch_size,
-        master_csv_path=tmp_path / "nonexistent.csv",
-    )
-    return LLMReranker(llm=mock_llm, settings=patched)
+    return LLMReranker(llm=mock_llm, settings=reranker_settings)
 
 
 @pytest.fixture
@@ -239,3 +320,20 @@ def pipeline(mock_retriever, mock_reranker, settings):
         reranker=mock_reranker,
         settings=settings,
     )
+
+
+@pytest.fixture
+def async_mock_db():
+    return AsyncMockDatabaseAdapter()
+
+
+@pytest.fixture
+def async_pipeline(async_mock_db, reranker_settings, settings):
+    return AsyncClassifierPipeline(
+        retriever=AsyncHybridRetriever(
+            db=async_mock_db, embedder=AsyncMockEmbeddingAdapter(), settings=settings
+        ),
+        reranker=AsyncLLMReranker(llm=AsyncMockLLMAdapter(), settings=reranker_settings),
+        settings=settings,
+        resources=(async_mock_db,),
+    )
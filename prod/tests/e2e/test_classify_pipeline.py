@@ -12,13 +12,18 @@ and run with: pytest -m integration
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from prod.domain.models import ClassifyResponse, SearchMode, SearchRequest
 
+_LONG_QUERY = ("person who fixes cars and vans and trucks at the customer's home " * 5).strip()
+
 
 class TestFullPipelineHighFidelity:
+    # Only the first test needs the rerank stage; the rest check plumbing
+    # that both modes share, so they run the cheaper FAST path.
     def test_basic_classify_returns_response(self, pipeline):
         req = SearchRequest(
             query="mobile mechanic",
@@ -31,23 +36,22 @@ class TestFullPipelineHighFidelity:
 
     def test_response_has_correct_query(self, pipeline):
         q = "chartered accountant"
-        resp = pipeline.classify(SearchRequest(query=q))
+        resp = pipeline.classify(SearchRequest(query=q, mode=SearchMode.FAST))
         assert resp.query == q
 
     def test_results_are_ranked(self, pipeline):
-        resp = pipeline.classify(SearchRequest(query="nurse"))
+        resp = pipeline.classify(SearchRequest(query="nurse", mode=SearchMode.FAST))
         ranks = [r.rank for r in resp.results]
         assert ranks == sorted(ranks)
 
     def test_result_fields_populated(self, pipeline):
-        resp = pipeline.classify(SearchRequest(query="plumber"))
-        for r in resp.results:
-            assert r.anzsic_code
-            assert r.anzsic_desc
-            assert r.rank >= 1
+        resp = pipeline.classify(SearchRequest(query="plumber", mode=SearchMode.FAST))
+        assert all(r.anzsic_code for r in resp.results)
+        assert all(r.anzsic_desc for r in resp.results)
+        assert min((r.rank for r in resp.results), default=1) >= 1
 
     def test_to_dict_is_json_serialisable(self, pipeline):
-        resp = pipeline.classify(SearchRequest(query="electrician"))
+        resp = pipeline.classify(SearchRequest(query="electrician", mode=SearchMode.FAST))
         serialised = json.dumps(resp.to_dict())
         assert "results" in serialised
 
@@ -78,11 +82,29 @@ class TestBatchClassify:
         "primary school teacher",
     ]
 
-    def test_all_queries_return_results(self, pipeline):
-        for query in self.QUERIES:
-            req = SearchRequest(query=query, mode=SearchMode.FAST, top_k=3)
-            resp = pipeline.classify(req)
-            assert len(resp.results) > 0, f"No results for: {query}"
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_query_returns_results(self, pipeline, query):
+        req = SearchRequest(query=query, mode=SearchMode.FAST, top_k=3)
+        resp = pipeline.classify(req)
+        assert len(resp.results) > 0, f"No results for: {query}"
+
+    def test_classify_many(self, pipeline):
+        """The whole batch through the shared-embed, shared-search path."""
+        reqs = [SearchRequest(query=q, mode=SearchMode.FAST, top_k=3) for q in self.QUERIES]
+        responses = pipeline.classify_many(reqs)
+        assert [r.query for r in responses] == self.QUERIES
+        assert all(r.results for r in responses)
+        assert [r.results for r in responses] == [pipeline.classify(r).results for r in reqs]
+
+    def test_concurrent_classify(self, pipeline):
+        """One shared pipeline serving several threads, as under the API."""
+        def classify(query):
+            return pipeline.classify(SearchRequest(query=query, mode=SearchMode.FAST))
+
+        with ThreadPoolExecutor(max_workers=len(self.QUERIES)) as pool:
+            responses = list(pool.map(classify, self.QUERIES))
+        assert [r.query for r in responses] == self.QUERIES
+        assert all(r.results for r in responses)
 
     def test_no_query_raises_unhandled_exception(self, pipeline):
         """Ensure classification errors don't propagate without context."""
@@ -95,8 +117,7 @@ class TestBatchClassify:
 
 class TestEdgeCases:
     def test_very_long_query(self, pipeline):
-        long_q = "person who fixes cars and vans and trucks at the customer's home " * 5
-        req = SearchRequest(query=long_q.strip(), mode=SearchMode.FAST)
+        req = SearchRequest(query=_LONG_QUERY, mode=SearchMode.FAST)
         resp = pipeline.classify(req)
         assert resp is not None
 
@@ -106,6 +127,6 @@ class TestEdgeCases:
         assert resp.query == "médecin généraliste"
 
     def test_top_k_1_returns_single_result(self, pipeline):
-        req = SearchRequest(query="nurse", mode=SearchMode.HIGH_FIDELITY, top_k=1)
+        req = SearchRequest(query="nurse", mode=SearchMode.FAST, top_k=1)
         resp = pipeline.classify(req)
         assert len(resp.results) <= 1
@@ -0,0 +1,53 @@
+"""
+tests/integration/conftest.py
+──────────────────────────────────────────────────────────────────────────────
+Session-scoped fixtures shared by the integration modules.
+
+  live_settings → the real .env Settings, loaded once.  Named apart from the
+                  root `settings` fixture, which holds mock-test defaults.
+  gcp_auth → one GCPAuthManager for the whole run, so the Gemini and Vertex
+             modules share a single token fetch (google-auth or a gcloud
+             subprocess) and its background refresh timer is closed at the
+             end.  Fetched once up front: with no credentials every
+             dependent test is skipped instead of failing one by one.
+
+Per-module clients (llm, embedder, db_adapter) stay in their modules: the
+Gemini and GENI modules both call theirs `llm`.
+"""
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from prod.adapters.gcp_auth import GCPAuthManager
+from prod.config.settings import get_settings
+from prod.domain.exceptions import AuthenticationError
+
+
+@pytest.fixture(scope="session")
+def live_settings():
+    """Settings from .env / the environment, shared by every live client."""
+    return get_settings()
+
+
+@pytest.fixture(scope="session")
+def gcp_auth(live_settings):
+    """Real GCPAuthManager built from .env settings; closed after the run.
+
+    Skips (without spawning gcloud) when there are neither Application
+    Default Credentials nor a gcloud binary, and skips if the first token
+    fetch fails.
+    """
+    settings = live_settings
+    auth = GCPAuthManager(settings)
+    try:
+        if auth._creds is None and shutil.which(str(settings.gcloud_path)) is None:
+            pytest.skip("GCP not configured: no Application Default Credentials or gcloud")
+        try:
+            auth.get_token()
+        except AuthenticationError as exc:
+            pytest.skip(f"GCP auth unavailable: {exc}")
+        yield auth
+    finally:
+        auth.close()
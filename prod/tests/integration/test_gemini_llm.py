@@ -1,7 +1,7 @@
 """
 tests/integration/test_gemini_llm.py
 ──────────────────────────────────────────────────────────────────────────────
-Integration tests for GeminiLLMAdapter.
+Integration tests for GeminiLLMAdapter and AsyncGeminiLLMAdapter.
 
 Requires:
   • Active gcloud auth
@@ -15,11 +15,14 @@ IMPORTANT: These tests make real API calls and incur GCP costs.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 
 import pytest
 
-pytestmark = pytest.mark.integration
+from prod.adapters.gemini_llm import AsyncGeminiLLMAdapter, GeminiLLMAdapter
+
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("vertex")]
 
 _SYSTEM_PROMPT = (
     "You are an ANZSIC classification assistant. "
@@ -31,38 +34,68 @@ _USER_PROMPT = (
     "Return top 2 results as a JSON array."
 )
 
+_PLUMBER_PROMPT = _USER_PROMPT.replace("mobile mechanic", "plumber")
+
+
+@pytest.fixture(scope="module")
+def llm(gcp_auth, live_settings):
+    return GeminiLLMAdapter(gcp_auth, live_settings)
+
+
+@pytest.fixture(scope="module")
+def gemini_response(llm):
+    """One real generate_json() call, shared by the tests that inspect it."""
+    return llm.generate_json(_SYSTEM_PROMPT, _USER_PROMPT)
+
+
+@pytest.fixture(scope="module")
+def parsed_response(gemini_response):
+    assert gemini_response is not None, "Gemini returned None — check auth and model config"
+    return json.loads(gemini_response)  # Must not raise
+
 
 @pytest.fixture(scope="module")
-def llm():
-    from prod.adapters.gcp_auth import GCPAuthManager
-    from prod.adapters.gemini_llm import GeminiLLMAdapter
-    from prod.config.settings import get_settings
-    settings = get_settings()
-    auth = GCPAuthManager(settings)
-    return GeminiLLMAdapter(auth, settings)
+def gemini_items(parsed_response):
+    """The result list, whether Gemini returned a bare array or a wrapper."""
+    if isinstance(parsed_response, list):
+        return parsed_response
+    return next((v for v in parsed_response.values() if isinstance(v, list)), [])
+
+
+@pytest.fixture(scope="module")
+def async_responses(gcp_auth, live_settings):
+    """Two prompts sent through the async adapter concurrently."""
+
+    async def generate_both():
+        llm = AsyncGeminiLLMAdapter(gcp_auth, live_settings)
+        try:
+            return await asyncio.gather(
+                llm.generate_json(_SYSTEM_PROMPT, _USER_PROMPT),
+                llm.generate_json(_SYSTEM_PROMPT, _PLUMBER_PROMPT),
+            )
+        finally:
+            await llm.aclose()
+
+    return asyncio.run(generate_both())
 
 
 class TestGenerateJson:
-    def test_returns_string(self, llm):
-        raw = llm.generate_json(_SYSTEM_PROMPT, _USER_PROMPT)
-        assert raw is None or isinstance(raw, str)
-
-    def test_response_is_valid_json(self, llm):
-        raw = llm.generate_json(_SYSTEM_PROMPT, _USER_PROMPT)
-        assert raw is not None, "Gemini returned None — check auth and model config"
-        parsed = json.loads(raw)  # Must not raise
-        assert isinstance(parsed, (list, dict))
-
-    def test_response_contains_anzsic_code(self, llm):
-        raw = llm.generate_json(_SYSTEM_PROMPT, _USER_PROMPT)
-        assert raw is not None
-        parsed = json.loads(raw)
-        items = parsed if isinstance(parsed, list) else next(
-            (v for v in parsed.values() if isinstance(v, list)), []
-        )
-        assert len(items) > 0
+    def test_returns_string(self, gemini_response):
+        assert gemini_response is None or isinstance(gemini_response, str)
+
+    def test_response_is_valid_json(self, parsed_response):
+        assert isinstance(parsed_response, (list, dict))
+
+    def test_response_contains_anzsic_code(self, gemini_items):
+        assert len(gemini_items) > 0
         # At least one item should have an anzsic_code-like field
-        assert any("anzsic" in str(item).lower() for item in items)
+        assert any("anzsic" in str(item).lower() for item in gemini_items)
 
     def test_model_name_property(self, llm):
         assert len(llm.model_name) > 0
+
+
+class TestAsyncGenerateJson:
+    def test_concurrent_calls_return_json(self, async_responses):
+        assert all(r is not None for r in async_responses)
+        assert all(isinstance(json.loads(r), (list, dict)) for r in async_responses)
@@ -17,10 +17,13 @@ IMPORTANT: These tests make real GENI API calls.
 from __future__ import annotations
 
 import json
+import shutil
 
 import pytest
 
-pytestmark = pytest.mark.integration
+from prod.adapters.geni_llm import GeniLLMAdapter
+
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("geni")]
 
 # ── Shared test prompts (mirrors test_gemini_llm.py) ──────────────────────────
 
@@ -72,11 +75,13 @@ Return the top 2 matches as a JSON array.\
 # ── Fixture ────────────────────────────────────────────────────────────────────
 
 @pytest.fixture(scope="module")
-def llm():
+def llm(live_settings):
     """Build a real GeniLLMAdapter using settings from .env."""
-    from prod.adapters.geni_llm import GeniLLMAdapter
-    from prod.config.settings import get_settings
-    settings = get_settings()
+    settings = live_settings
+    if not settings.geni_bot_version_id:
+        pytest.skip("GENI not configured: GENI_BOT_VERSION_ID is empty")
+    if shutil.which(str(settings.gcloud_path)) is None:
+        pytest.skip(f"gcloud not found at {settings.gcloud_path}")
     return GeniLLMAdapter(settings)
 
 
@@ -15,49 +15,58 @@ Environment:
 """
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-pytestmark = pytest.mark.integration
+from prod.adapters.postgres_db import PostgresDatabaseAdapter
+from prod.domain.exceptions import DatabaseError
+from prod.services.retriever import compute_rrf_topk
+
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("pg")]
 
 
 @pytest.fixture(scope="module")
-def db_adapter():
+def db_adapter(live_settings):
     """Create a real PostgresDatabaseAdapter for integration testing."""
-    from prod.adapters.postgres_db import PostgresDatabaseAdapter
-    from prod.config.settings import get_settings
-    adapter = PostgresDatabaseAdapter(get_settings())
+    adapter = PostgresDatabaseAdapter(live_settings)
+    try:
+        adapter._get_pool()   # connect once up front; skip if there is no DB
+    except DatabaseError as exc:
+        pytest.skip(f"PostgreSQL unavailable: {exc}")
     yield adapter
     adapter.close()
 
 
+# Not meaningful but won't crash; float32 ndarray like the embedders return.
+_FAKE_VEC = np.full(768, 0.01, dtype=np.float32)
+
+
+@pytest.fixture(scope="module")
+def vec_results(db_adapter):
+    """One vector_search() with a limit above the row count, shared by the
+    tests that only inspect its shape."""
+    return db_adapter.vector_search(_FAKE_VEC, limit=10_000)
+
+
 class TestVectorSearch:
-    def test_returns_tuples_with_rank(self, db_adapter):
+    def test_returns_tuples_with_rank(self, vec_results):
         """vector_search should return (code, rank) tuples."""
-        fake_vec = [0.01] * 768  # Not meaningful but won't crash
-        results = db_adapter.vector_search(fake_vec, limit=5)
-        assert len(results) <= 5
-        for code, rank in results:
+        for code, rank in vec_results:
             assert isinstance(code, str)
             assert isinstance(rank, int)
             assert rank >= 1
 
-    def test_rank_starts_at_1(self, db_adapter):
-        fake_vec = [0.01] * 768
-        results = db_adapter.vector_search(fake_vec, limit=10)
-        if results:
-            ranks = [r for _, r in results]
-            assert min(ranks) == 1
+    def test_rank_starts_at_1(self, vec_results):
+        if vec_results:
+            assert min(r for _, r in vec_results) == 1
 
     def test_respects_limit(self, db_adapter):
-        fake_vec = [0.01] * 768
-        results = db_adapter.vector_search(fake_vec, limit=3)
+        results = db_adapter.vector_search(_FAKE_VEC, limit=3)
         assert len(results) <= 3
 
-    def test_limit_larger_than_rows_returns_all(self, db_adapter):
+    def test_limit_larger_than_rows_returns_all(self, vec_results):
         """Asking for more than exist should not raise."""
-        fake_vec = [0.01] * 768
-        results = db_adapter.vector_search(fake_vec, limit=10_000)
-        assert len(results) > 0
+        assert len(vec_results) > 0
 
 
 class TestFTSSearch:
@@ -105,3 +114,37 @@ class TestFetchByCodes:
         codes = ["S9419_03", "S9411_01"]
         results = db_adapter.fetch_by_codes(codes)
         assert len(results) >= 1  # At least one must exist
+
+
+class TestHybridSearch:
+    def test_matches_separate_queries(self, db_adapter):
+        """One round trip returns what the three atomic calls would."""
+        vec_hits, fts_hits, records = db_adapter.hybrid_search(_FAKE_VEC, "mechanic", limit=5)
+        assert vec_hits == db_adapter.vector_search(_FAKE_VEC, limit=5)
+        assert fts_hits == db_adapter.fts_search("mechanic", limit=5)
+        assert set(records) == {code for code, _ in vec_hits + fts_hits}
+
+    def test_rrf_k_keeps_top_fused_codes(self, db_adapter):
+        full = db_adapter.hybrid_search(_FAKE_VEC, "mechanic", limit=5)
+        vec_hits, fts_hits, records = db_adapter.hybrid_search(
+            _FAKE_VEC, "mechanic", limit=5, rrf_k=60
+        )
+        # SQL pre-fusion and the Python fallback break ties the same way.
+        expected = compute_rrf_topk(full[0], full[1], k=60, top_k=5)
+        assert set(records) == {r.anzsic_code for r in expected}
+        assert set(vec_hits) <= set(full[0]) and set(fts_hits) <= set(full[1])
+
+    def test_batch_legs_match_single_queries(self, db_adapter):
+        vecs = [_FAKE_VEC, np.full(768, -0.02, dtype=np.float32)]
+        texts = ["mechanic", "plumber"]
+        assert db_adapter.vector_search_batch(vecs, limit=5) == [
+            db_adapter.vector_search(v, limit=5) for v in vecs
+        ]
+        assert db_adapter.fts_search_batch(texts, limit=5) == [
+            db_adapter.fts_search(t, limit=5) for t in texts
+        ]
+
+    def test_none_embedding_is_fts_only(self, db_adapter):
+        vec_hits, fts_hits, records = db_adapter.hybrid_search(None, "plumber", limit=5)
+        assert vec_hits == []
+        assert set(records) == {code for code, _ in fts_hits}
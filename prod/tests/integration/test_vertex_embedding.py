@@ -1,7 +1,7 @@
 """
 tests/integration/test_vertex_embedding.py
 ──────────────────────────────────────────────────────────────────────────────
-Integration tests for VertexEmbeddingAdapter.
+Integration tests for VertexEmbeddingAdapter and AsyncVertexEmbeddingAdapter.
 
 Requires:
   • Active gcloud auth (gcloud auth application-default login)
@@ -15,48 +15,82 @@ IMPORTANT: These tests make real API calls and incur GCP costs.
 """
 from __future__ import annotations
 
+import asyncio
+
+import numpy as np
 import pytest
 
-pytestmark = pytest.mark.integration
+from prod.adapters.vertex_embedding import AsyncVertexEmbeddingAdapter, VertexEmbeddingAdapter
+
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("vertex")]
+
+
+def _cosine(a, b) -> float:
+    """Cosine similarity via one dot product (0.0 for a zero vector)."""
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    return float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b) + 1e-12))
 
 
 @pytest.fixture(scope="module")
-def embedder():
-    from prod.adapters.gcp_auth import GCPAuthManager
-    from prod.adapters.vertex_embedding import VertexEmbeddingAdapter
-    from prod.config.settings import get_settings
-    settings = get_settings()
-    auth = GCPAuthManager(settings)
-    return VertexEmbeddingAdapter(auth, settings)
+def embedder(gcp_auth, live_settings):
+    return VertexEmbeddingAdapter(gcp_auth, live_settings)
+
+
+@pytest.fixture(scope="module")
+def mechanic_vec(embedder):
+    """One real embed_query("mobile mechanic") call, shared across tests."""
+    return embedder.embed_query("mobile mechanic")
+
+
+@pytest.fixture(scope="module")
+def nurse_vec(embedder):
+    return embedder.embed_query("registered nurse")
+
+
+@pytest.fixture(scope="module")
+def async_vecs(gcp_auth, live_settings):
+    """Both queries embedded by the async adapter in one concurrent wave."""
+
+    async def embed_both():
+        embedder = AsyncVertexEmbeddingAdapter(gcp_auth, live_settings)
+        try:
+            return await asyncio.gather(
+                embedder.embed_query("mobile mechanic"),
+                embedder.embed_query("registered nurse"),
+            )
+        finally:
+            await embedder.aclose()
+
+    return asyncio.run(embed_both())
 
 
 class TestEmbedQuery:
-    def test_returns_correct_dimension(self, embedder):
-        vec = embedder.embed_query("mobile mechanic")
-        assert len(vec) == 768
+    def test_returns_correct_dimension(self, mechanic_vec):
+        assert len(mechanic_vec) == 768
 
-    def test_returns_floats(self, embedder):
-        vec = embedder.embed_query("plumber")
-        assert all(isinstance(v, float) for v in vec)
+    def test_returns_float_array(self, mechanic_vec):
+        assert mechanic_vec.ndim == 1 and mechanic_vec.dtype.kind == "f"
 
-    def test_different_queries_produce_different_vectors(self, embedder):
-        vec1 = embedder.embed_query("mobile mechanic")
-        vec2 = embedder.embed_query("registered nurse")
-        assert vec1 != vec2
+    def test_different_queries_produce_different_vectors(self, mechanic_vec, nurse_vec):
+        assert not (mechanic_vec == nurse_vec).all()
 
     def test_similar_queries_produce_similar_vectors(self, embedder):
         """Cosine similarity between related queries should be high."""
-        import math
-        def cosine(a, b):
-            dot = sum(x * y for x, y in zip(a, b))
-            na = math.sqrt(sum(x ** 2 for x in a))
-            nb = math.sqrt(sum(x ** 2 for x in b))
-            return dot / (na * nb) if na and nb else 0.0
+        # One batched RPC (RETRIEVAL_QUERY, like embed_query) instead of three.
+        v1, v2, v3 = embedder.embed_queries_batch(
+            ["car mechanic", "automobile technician", "registered nurse"]
+        )
+        assert _cosine(v1, v2) > _cosine(v1, v3)
+
+
+class TestAsyncEmbedQuery:
+    def test_returns_correct_dimension(self, async_vecs):
+        assert np.stack(async_vecs).shape == (2, 768)
 
-        v1 = embedder.embed_query("car mechanic")
-        v2 = embedder.embed_query("automobile technician")
-        v3 = embedder.embed_query("registered nurse")
-        assert cosine(v1, v2) > cosine(v1, v3)
+    def test_matches_sync_adapter(self, async_vecs, mechanic_vec, nurse_vec):
+        assert _cosine(async_vecs[0], mechanic_vec) > 0.99
+        assert _cosine(async_vecs[1], nurse_vec) > 0.99
 
 
 class TestEmbedDocumentsBatch:
@@ -68,9 +102,9 @@ class TestEmbedDocumentsBatch:
     def test_batch_items_are_768_dim(self, embedder):
         texts = ["nurse", "doctor"]
         results = embedder.embed_documents_batch(texts)
-        for vec in results:
-            assert vec is not None
-            assert len(vec) == 768
+        assert all(vec is not None for vec in results)
+        arr = np.stack(results)
+        assert arr.shape == (len(texts), 768) and arr.dtype.kind == "f"
 
     def test_empty_batch_returns_empty(self, embedder):
         assert embedder.embed_documents_batch([]) == []
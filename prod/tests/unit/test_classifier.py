@@ -8,64 +8,90 @@ Verifies:
   • FAST mode skips the LLM and returns RRF-ordered results directly
   • ClassifyResponse metadata is populated correctly
   • Zero candidates returns an empty result list (no crash)
+  • retrieve_only() + rerank() compose to classify()
+  • classify_many() matches classify() with batched Stage 1 and Stage 2
+  • HybridRetriever.retrieve_many matches retrieve() with one embed call
+    and one DB call per search leg
+  • AsyncClassifierPipeline matches the sync pipeline and overlaps FTS
+    with the embed + vector leg
 """
 from __future__ import annotations
 
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
 import pytest
 
 from prod.domain.models import SearchMode, SearchRequest
+from prod.services.classifier import ClassifierPipeline
+from prod.services.reranker import LLMReranker
+from prod.services.retriever import HybridRetriever
+from prod.tests.conftest import MockDatabaseAdapter, MockEmbeddingAdapter, MockLLMAdapter
+
+
+# ── Shared responses for the metadata checks ───────────────────────────────
+# Mode-level metadata does not depend on the query, so each mode is
+# classified once per module.  The pipeline is built here from fresh mocks
+# (the conftest `pipeline` fixture is function-scoped) and never patched.
+
+@pytest.fixture(scope="module")
+def shared_pipeline(settings, reranker_settings):
+    return ClassifierPipeline(
+        retriever=HybridRetriever(
+            db=MockDatabaseAdapter(), embedder=MockEmbeddingAdapter(), settings=settings
+        ),
+        reranker=LLMReranker(llm=MockLLMAdapter(), settings=reranker_settings),
+        settings=settings,
+    )
+
+
+@pytest.fixture(scope="module")
+def fast_resp(shared_pipeline):
+    return shared_pipeline.classify(
+        SearchRequest(query="mobile mechanic", mode=SearchMode.FAST, top_k=3)
+    )
+
+
+@pytest.fixture(scope="module")
+def hf_resp(shared_pipeline):
+    return shared_pipeline.classify(
+        SearchRequest(query="mobile mechanic", mode=SearchMode.HIGH_FIDELITY, top_k=2)
+    )
 
 
 class TestClassifierFastMode:
-    def test_returns_results(self, pipeline):
-        req = SearchRequest(query="mobile mechanic", mode=SearchMode.FAST, top_k=3)
-        resp = pipeline.classify(req)
-        assert len(resp.results) <= 3
-        assert resp.mode == "fast"
+    def test_returns_results(self, fast_resp):
+        assert len(fast_resp.results) <= 3
+        assert fast_resp.mode == "fast"
 
-    def test_llm_model_is_empty_in_fast_mode(self, pipeline):
-        req = SearchRequest(query="electrician", mode=SearchMode.FAST)
-        resp = pipeline.classify(req)
-        assert resp.llm_model == ""
+    def test_llm_model_is_empty_in_fast_mode(self, fast_resp):
+        assert fast_resp.llm_model == ""
 
-    def test_embed_model_populated(self, pipeline):
-        req = SearchRequest(query="nurse", mode=SearchMode.FAST)
-        resp = pipeline.classify(req)
-        assert resp.embed_model != ""
+    def test_embed_model_populated(self, fast_resp):
+        assert fast_resp.embed_model != ""
 
-    def test_candidates_retrieved_is_positive(self, pipeline):
-        req = SearchRequest(query="plumber", mode=SearchMode.FAST)
-        resp = pipeline.classify(req)
-        assert resp.candidates_retrieved > 0
+    def test_candidates_retrieved_is_positive(self, fast_resp):
+        assert fast_resp.candidates_retrieved > 0
 
-    def test_results_ranked_from_1(self, pipeline):
-        req = SearchRequest(query="chef", mode=SearchMode.FAST, top_k=3)
-        resp = pipeline.classify(req)
-        ranks = [r.rank for r in resp.results]
+    def test_results_ranked_from_1(self, fast_resp):
+        ranks = [r.rank for r in fast_resp.results]
         assert ranks == list(range(1, len(ranks) + 1))
 
 
 class TestClassifierHighFidelityMode:
-    def test_returns_results(self, pipeline):
-        req = SearchRequest(query="mobile mechanic", mode=SearchMode.HIGH_FIDELITY, top_k=2)
-        resp = pipeline.classify(req)
-        assert len(resp.results) > 0
+    def test_returns_results(self, hf_resp):
+        assert len(hf_resp.results) > 0
 
-    def test_llm_model_populated(self, pipeline):
-        req = SearchRequest(query="mechanic", mode=SearchMode.HIGH_FIDELITY)
-        resp = pipeline.classify(req)
-        assert resp.llm_model != ""
+    def test_llm_model_populated(self, hf_resp):
+        assert hf_resp.llm_model != ""
 
-    def test_mode_value_in_response(self, pipeline):
-        req = SearchRequest(query="mechanic", mode=SearchMode.HIGH_FIDELITY)
-        resp = pipeline.classify(req)
-        assert resp.mode == "high_fidelity"
+    def test_mode_value_in_response(self, hf_resp):
+        assert hf_resp.mode == "high_fidelity"
 
-    def test_result_has_reason(self, pipeline):
-        req = SearchRequest(query="mechanic", mode=SearchMode.HIGH_FIDELITY)
-        resp = pipeline.classify(req)
+    def test_result_has_reason(self, hf_resp):
         # MockLLMAdapter populates reason
-        for r in resp.results:
+        for r in hf_resp.results:
             assert r.reason is not None and len(r.reason) > 0
 
     def test_query_preserved_in_response(self, pipeline):
@@ -73,3 +99,117 @@ class TestClassifierHighFidelityMode:
         req = SearchRequest(query=query, mode=SearchMode.HIGH_FIDELITY)
         resp = pipeline.classify(req)
         assert resp.query == query
+
+
+class TestStagedClassify:
+    def test_retrieve_only_then_rerank_matches_classify(self, pipeline):
+        for mode in SearchMode:
+            req = SearchRequest(query="mobile mechanic", mode=mode, top_k=3)
+            staged = pipeline.rerank(req, pipeline.retrieve_only(req))
+            assert staged.results == pipeline.classify(req).results
+
+
+class TestClassifyMany:
+    def _requests(self):
+        return [
+            SearchRequest(query=q, mode=mode, top_k=3)
+            for q in ("plumber", "mobile mechanic")
+            for mode in SearchMode
+        ]
+
+    def test_matches_classify(self, pipeline):
+        requests = self._requests()
+        for req, resp in zip(requests, pipeline.classify_many(requests)):
+            single = pipeline.classify(req)
+            assert resp.query == req.query
+            assert resp.results == single.results
+            assert resp.llm_model == single.llm_model
+
+    def test_batches_both_stages(self, pipeline, mock_retriever, mock_reranker):
+        mock_retriever.retrieve_many = MagicMock(wraps=mock_retriever.retrieve_many)
+        mock_reranker.rerank_many = MagicMock(wraps=mock_reranker.rerank_many)
+        mock_reranker.rerank = MagicMock()
+        pipeline.classify_many(self._requests())
+        mock_retriever.retrieve_many.assert_called_once()
+        mock_reranker.rerank_many.assert_called_once()
+        assert len(mock_reranker.rerank_many.call_args.args[0]) == 2
+        mock_reranker.rerank.assert_not_called()
+
+
+class TestRetrieveMany:
+    def test_matches_retrieve_with_one_embed_call(self, mock_retriever):
+        queries = ["plumber", "nurse", "mobile mechanic"]
+        embed = MagicMock(wraps=mock_retriever._embedder.embed_queries_batch)
+        mock_retriever._embedder.embed_queries_batch = embed
+        batched = mock_retriever.retrieve_many(queries, n=5)
+        embed.assert_called_once_with(queries)
+        assert batched == [mock_retriever.retrieve(q, 5) for q in queries]
+
+    def test_one_db_call_per_leg(self, mock_retriever):
+        db = mock_retriever._db
+        db.vector_search_batch = MagicMock(wraps=db.vector_search_batch)
+        db.fts_search_batch = MagicMock(wraps=db.fts_search_batch)
+        db.hybrid_search = MagicMock()
+        mock_retriever.retrieve_many(["plumber", "nurse"], n=5)
+        db.vector_search_batch.assert_called_once()
+        db.fts_search_batch.assert_called_once()
+        db.hybrid_search.assert_not_called()
+
+    def test_fts_leg_runs_off_the_calling_thread(self, mock_retriever):
+        db = mock_retriever._db
+        threads = []
+        fts = db.fts_search_batch
+
+        def record(queries, n):
+            threads.append(threading.current_thread().name)
+            return fts(queries, n)
+
+        db.fts_search_batch = record
+        mock_retriever.retrieve_many(["plumber"], n=5)
+        assert threads and threads[0].startswith("hybrid-search")
+
+    def test_fts_leg_overlaps_embedding(self, mock_retriever):
+        db, embedder = mock_retriever._db, mock_retriever._embedder
+        fts_started = threading.Event()
+        fts, embed = db.fts_search_batch, embedder.embed_queries_batch
+
+        def record_fts(queries, n):
+            fts_started.set()
+            return fts(queries, n)
+
+        def wait_for_fts(queries):
+            assert fts_started.wait(timeout=2)
+            return embed(queries)
+
+        db.fts_search_batch = record_fts
+        embedder.embed_queries_batch = wait_for_fts
+        assert mock_retriever.retrieve_many(["plumber"], n=5)
+
+
+class TestClassifyAsync:
+    def test_matches_classify(self, pipeline):
+        for mode in SearchMode:
+            req = SearchRequest(query="mobile mechanic", mode=mode, top_k=3)
+            sync_resp = pipeline.classify(req)
+            async_resp = asyncio.run(pipeline.classify_async(req))
+            assert async_resp.results == sync_resp.results
+            assert async_resp.llm_model == sync_resp.llm_model
+
+
+class TestAsyncClassifierPipeline:
+    def test_matches_sync_pipeline(self, pipeline, async_pipeline):
+        for mode in SearchMode:
+            req = SearchRequest(query="mobile mechanic", mode=mode, top_k=3)
+            sync_resp = pipeline.classify(req)
+            async_resp = asyncio.run(async_pipeline.classify(req))
+            assert async_resp.results == sync_resp.results
+            assert async_resp.candidates_retrieved == sync_resp.candidates_retrieved
+
+    def test_fts_starts_before_vector_search(self, async_pipeline, async_mock_db):
+        req = SearchRequest(query="plumber", mode=SearchMode.FAST)
+        asyncio.run(async_pipeline.classify(req))
+        assert async_mock_db.calls == ["fts", "vector", "fetch"]
+
+    def test_aclose_closes_resources(self, async_pipeline, async_mock_db):
+        asyncio.run(async_pipeline.aclose())
+        assert async_mock_db.closed
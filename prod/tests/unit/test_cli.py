@@ -0,0 +1,101 @@
+"""
+tests/unit/test_cli.py
+──────────────────────────────────────────────────────────────────────────────
+Unit tests for batch-file parsing, batch runs and logging setup in
+prod.interfaces.cli.
+"""
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock
+
+from prod.interfaces import cli
+
+_SAMPLE = "plumber\n# comment\n\n  mobile mechanic  \r\n   \n  # indented\nnurse"
+
+
+class TestLoadQueriesFromFile:
+
+    def test_small_file(self, tmp_path):
+        path = tmp_path / "q.txt"
+        path.write_text(_SAMPLE, encoding="utf-8")
+        assert cli._load_queries_from_file(path) == [
+            "plumber", "mobile mechanic", "# indented", "nurse",
+        ]
+
+    def test_mmap_path_matches_small_file_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "q.txt"
+        path.write_text(_SAMPLE + "\ncafé owner\n", encoding="utf-8")
+        expected = cli._load_queries_from_file(path)
+        monkeypatch.setattr(cli, "_MMAP_MIN_BYTES", 1)
+        assert cli._load_queries_from_file(path) == expected
+
+
+class TestRunBatch:
+
+    def _run(self, tmp_path, monkeypatch, pipeline, *extra, text=None):
+        path = tmp_path / "q.txt"
+        path.write_text(text or "plumber\nnurse\nmobile mechanic\n", encoding="utf-8")
+        monkeypatch.setattr(cli, "get_pipeline", lambda: pipeline)
+        args = cli._get_parser().parse_args(
+            ["--file", str(path), "--mode", "fast", "--json", "-j", "2", *extra]
+        )
+        return cli.run(args)
+
+    def test_batches_through_classify_many_in_order(
+        self, tmp_path, monkeypatch, capsys, pipeline
+    ):
+        pipeline.classify_many = MagicMock(wraps=pipeline.classify_many)
+        assert self._run(tmp_path, monkeypatch, pipeline) == 0
+        assert pipeline.classify_many.call_count == 2      # chunks of 2 + 1
+        out = capsys.readouterr().out
+        queries = ("plumber", "nurse", "mobile mechanic")
+        positions = [out.index(f'"query": "{q}"') for q in queries]
+        assert positions == sorted(positions)
+
+    def test_failed_batch_falls_back_per_query(
+        self, tmp_path, monkeypatch, capsys, pipeline
+    ):
+        pipeline.classify_many = MagicMock(side_effect=RuntimeError("boom"))
+        real = pipeline.classify
+
+        def classify(request):
+            if request.query == "nurse":
+                raise RuntimeError("bad query")
+            return real(request)
+
+        pipeline.classify = classify
+        assert self._run(tmp_path, monkeypatch, pipeline) == 1
+        captured = capsys.readouterr()
+        assert "ERROR ['nurse']: bad query" in captured.err
+        assert '"query": "mobile mechanic"' in captured.out
+
+    def test_file_without_queries_is_a_no_op(self, tmp_path, monkeypatch, capsys, pipeline):
+        pipeline.classify_many = MagicMock(wraps=pipeline.classify_many)
+        text = "# only comments\n\n   \n"
+        assert self._run(tmp_path, monkeypatch, pipeline, text=text) == 0
+        pipeline.classify_many.assert_not_called()
+        assert capsys.readouterr().out == ""
+
+    def test_duplicates_classified_once(self, tmp_path, monkeypatch, capsys, pipeline):
+        pipeline.classify_many = MagicMock(wraps=pipeline.classify_many)
+        text = "nurse\nplumber\nnurse\nnurse\n"
+        assert self._run(tmp_path, monkeypatch, pipeline, text=text) == 0
+        sent = [r.query for c in pipeline.classify_many.call_args_list for r in c.args[0]]
+        assert sent == ["nurse", "plumber"]
+        out = capsys.readouterr().out
+        assert out.count('"query": "nurse"') == 3
+        assert out.index('"query": "plumber"') < out.rindex('"query": "nurse"')
+
+
+class TestConfigureLogging:
+
+    def test_adds_one_handler_and_updates_level(self, monkeypatch):
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+        cli._configure_logging(logging.INFO)
+        cli._configure_logging(logging.DEBUG)
+        assert len(root.handlers) == 1
+        assert root.handlers[0].formatter is cli._LOG_FORMATTER
+        assert root.level == logging.DEBUG
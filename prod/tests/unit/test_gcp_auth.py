@@ -0,0 +1,154 @@
+"""
+tests/unit/test_gcp_auth.py
+──────────────────────────────────────────────────────────────────────────────
+Unit tests for GCPAuthManager.
+
+The gcloud subprocess and google-auth credentials are intercepted with
+unittest.mock.patch so these tests run fully offline — no gcloud binary or
+GCP credentials required.
+"""
+from __future__ import annotations
+
+import dataclasses
+import subprocess
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from prod.adapters.gcp_auth import TOKEN_REFRESH_MARGIN, GCPAuthManager
+from prod.domain.exceptions import AuthenticationError
+
+
+@pytest.fixture
+def settings(settings):
+    """Force the gcloud token source so tests never touch real ADC."""
+    return dataclasses.replace(settings, gcp_auth_use_gcloud=True)
+
+
+def _completed(token: str) -> MagicMock:
+    """Build a mock CompletedProcess carrying *token* on stdout."""
+    result = MagicMock()
+    result.stdout = f"{token}\n"
+    return result
+
+
+class TestGetToken:
+
+    def test_first_call_fetches_token(self, settings):
+        with patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            mock_run.return_value = _completed("tok-1")
+            auth = GCPAuthManager(settings)
+            assert auth.get_token() == "tok-1"
+        assert mock_run.call_count == 1
+
+    def test_fresh_token_is_cached(self, settings):
+        """Repeated calls within the TTL must not re-run gcloud."""
+        with patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            mock_run.return_value = _completed("tok-1")
+            auth = GCPAuthManager(settings)
+            for _ in range(5):
+                assert auth.get_token() == "tok-1"
+        assert mock_run.call_count == 1
+
+    def test_fast_path_skips_lock(self, settings):
+        """A fresh cached token is returned without acquiring the lock."""
+        with patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            mock_run.return_value = _completed("tok-1")
+            auth = GCPAuthManager(settings)
+            auth.get_token()
+            auth._lock = MagicMock()
+            assert auth.get_token() == "tok-1"
+        auth._lock.__enter__.assert_not_called()
+
+    def test_invalidate_forces_refresh(self, settings):
+        with patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            mock_run.side_effect = [_completed("tok-1"), _completed("tok-2")]
+            auth = GCPAuthManager(settings)
+            assert auth.get_token() == "tok-1"
+            auth.invalidate()
+            assert auth.get_token() == "tok-2"
+
+    def test_empty_token_raises(self, settings):
+        with patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            mock_run.return_value = _completed("")
+            auth = GCPAuthManager(settings)
+            with pytest.raises(AuthenticationError, match="empty"):
+                auth.get_token()
+
+    def test_gcloud_failure_raises(self, settings):
+        err = subprocess.CalledProcessError(1, "gcloud", stderr="not logged in")
+        with patch("prod.adapters.gcp_auth.subprocess.run", side_effect=err):
+            auth = GCPAuthManager(settings)
+            with pytest.raises(AuthenticationError, match="not logged in"):
+                auth.get_token()
+
+
+class TestBackgroundRefresh:
+
+    def test_refresh_arms_daemon_timer(self, settings):
+        with patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            mock_run.return_value = _completed("tok-1")
+            auth = GCPAuthManager(settings)
+            auth.get_token()
+        timer = auth._refresh_timer
+        assert timer is not None and timer.daemon and timer.is_alive()
+        auth.close()
+        assert auth._refresh_timer is None
+        timer.join(timeout=1)
+        assert not timer.is_alive()
+
+    def test_background_refresh_swaps_token(self, settings):
+        with patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            mock_run.side_effect = [_completed("tok-1"), _completed("tok-2")]
+            auth = GCPAuthManager(settings)
+            auth.get_token()
+            auth._background_refresh()
+            assert auth.get_token() == "tok-2"
+        auth.close()
+
+    def test_background_refresh_failure_is_swallowed(self, settings):
+        with patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            mock_run.side_effect = [_completed("tok-1"), _completed("")]
+            auth = GCPAuthManager(settings)
+            auth.get_token()
+            auth._background_refresh()  # must not raise
+            assert auth.get_token() == "tok-1"
+        auth.close()
+
+
+class TestGoogleAuthSource:
+
+    def _creds(self, token: str, ttl: int = 3600) -> MagicMock:
+        creds = MagicMock()
+        creds.token = token
+        # google-auth reports expiry as a naive UTC datetime
+        creds.expiry = (datetime.now(timezone.utc) + timedelta(seconds=ttl)).replace(tzinfo=None)
+        return creds
+
+    def test_uses_credentials_expiry(self, settings):
+        adc_settings = dataclasses.replace(settings, gcp_auth_use_gcloud=False)
+        creds = self._creds("adc-tok", ttl=1800)
+        with patch("prod.adapters.gcp_auth._load_google_credentials", return_value=creds), \
+             patch("prod.adapters.gcp_auth._google_auth_request"), \
+             patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            auth = GCPAuthManager(adc_settings)
+            assert auth.get_token() == "adc-tok"
+        mock_run.assert_not_called()
+        expected = time.monotonic() + 1800 - TOKEN_REFRESH_MARGIN
+        assert abs(auth._state.fresh_until - expected) < 5
+        auth.close()
+
+    def test_falls_back_to_gcloud_on_refresh_error(self, settings):
+        adc_settings = dataclasses.replace(settings, gcp_auth_use_gcloud=False)
+        creds = MagicMock()
+        creds.refresh.side_effect = RuntimeError("proxy blocked oauth2")
+        with patch("prod.adapters.gcp_auth._load_google_credentials", return_value=creds), \
+             patch("prod.adapters.gcp_auth._google_auth_request"), \
+             patch("prod.adapters.gcp_auth.subprocess.run") as mock_run:
+            mock_run.return_value = _completed("gcloud-tok")
+            auth = GCPAuthManager(adc_settings)
+            assert auth.get_token() == "gcloud-tok"
+        assert auth._creds is None  # stays on gcloud for the process
+        auth.close()
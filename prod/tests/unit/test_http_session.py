@@ -0,0 +1,118 @@
+"""
+tests/unit/test_http_session.py
+──────────────────────────────────────────────────────────────────────────────
+Unit tests for the shared HTTP helpers in prod.adapters.http_session.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+
+from prod.adapters.http_session import (
+    acquire_http2_client,
+    acquire_session,
+    body_snippet,
+    build_session,
+    close_shared_sessions,
+    jittered,
+    proxies_for,
+    release_http2_client,
+    release_session,
+    retry_after,
+)
+
+
+class TestBuildSession:
+
+    def test_default_headers_applied(self):
+        session = build_session({"Authorization": "Bearer k"})
+        assert session.headers["Authorization"] == "Bearer k"
+        session.close()
+
+
+class TestSharedSessions:
+
+    def test_same_host_shares_one_session(self):
+        a = acquire_session("https://a.example")
+        b = acquire_session("https://a.example")
+        other = acquire_session("https://b.example")
+        assert a is b and a is not other
+        close_shared_sessions()
+
+    def test_last_release_closes_session(self):
+        session = acquire_session("https://a.example")
+        acquire_session("https://a.example")
+        release_session("https://a.example")
+        assert acquire_session("https://a.example") is session
+        for _ in range(2):
+            release_session("https://a.example")
+        assert acquire_session("https://a.example") is not session
+        close_shared_sessions()
+
+    def test_release_unknown_host_is_noop(self):
+        release_session("https://never.example")
+
+    def test_http2_clients_are_shared_per_host(self):
+        a = acquire_http2_client("https://a.example")
+        assert acquire_http2_client("https://a.example") is a
+        assert acquire_session("https://a.example") is not a
+        for _ in range(2):
+            release_http2_client("https://a.example")
+        assert a.is_closed
+        close_shared_sessions()
+
+
+class TestBodySnippet:
+
+    def test_truncates_bytes_before_decoding(self):
+        resp = httpx.Response(500, content=b"x" * 10_000)
+        assert body_snippet(resp) == "x" * 300
+
+    def test_split_multibyte_char_is_replaced(self):
+        resp = httpx.Response(500, content="é".encode() * 2)
+        assert body_snippet(resp, 3) == "é\ufffd"
+
+
+class TestProxiesFor:
+
+    def test_proxy_mapping_is_shared(self):
+        assert proxies_for("proxy:8080") == {"https": "http://proxy:8080"}
+        assert proxies_for("proxy:8080") is proxies_for("proxy:8080")
+
+    def test_empty_proxy_is_direct(self):
+        assert proxies_for("") == {}
+
+
+class TestRetryAfter:
+
+    def test_missing_header_uses_delay(self):
+        assert retry_after({}, 4.0) == 4.0
+
+    def test_seconds_form_longer_than_delay(self):
+        assert retry_after({"Retry-After": "7"}, 2.0) == 7.0
+
+    def test_seconds_form_shorter_than_delay(self):
+        assert retry_after({"Retry-After": "1"}, 4.0) == 4.0
+
+    def test_http_date_form(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=20)
+        wait = retry_after({"Retry-After": format_datetime(when, usegmt=True)}, 2.0)
+        assert 18.0 <= wait <= 20.0
+
+    def test_clamped_to_cap(self):
+        assert retry_after({"Retry-After": "3600"}, 2.0) == 60.0
+
+    def test_garbage_header_uses_delay(self):
+        assert retry_after({"Retry-After": "soon"}, 2.0) == 2.0
+
+
+class TestJittered:
+
+    def test_within_jitter_band(self):
+        waits = [jittered(2.0) for _ in range(200)]
+        assert all(2.0 <= w < 3.0 for w in waits)
+
+    def test_spreads_retries(self):
+        assert len({jittered(2.0) for _ in range(20)}) > 1
@@ -0,0 +1,54 @@
+"""
+tests/unit/test_llm_batch.py
+──────────────────────────────────────────────────────────────────────────────
+Unit tests for prod.adapters.llm_batch (several user messages per LLM call).
+"""
+from __future__ import annotations
+
+import json
+import re
+
+from prod.adapters.llm_batch import generate_json_batch
+from prod.config.prompts import build_batch_user_message
+
+
+class _FakeLLM:
+    """Answers each ---QUERY i--- block with [message]; records calls."""
+
+    def __init__(self, answers: int | None = None) -> None:
+        self.calls: list[str] = []
+        self._answers = answers
+
+    def generate_json(self, system_prompt: str, user_message: str) -> str | None:
+        self.calls.append(user_message)
+        blocks = re.split(r"---QUERY \d+---\n", user_message)[1:]
+        if not blocks:
+            return json.dumps([user_message])
+        n = self._answers if self._answers is not None else len(blocks)
+        return json.dumps({"answers": [[b.strip()] for b in blocks][:n]})
+
+
+class TestGenerateJsonBatch:
+
+    def test_packs_chunks_and_splits_answers(self):
+        llm = _FakeLLM()
+        messages = [f"q{i}" for i in range(5)]
+        raws = generate_json_batch(llm.generate_json, "sys", messages, batch_size=2)
+        assert [json.loads(r) for r in raws] == [[m] for m in messages]
+        assert len(llm.calls) == 3            # 2 + 2 packed, 1 sent as-is
+
+    def test_wrong_answer_count_falls_back_per_message(self):
+        llm = _FakeLLM(answers=1)
+        raws = generate_json_batch(llm.generate_json, "sys", ["a", "b"], batch_size=8)
+        assert [json.loads(r) for r in raws] == [["a"], ["b"]]
+        assert llm.calls[1:] == ["a", "b"]
+
+    def test_batch_size_one_never_packs(self):
+        llm = _FakeLLM()
+        generate_json_batch(llm.generate_json, "sys", ["a", "b"], batch_size=1)
+        assert llm.calls == ["a", "b"]
+
+    def test_packed_message_delimits_each_query(self):
+        packed = build_batch_user_message(["first", "second"])
+        assert "---QUERY 1---\nfirst" in packed
+        assert "---QUERY 2---\nsecond" in packed
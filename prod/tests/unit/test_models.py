@@ -85,21 +85,25 @@ class TestCandidate:
         assert c.class_code is None
         assert c.division_desc is None
 
-    def test_source_label_both(self):
-        c = Candidate(anzsic_code="X", anzsic_desc="Y", in_vector=True, in_fts=True)
-        assert c.source_label == "BOTH"
-
-    def test_source_label_vector_only(self):
-        c = Candidate(anzsic_code="X", anzsic_desc="Y", in_vector=True, in_fts=False)
-        assert c.source_label == "VEC"
-
-    def test_source_label_fts_only(self):
-        c = Candidate(anzsic_code="X", anzsic_desc="Y", in_vector=False, in_fts=True)
-        assert c.source_label == "FTS"
-
-    def test_source_label_neither(self):
-        c = Candidate(anzsic_code="X", anzsic_desc="Y", in_vector=False, in_fts=False)
-        assert c.source_label == "\u2014"  # em-dash
+    @pytest.mark.parametrize(
+        ("in_vector", "in_fts", "expected"),
+        [
+            (True, True, "BOTH"),
+            (True, False, "VEC"),
+            (False, True, "FTS"),
+            (False, False, "\u2014"),  # em-dash
+        ],
+        ids=["both", "vector_only", "fts_only", "neither"],
+    )
+    def test_source_label(self, in_vector, in_fts, expected):
+        c = Candidate(anzsic_code="X", anzsic_desc="Y", in_vector=in_vector, in_fts=in_fts)
+        assert c.source_label == expected
+
+    def test_from_db_row_matches_validated_model(self):
+        row = {"anzsic_code": "X", "anzsic_desc": "Y", "class_code": "C"}
+        built = Candidate.from_db_row(row, rrf_score=0.5, in_fts=True)
+        assert built == Candidate(**row, rrf_score=0.5, in_fts=True)
+        assert built.vector_rank is None and built.source_label == "FTS"
 
 
 class TestClassifyResult:
@@ -119,9 +123,12 @@ class TestClassifyResult:
         assert r.class_desc is None
 
 
-class TestClassifyResponse:
-    def _make_response(self):
-        results = [
+@pytest.fixture(scope="module")
+def sample_response() -> ClassifyResponse:
+    return ClassifyResponse(
+        query="mobile mechanic",
+        mode="high_fidelity",
+        results=[
             ClassifyResult(
                 rank=1,
                 anzsic_code="S9419_03",
@@ -130,32 +137,33 @@ class TestClassifyResponse:
                 division_desc="Other Services",
                 reason="Best match",
             )
-        ]
-        return ClassifyResponse(
-            query="mobile mechanic",
-            mode="high_fidelity",
-            results=results,
-            candidates_retrieved=20,
-            embed_model="text-embedding-005",
-            llm_model="gemini-2.5-flash",
-        )
-
-    def test_to_dict_keys(self):
-        d = self._make_response().to_dict()
-        assert "query" in d
-        assert "mode" in d
-        assert "results" in d
-        assert "candidates_retrieved" in d
-        assert "generated_at" in d
-
-    def test_to_dict_results_is_list(self):
-        d = self._make_response().to_dict()
-        assert isinstance(d["results"], list)
-        assert len(d["results"]) == 1
-
-    def test_to_dict_is_json_serialisable(self):
+        ],
+        candidates_retrieved=20,
+        embed_model="text-embedding-005",
+        llm_model="gemini-2.5-flash",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_dict(sample_response) -> dict:
+    """sample_response.to_dict(), serialised once; tests only read it."""
+    return sample_response.to_dict()
+
+
+class TestClassifyResponse:
+    def test_to_dict_keys(self, sample_dict):
+        assert "query" in sample_dict
+        assert "mode" in sample_dict
+        assert "results" in sample_dict
+        assert "candidates_retrieved" in sample_dict
+        assert "generated_at" in sample_dict
+
+    def test_to_dict_results_is_list(self, sample_dict):
+        assert isinstance(sample_dict["results"], list)
+        assert len(sample_dict["results"]) == 1
+
+    def test_to_dict_is_json_serialisable(self, sample_dict):
         import json
-        d = self._make_response().to_dict()
         # Should not raise
-        serialised = json.dumps(d)
+        serialised = json.dumps(sample_dict)
         assert "S9419_03" in serialised
@@ -3,25 +3,38 @@ tests/unit/test_openai_adapters.py
 ──────────────────────────────────────────────────────────────────────────────
 Unit tests for OpenAIEmbeddingAdapter and OpenAILLMAdapter.
 
-All HTTP calls are intercepted with unittest.mock.patch so these tests run
-fully offline — no OPENAI_API_KEY required.
+HTTP calls are intercepted so these run fully offline — no OPENAI_API_KEY
+required.  The embedding adapter's httpx client is served by an
+httpx.MockTransport; the sync LLM adapter's requests.Session.post is
+patched once per test class by the scripted ``chat_post`` fixture.
 """
 from __future__ import annotations
 
+import asyncio
+import base64
+import dataclasses
 import json
-from unittest.mock import MagicMock, patch
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
 
+import httpx
+import numpy as np
+import orjson
 import pytest
 
 from prod.adapters.openai_embedding import OpenAIEmbeddingAdapter
-from prod.adapters.openai_llm import OpenAILLMAdapter
+from prod.adapters.openai_llm import AsyncOpenAILLMAdapter, OpenAILLMAdapter
 from prod.config.settings import Settings
 from prod.domain.exceptions import AuthenticationError, EmbeddingError
 
 
 # ── Shared settings fixtures ───────────────────────────────────────────────
 
-@pytest.fixture
+# Settings is a frozen dataclass: one instance per module is safe to share,
+# and variants are derived from it with dataclasses.replace().
+
+@pytest.fixture(scope="module")
 def openai_settings():
     """Settings configured for OpenAI providers."""
     return Settings(
@@ -42,54 +55,136 @@ def openai_settings():
     )
 
 
-@pytest.fixture
-def settings_no_key():
+@pytest.fixture(scope="module")
+def settings_no_key(openai_settings):
     """Settings with no OPENAI_API_KEY — should raise AuthenticationError."""
-    return Settings(
-        embed_provider="openai",
-        llm_provider="openai",
-        openai_api_key="",
-        openai_embed_model="text-embedding-3-small",
-        openai_llm_model="gpt-4o",
-        gcp_project_id="unused",
-        gcp_location_id="unused",
-        gcp_embed_model="unused",
-        gcp_gemini_model="unused",
-        gcloud_path="/usr/bin/gcloud",
-        https_proxy="",
-        db_dsn="dbname=anzsic_db",
-        embed_dim=8,
-    )
+    return dataclasses.replace(openai_settings, openai_api_key="")
+
+
+@pytest.fixture(scope="module")
+def llm_adapter(openai_settings):
+    """One OpenAILLMAdapter for the tests that only patch requests.Session.post."""
+    adapter = OpenAILLMAdapter(openai_settings)
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture(scope="class")
+def chat_post():
+    """requests.Session.post and the LLM back-off sleep, patched once for the
+    whole test class; each test loads its replies with ``chat_post.script()``."""
+    replies = _Replies()
+    with (
+        patch("requests.Session.post", new=replies),
+        patch("prod.adapters.openai_llm.time.sleep"),
+    ):
+        yield replies
 
 
 # ── Helpers ────────────────────────────────────────────────────────────────
 
-def _make_embed_response(vectors: list[list[float]]) -> MagicMock:
-    """Build a mock requests.Response for an OpenAI embeddings call."""
-    mock_resp = MagicMock()
-    mock_resp.ok = True
-    mock_resp.status_code = 200
-    mock_resp.json.return_value = {
+def _embed_response(vectors: list[list[float]]) -> httpx.Response:
+    """Build an httpx.Response for an OpenAI embeddings call."""
+    return httpx.Response(200, content=orjson.dumps({
         "object": "list",
         "data": [
             {"object": "embedding", "index": i, "embedding": v}
             for i, v in enumerate(vectors)
         ],
         "model": "text-embedding-3-small",
-    }
-    return mock_resp
+    }))
+
+
+def _embed_by_input(vectors: list[list[float]]):
+    """Transport handler that answers each batch POST from its "text N" inputs.
+
+    Batches may be dispatched concurrently, so responses are keyed on the
+    request payload rather than on call order.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        texts = json.loads(request.content)["input"]
+        return _embed_response([vectors[int(t.split()[-1])] for t in texts])
+    return handler
+
+
+def _embed_adapter(settings: Settings, handler) -> OpenAIEmbeddingAdapter:
+    """OpenAIEmbeddingAdapter whose httpx client is served by *handler*."""
+    adapter = OpenAIEmbeddingAdapter(settings)
+    adapter._client = httpx.Client(
+        headers=adapter._headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return adapter
 
 
-def _make_chat_response(content: str) -> MagicMock:
-    """Build a mock requests.Response for an OpenAI chat completions call."""
-    mock_resp = MagicMock()
-    mock_resp.ok = True
-    mock_resp.status_code = 200
-    mock_resp.json.return_value = {
+def _recording(handler, requests: list):
+    """Wrap *handler* so every request it serves is appended to *requests*."""
+    def wrapped(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+    return wrapped
+
+
+class _FakeResponse:
+    """The slice of requests.Response that OpenAILLMAdapter reads.
+
+    A plain object rather than a MagicMock: cheap to build, and a missing
+    attribute fails loudly instead of yielding another mock.
+    """
+
+    __slots__ = ("status_code", "content", "headers")
+
+    def __init__(self, status_code: int, content: bytes = b"") -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers: dict[str, str] = {}
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+
+# Canned replies, built once and never mutated by the tests.
+_NO_CHOICES = _FakeResponse(200, b'{"choices": []}')
+_BAD_REQUEST = _FakeResponse(400, b"Bad Request")   # immediate failure, no retry
+_UNAUTHORISED = _FakeResponse(401)
+_RATE_LIMITED = _FakeResponse(429)
+_UNAVAILABLE = _FakeResponse(503)
+
+
+class _Replies:
+    """Scripted stand-in for requests.Session.post, patched in with ``new=``.
+
+    A plain callable, so no MagicMock call recording sits in the request
+    path.  Once the script runs out the last reply repeats; script()
+    loads a new one, so a single patch can serve a whole test class.
+    """
+
+    __slots__ = ("_replies", "calls", "last_call")
+
+    def __init__(self, *replies: _FakeResponse) -> None:
+        self.script(*replies)
+
+    def script(self, *replies: _FakeResponse) -> _Replies:
+        """Replace the scripted replies and reset the call record."""
+        self._replies = replies
+        self.calls = 0
+        self.last_call: tuple[tuple, dict] | None = None
+        return self
+
+    def __call__(self, *args, **kwargs) -> _FakeResponse:
+        reply = self._replies[min(self.calls, len(self._replies) - 1)]
+        self.calls += 1
+        self.last_call = (args, kwargs)
+        return reply
+
+
+def _make_chat_response(content: str) -> _FakeResponse:
+    """Build a requests.Response stand-in for an OpenAI chat completions call."""
+    return _FakeResponse(200, orjson.dumps({
         "choices": [{"message": {"role": "assistant", "content": content}}],
         "model": "gpt-4o",
-    }
-    return mock_resp
+    }))
 
 
 # ── OpenAIEmbeddingAdapter tests ───────────────────────────────────────────
@@ -108,86 +203,183 @@ class TestOpenAIEmbeddingAdapter:
 
     def test_embed_query_calls_correct_endpoint(self, openai_settings):
         vec = [0.1] * 8
-        with patch("prod.adapters.openai_embedding.requests.post") as mock_post:
-            mock_post.return_value = _make_embed_response([vec])
-            adapter = OpenAIEmbeddingAdapter(openai_settings)
-            result = adapter.embed_query("café owner")
-
-        assert result == vec
-        call_args = mock_post.call_args
-        assert call_args[0][0] == "https://api.openai.com/v1/embeddings"
-        payload = call_args[1]["json"]
+        sent: list[httpx.Request] = []
+        adapter = _embed_adapter(
+            openai_settings, _recording(lambda r: _embed_response([vec]), sent)
+        )
+        result = adapter.embed_query("café owner")
+
+        assert result.tolist() == pytest.approx(vec)
+        assert result.dtype == np.float32
+        assert str(sent[0].url) == "https://api.openai.com/v1/embeddings"
+        payload = json.loads(sent[0].content)
         assert payload["input"] == "café owner"
         assert payload["dimensions"] == 8
         assert payload["model"] == "text-embedding-3-small"
+        assert payload["encoding_format"] == "base64"
 
     def test_embed_document_ignores_title(self, openai_settings):
         """title parameter is accepted but not forwarded to the API."""
         vec = [0.2] * 8
-        with patch("prod.adapters.openai_embedding.requests.post") as mock_post:
-            mock_post.return_value = _make_embed_response([vec])
-            adapter = OpenAIEmbeddingAdapter(openai_settings)
-            result = adapter.embed_document("Motor vehicle repair", title="ANZSIC")
+        sent: list[httpx.Request] = []
+        adapter = _embed_adapter(
+            openai_settings, _recording(lambda r: _embed_response([vec]), sent)
+        )
+        result = adapter.embed_document("Motor vehicle repair", title="ANZSIC")
 
-        assert result == vec
-        payload = mock_post.call_args[1]["json"]
-        assert "title" not in payload
+        assert result.tolist() == pytest.approx(vec)
+        assert "title" not in json.loads(sent[0].content)
 
     def test_embed_documents_batch_batches_correctly(self, openai_settings):
         """embed_batch_size=3 with 5 texts should make 2 API calls."""
         vecs = [[float(i)] * 8 for i in range(5)]
-        responses = [
-            _make_embed_response(vecs[:3]),
-            _make_embed_response(vecs[3:]),
-        ]
-        with patch("prod.adapters.openai_embedding.requests.post", side_effect=responses):
-            adapter = OpenAIEmbeddingAdapter(openai_settings)
-            results = adapter.embed_documents_batch([f"text {i}" for i in range(5)])
+        sent: list[httpx.Request] = []
+        adapter = _embed_adapter(openai_settings, _recording(_embed_by_input(vecs), sent))
+        results = adapter.embed_documents_batch([f"text {i}" for i in range(5)])
 
+        assert len(sent) == 2
         assert len(results) == 5
-        assert results[0] == vecs[0]
-        assert results[4] == vecs[4]
+        assert results[0].tolist() == vecs[0]
+        assert results[4].tolist() == vecs[4]
+
+    def test_decodes_base64_embeddings(self, openai_settings):
+        vecs = [[0.5, -1.25] * 4, [2.0] * 8]
+        encoded = [base64.b64encode(np.asarray(v, dtype="<f4").tobytes()).decode() for v in vecs]
+        body = {"data": [{"index": i, "embedding": e} for i, e in enumerate(encoded)]}
+        adapter = _embed_adapter(openai_settings, lambda r: httpx.Response(200, json=body))
+        results = adapter.embed_documents_batch(["a", "b"])
+
+        assert [r.tolist() for r in results] == vecs
+        assert results[0].dtype == np.float32 and results[0].flags.writeable
+
+    def test_embed_documents_batch_dedupes_texts(self, openai_settings):
+        """Repeated strings are embedded once and scattered back in order."""
+        vecs = [[float(i)] * 8 for i in range(3)]
+        sent: list[httpx.Request] = []
+        adapter = _embed_adapter(openai_settings, _recording(_embed_by_input(vecs), sent))
+        texts = ["text 0", "text 1", "text 0", "text 2", "text 1"]
+        results = adapter.embed_documents_batch(texts)
+
+        inputs = [t for r in sent for t in json.loads(r.content)["input"]]
+        assert sorted(inputs) == ["text 0", "text 1", "text 2"]
+        assert [r.tolist() for r in results] == [vecs[0], vecs[1], vecs[0], vecs[2], vecs[1]]
+
+    def test_embed_documents_batch_preserves_order_on_partial_failure(self, openai_settings):
+        """A failed batch yields None for its items without shifting the others."""
+        vecs = [[float(i)] * 8 for i in range(7)]
+        happy = _embed_by_input(vecs)
+
+        def handler(request):
+            if "text 3" in json.loads(request.content)["input"]:
+                return httpx.Response(400, text="Bad Request")
+            return happy(request)
+
+        adapter = _embed_adapter(openai_settings, handler)
+        results = adapter.embed_documents_batch([f"text {i}" for i in range(7)])
+
+        assert [r.tolist() for r in results[:3]] == vecs[:3]
+        assert results[3:6] == [None, None, None]
+        assert results[6].tolist() == vecs[6]
+
+    def test_reuses_one_client_across_calls(self, openai_settings):
+        """Consecutive calls go through the same keep-alive client."""
+        sent: list[httpx.Request] = []
+        adapter = _embed_adapter(
+            openai_settings, _recording(lambda r: _embed_response([[0.3] * 8]), sent)
+        )
+        client = adapter._client
+        adapter.embed_query("first")
+        adapter.embed_query("second")
+
+        assert adapter._client is client
+        assert len(sent) == 2
+        assert sent[0].headers["Authorization"] == "Bearer sk-test-key"
+
+    def test_real_client_negotiates_http2(self, openai_settings):
+        """The production client is built with HTTP/2 enabled when h2 is present."""
+        pytest.importorskip("h2")
+        adapter = OpenAIEmbeddingAdapter(openai_settings)
+        try:
+            assert adapter._client._transport._pool._http2 is True
+        finally:
+            adapter.close()
+
+    def test_adapters_share_one_client(self, openai_settings):
+        first = OpenAIEmbeddingAdapter(openai_settings)
+        second = OpenAIEmbeddingAdapter(openai_settings)
+        assert first._client is second._client
+        first.close()
+        assert not second._client.is_closed
+        second.close()
 
     def test_embed_documents_batch_empty_returns_empty(self, openai_settings):
         adapter = OpenAIEmbeddingAdapter(openai_settings)
         assert adapter.embed_documents_batch([]) == []
 
-    def test_401_raises_authentication_error(self, openai_settings):
-        mock_resp = MagicMock()
-        mock_resp.ok = False
-        mock_resp.status_code = 401
-        with patch("prod.adapters.openai_embedding.requests.post", return_value=mock_resp):
-            adapter = OpenAIEmbeddingAdapter(openai_settings)
-            with pytest.raises(AuthenticationError, match="401"):
-                adapter.embed_query("test")
+    def test_blank_query_skips_network(self, openai_settings):
+        sent: list[httpx.Request] = []
+        adapter = _embed_adapter(openai_settings, _recording(lambda r: httpx.Response(400), sent))
+        assert len(adapter.embed_query("   ")) == 0
+        assert len(adapter.embed_document("")) == 0
+        assert sent == []
+
+    def test_embed_documents_batch_skips_blank_texts(self, openai_settings):
+        vecs = [[float(i)] * 8 for i in range(2)]
+        sent: list[httpx.Request] = []
+        adapter = _embed_adapter(openai_settings, _recording(_embed_by_input(vecs), sent))
+        results = adapter.embed_documents_batch(["text 0", "", " \t", "text 1"])
+
+        inputs = [t for r in sent for t in json.loads(r.content)["input"]]
+        assert sorted(inputs) == ["text 0", "text 1"]
+        assert results[1:3] == [None, None]
+        assert results[0].tolist() == vecs[0] and results[3].tolist() == vecs[1]
+
+    @pytest.mark.parametrize(
+        ("statuses", "raises"),
+        [((401,), AuthenticationError), ((429, 200), None), ((503, 503, 503), EmbeddingError)],
+        ids=["401_fails_fast", "429_then_succeeds", "503_exhausts_retries"],
+    )
+    def test_status_handling(self, openai_settings, statuses, raises):
+        """Exactly one request per scripted status: 401 is not retried, and
+        429 / 503 are retried until success or the third attempt."""
+        vec = [0.5] * 8
+        script = iter([_embed_response([vec]) if st == 200 else httpx.Response(st)
+                       for st in statuses])
+        adapter = _embed_adapter(openai_settings, lambda r: next(script))
 
-    def test_retries_on_429_then_succeeds(self, openai_settings):
-        """Should retry on 429 and succeed on the second attempt."""
-        rate_limit = MagicMock()
-        rate_limit.ok = False
-        rate_limit.status_code = 429
+        with patch("prod.adapters.openai_embedding.time.sleep"):  # skip delay
+            if raises is None:
+                assert adapter.embed_query("retry test").tolist() == vec
+            else:
+                with pytest.raises(raises):
+                    adapter.embed_query("retry test")
 
-        vec = [0.5] * 8
-        success = _make_embed_response([vec])
+        assert next(script, None) is None  # every scripted reply was served
+
+    def test_429_honours_retry_after(self, openai_settings):
+        """A Retry-After longer than the back-off delay is slept in full."""
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "9"}),
+            _embed_response([[0.5] * 8]),
+        ])
+        adapter = _embed_adapter(openai_settings, lambda r: next(responses))
 
-        with patch("prod.adapters.openai_embedding.requests.post", side_effect=[rate_limit, success]):
-            with patch("prod.adapters.openai_embedding.time.sleep"):  # skip delay
-                adapter = OpenAIEmbeddingAdapter(openai_settings)
-                result = adapter.embed_query("retry test")
+        with patch("prod.adapters.openai_embedding.time.sleep") as mock_sleep:
+            adapter.embed_query("retry test")
 
-        assert result == vec
+        mock_sleep.assert_called_once_with(9.0)
 
-    def test_raises_embedding_error_after_all_retries(self, openai_settings):
-        """Should raise EmbeddingError when all retries are exhausted."""
-        always_fail = MagicMock()
-        always_fail.ok = False
-        always_fail.status_code = 503
+    def test_back_off_grows_between_retries(self, openai_settings):
+        """Jittered sleeps still double: each falls in [delay, 1.5 * delay)."""
+        adapter = _embed_adapter(openai_settings, lambda r: httpx.Response(503))
+        with patch("prod.adapters.openai_embedding.time.sleep") as mock_sleep:
+            with pytest.raises(EmbeddingError):
+                adapter.embed_query("will fail")
 
-        with patch("prod.adapters.openai_embedding.requests.post", return_value=always_fail):
-            with patch("prod.adapters.openai_embedding.time.sleep"):
-                adapter = OpenAIEmbeddingAdapter(openai_settings)
-                with pytest.raises(EmbeddingError, match="failed after"):
-                    adapter.embed_query("will fail")
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(waits) == 3
+        assert waits == sorted(waits)
+        assert all(d <= w < 1.5 * d for w, d in zip(waits, (2.0, 4.0, 8.0)))
 
 
 # ── OpenAILLMAdapter tests ─────────────────────────────────────────────────
@@ -199,143 +391,174 @@ class TestOpenAILLMAdapter:
         with pytest.raises(AuthenticationError, match="OPENAI_API_KEY"):
             OpenAILLMAdapter(settings_no_key)
 
-    def test_model_name(self, openai_settings):
+    def test_model_name(self, llm_adapter):
+        assert llm_adapter.model_name == "gpt-4o"
+
+    def test_llm_adapters_share_one_session(self, openai_settings):
+        first, second = OpenAILLMAdapter(openai_settings), OpenAILLMAdapter(openai_settings)
+        assert first._session is second._session
+        first.close()
+        second.close()
+
+    def test_session_built_lazily(self, openai_settings):
+        """No HTTP session exists until the first request; close() is safe before it."""
         adapter = OpenAILLMAdapter(openai_settings)
-        assert adapter.model_name == "gpt-4o"
+        assert "_session" not in adapter.__dict__
+        adapter.close()
+        assert adapter._session is adapter._session
+        adapter.close()
+        assert "_session" not in adapter.__dict__
 
-    def test_generate_json_happy_path(self, openai_settings):
+    def test_generate_json_happy_path(self, llm_adapter, chat_post):
         payload_json = json.dumps([{"rank": 1, "anzsic_code": "S9419_03"}])
-        with patch("prod.adapters.openai_llm.requests.post") as mock_post:
-            mock_post.return_value = _make_chat_response(payload_json)
-            adapter = OpenAILLMAdapter(openai_settings)
-            result = adapter.generate_json("system prompt", "user message")
+        chat_post.script(_make_chat_response(payload_json))
+        result = llm_adapter.generate_json("system prompt", "user message")
 
         assert result == payload_json
 
-    def test_generate_json_sends_correct_payload(self, openai_settings):
+    def test_generate_json_sends_correct_payload(self, llm_adapter, chat_post):
         """Payload must include JSON mode and both message roles."""
-        with patch("prod.adapters.openai_llm.requests.post") as mock_post:
-            mock_post.return_value = _make_chat_response("{}")
-            adapter = OpenAILLMAdapter(openai_settings)
-            adapter.generate_json("sys", "usr")
-
-        call_args = mock_post.call_args
-        assert call_args[0][0] == "https://api.openai.com/v1/chat/completions"
-        body = call_args[1]["json"]
+        chat_post.script(_make_chat_response("{}"))
+        llm_adapter.generate_json("sys", "usr")
+
+        args, kwargs = chat_post.last_call
+        assert args[-1] == "https://api.openai.com/v1/chat/completions"
+        body = json.loads(kwargs["data"])
         assert body["response_format"] == {"type": "json_object"}
         assert body["temperature"] == 0.1
         roles = [m["role"] for m in body["messages"]]
         assert roles == ["system", "user"]
 
-    def test_returns_none_on_empty_choices(self, openai_settings):
-        mock_resp = MagicMock()
-        mock_resp.ok = True
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"choices": []}
+    def test_blank_user_message_skips_network(self, llm_adapter, chat_post):
+        chat_post.script(_NO_CHOICES)
+        assert llm_adapter.generate_json("sys", "  \n") is None
+        assert chat_post.calls == 0
+
+    @pytest.mark.parametrize("reply", [_NO_CHOICES, _BAD_REQUEST], ids=["no_choices", "400"])
+    def test_returns_none_on_unusable_response(self, llm_adapter, chat_post, reply):
+        chat_post.script(reply)
+        assert llm_adapter.generate_json("sys", "usr") is None
+
+    @pytest.mark.parametrize(
+        ("replies", "expected", "calls"),
+        [
+            ((_RATE_LIMITED, _make_chat_response('{"result": "ok"}')), '{"result": "ok"}', 2),
+            ((_UNAVAILABLE,), None, 3),
+        ],
+        ids=["429_then_succeeds", "503_exhausts_retries"],
+    )
+    def test_retry_handling(self, llm_adapter, chat_post, replies, expected, calls):
+        """429 / 503 are retried until success or the third attempt (then None)."""
+        chat_post.script(*replies)
+        result = llm_adapter.generate_json("sys", "usr")
+
+        assert result == expected
+        assert chat_post.calls == calls
+
+    def test_401_raises_authentication_error(self, llm_adapter, chat_post):
+        chat_post.script(_UNAUTHORISED)
+        with pytest.raises(AuthenticationError, match="401"):
+            llm_adapter.generate_json("sys", "usr")
+        assert chat_post.calls == 1
+
+
+# ── AsyncOpenAILLMAdapter tests ────────────────────────────────────────────
+
+def _async_adapter(settings, handler) -> AsyncOpenAILLMAdapter:
+    """AsyncOpenAILLMAdapter whose httpx client is served by *handler*."""
+    httpx = pytest.importorskip("httpx")
+    adapter = AsyncOpenAILLMAdapter(settings)
+    adapter._client = httpx.AsyncClient(
+        headers=adapter._client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return adapter
 
-        with patch("prod.adapters.openai_llm.requests.post", return_value=mock_resp):
-            adapter = OpenAILLMAdapter(openai_settings)
-            result = adapter.generate_json("sys", "usr")
 
-        assert result is None
+def _run(adapter, system: str = "sys", user: str = "usr"):
+    async def go():
+        try:
+            return await adapter.generate_json(system, user)
+        finally:
+            await adapter.aclose()
+    return asyncio.run(go())
 
-    def test_returns_none_on_non_ok_response(self, openai_settings):
-        mock_resp = MagicMock()
-        mock_resp.ok = False
-        mock_resp.status_code = 400   # Bad request — immediate failure, no retry
-        mock_resp.text = "Bad Request"
 
-        with patch("prod.adapters.openai_llm.requests.post", return_value=mock_resp):
-            adapter = OpenAILLMAdapter(openai_settings)
-            result = adapter.generate_json("sys", "usr")
+class TestAsyncOpenAILLMAdapter:
 
-        assert result is None
+    def test_raises_if_no_api_key(self, settings_no_key):
+        with pytest.raises(AuthenticationError, match="OPENAI_API_KEY"):
+            AsyncOpenAILLMAdapter(settings_no_key)
 
-    def test_401_raises_authentication_error(self, openai_settings):
-        mock_resp = MagicMock()
-        mock_resp.ok = False
-        mock_resp.status_code = 401
+    def test_generate_json_happy_path(self, openai_settings):
+        import httpx
+
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["auth"] = request.headers["Authorization"]
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(
+                200, json={"choices": [{"message": {"content": '{"ok": 1}'}}]}
+            )
 
-        with patch("prod.adapters.openai_llm.requests.post", return_value=mock_resp):
-            adapter = OpenAILLMAdapter(openai_settings)
-            with pytest.raises(AuthenticationError, match="401"):
-                adapter.generate_json("sys", "usr")
+        result = _run(_async_adapter(openai_settings, handler))
+
+        assert result == '{"ok": 1}'
+        assert seen["url"] == "https://api.openai.com/v1/chat/completions"
+        assert seen["auth"] == "Bearer sk-test-key"
+        assert seen["body"]["response_format"] == {"type": "json_object"}
 
     def test_retries_on_429_then_succeeds(self, openai_settings):
-        rate_limit = MagicMock()
-        rate_limit.ok = False
-        rate_limit.status_code = 429
+        import httpx
 
-        success = _make_chat_response('{"result": "ok"}')
+        statuses = iter([429, 200])
 
-        with patch("prod.adapters.openai_llm.requests.post", side_effect=[rate_limit, success]):
-            with patch("prod.adapters.openai_llm.time.sleep"):
-                adapter = OpenAILLMAdapter(openai_settings)
-                result = adapter.generate_json("sys", "usr")
+        def handler(request):
+            status = next(statuses)
+            if status == 429:
+                return httpx.Response(429)
+            return httpx.Response(200, json={"choices": [{"message": {"content": "{}"}}]})
 
-        assert result == '{"result": "ok"}'
+        with patch("prod.adapters.openai_llm.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = _run(_async_adapter(openai_settings, handler))
 
-    def test_returns_none_after_all_retries_exhausted(self, openai_settings):
-        always_fail = MagicMock()
-        always_fail.ok = False
-        always_fail.status_code = 503
+        assert result == "{}"
+        assert mock_sleep.call_count == 1
 
-        with patch("prod.adapters.openai_llm.requests.post", return_value=always_fail):
-            with patch("prod.adapters.openai_llm.time.sleep"):
-                adapter = OpenAILLMAdapter(openai_settings)
-                result = adapter.generate_json("sys", "usr")
+    def test_401_raises_authentication_error(self, openai_settings):
+        import httpx
 
-        assert result is None
+        adapter = _async_adapter(openai_settings, lambda request: httpx.Response(401))
+        with pytest.raises(AuthenticationError, match="401"):
+            _run(adapter)
 
 
 # ── container.py provider routing tests ───────────────────────────────────
 
 class TestContainerProviderRouting:
 
-    def test_unknown_embed_provider_raises(self):
+    def test_unknown_embed_provider_raises(self, openai_settings):
         from prod.domain.exceptions import ConfigurationError
         from prod.services.container import _build_embedder
 
-        bad_settings = Settings(
-            embed_provider="cohere",
-            llm_provider="vertex",
-            openai_api_key="",
-            gcp_project_id="p",
-            gcp_location_id="l",
-            gcp_embed_model="m",
-            gcp_gemini_model="g",
-            gcloud_path="/usr/bin/gcloud",
-            https_proxy="",
-            db_dsn="dbname=test",
-        )
+        bad_settings = dataclasses.replace(openai_settings, embed_provider="cohere")
         with pytest.raises(ConfigurationError, match="EMBED_PROVIDER"):
             _build_embedder(bad_settings)
 
-    def test_unknown_llm_provider_raises(self):
+    def test_unknown_llm_provider_raises(self, openai_settings):
         from prod.domain.exceptions import ConfigurationError
         from prod.services.container import _build_llm
 
-        bad_settings = Settings(
-            embed_provider="vertex",
-            llm_provider="anthropic",
-            openai_api_key="",
-            gcp_project_id="p",
-            gcp_location_id="l",
-            gcp_embed_model="m",
-            gcp_gemini_model="g",
-            gcloud_path="/usr/bin/gcloud",
-            https_proxy="",
-            db_dsn="dbname=test",
-        )
+        bad_settings = dataclasses.replace(openai_settings, llm_provider="anthropic")
         with pytest.raises(ConfigurationError, match="LLM_PROVIDER"):
             _build_llm(bad_settings)
 
     def test_openai_embed_provider_returns_openai_adapter(self, openai_settings):
         from prod.services.container import _build_embedder
 
-        with patch("prod.adapters.openai_embedding.requests.post"):  # guard
-            adapter = _build_embedder(openai_settings)
-
+        adapter = _build_embedder(openai_settings)
         assert adapter.__class__.__name__ == "OpenAIEmbeddingAdapter"
 
     def test_openai_llm_provider_returns_openai_adapter(self, openai_settings):
@@ -343,3 +566,42 @@ class TestContainerProviderRouting:
 
         adapter = _build_llm(openai_settings)
         assert adapter.__class__.__name__ == "OpenAILLMAdapter"
+
+    def test_gcp_adapters_share_one_auth_manager(self):
+        from prod.services.container import _build_embedder, _build_llm, shutdown
+
+        settings = Settings(
+            embed_provider="vertex",
+            llm_provider="vertex",
+            gcp_project_id="p",
+            gcp_location_id="l",
+            gcp_embed_model="m",
+            gcp_gemini_model="g",
+            gcp_auth_use_gcloud=True,
+            https_proxy="",
+            db_dsn="dbname=test",
+        )
+        embedder, llm = _build_embedder(settings), _build_llm(settings)
+        assert embedder._auth is llm._auth
+        shutdown()
+        assert _build_embedder(settings)._auth is not embedder._auth
+        shutdown()
+
+    def test_concurrent_first_calls_build_one_pipeline(self, monkeypatch):
+        from prod.services import container
+
+        builds = []
+
+        def slow_build():
+            time.sleep(0.05)
+            builds.append(object())
+            return builds[-1]
+
+        monkeypatch.setattr(container, "_build_pipeline", slow_build)
+        monkeypatch.setattr(container, "_PIPELINE", None)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: container.get_pipeline(), range(8)))
+        assert len(builds) == 1
+        assert all(r is builds[0] for r in results)
+        container.shutdown()
+        assert container._PIPELINE is None
@@ -0,0 +1,208 @@
+"""
+tests/unit/test_postgres_db.py
+──────────────────────────────────────────────────────────────────────────────
+Unit tests for PostgresDatabaseAdapter pieces that need no database:
+the compact ndarray → pgvector literal adapter, batch-search grouping, the
+hybrid_search fallback, DB_VECTOR_TYPE handling, the fetch_by_codes row
+cache, the HNSW rebuild statement sequence and the db_pool_max borrow limit.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import numpy as np
+import psycopg2
+import psycopg2.errors
+import psycopg2.extensions
+import pytest
+from pgvector import Vector
+
+from prod.adapters.postgres_db import (
+    PostgresDatabaseAdapter,
+    _Float32VectorAdapter,
+    _prepare_statements,
+    _vector_array_text,
+)
+from prod.domain.exceptions import ConfigurationError, DatabaseError
+
+
+def _literal(vector: np.ndarray) -> str:
+    return _Float32VectorAdapter(vector).getquoted().decode()[1:-1]
+
+
+class TestFloat32VectorAdapter:
+
+    def test_round_trips_float32_exactly(self):
+        vector = np.random.default_rng(0).normal(0, 0.05, 768).astype(np.float32)
+        parsed = np.array(_literal(vector)[1:-1].split(","), dtype=np.float32)
+        assert np.array_equal(parsed, vector)
+
+    def test_shorter_than_pgvector_text(self):
+        vector = np.random.default_rng(1).normal(0, 0.05, 768).astype(np.float32)
+        assert len(_literal(vector)) < 0.75 * len(Vector(vector).to_text())
+
+    def test_float16_input_is_widened(self):
+        assert _literal(np.array([0.5, -1.0], dtype=np.float16)) == "[0.5,-1]"
+
+    def test_adapts_itself_without_global_registration(self):
+        vector = np.array([0.5, -1.0], dtype=np.float32)
+        adapted = psycopg2.extensions.adapt(_Float32VectorAdapter(vector))
+        assert adapted.getquoted() == b"'[0.5,-1]'"
+        registered = psycopg2.extensions.adapters.get(
+            (np.ndarray, psycopg2.extensions.ISQLQuote)
+        )
+        assert registered is not _Float32VectorAdapter
+
+    def test_vector_search_wraps_the_embedding(self, settings):
+        adapter = PostgresDatabaseAdapter(settings)
+        adapter._execute = MagicMock(return_value=[])
+        adapter.vector_search(np.ones(2, dtype=np.float32), limit=3)
+        param = adapter._execute.call_args.args[1][0]
+        assert isinstance(param, _Float32VectorAdapter)
+
+
+class TestBatchSearch:
+
+    def test_vector_array_literal(self):
+        vectors = [np.array([0.5, -1.0], dtype=np.float32), np.array([2.0, 0.25])]
+        assert _vector_array_text(vectors) == '{"[0.5,-1]","[2,0.25]"}'
+
+    def test_hits_grouped_by_query_ordinal(self, settings):
+        adapter = PostgresDatabaseAdapter(settings)
+        adapter._execute = MagicMock(return_value=[(1, "A", 1), (1, "B", 2), (3, "C", 1)])
+        hits = adapter.vector_search_batch([np.ones(2)] * 3, limit=2)
+        assert hits == [[("A", 1), ("B", 2)], [], [("C", 1)]]
+        adapter._execute.assert_called_once()
+
+    def test_failed_fts_batch_falls_back_per_query(self, settings):
+        adapter = PostgresDatabaseAdapter(settings)
+        adapter._execute = MagicMock(side_effect=[RuntimeError("boom"), [("A", 1)], []])
+        assert adapter.fts_search_batch(["plumber", "nurse"], limit=5) == [[("A", 1)], []]
+
+
+class TestHybridSearchFallback:
+
+    def test_missing_statement_falls_back_to_separate_queries(self, settings):
+        adapter = PostgresDatabaseAdapter(settings)
+        adapter._execute = MagicMock(
+            side_effect=psycopg2.errors.InvalidSqlStatementName("no anzsic_hybrid")
+        )
+        adapter.fts_search = MagicMock(return_value=[("A", 1)])
+        adapter.fetch_by_codes = MagicMock(return_value={"A": {}})
+        assert adapter.hybrid_search(None, "plumber", limit=5) == ([], [("A", 1)], {"A": {}})
+
+    def test_other_errors_propagate(self, settings):
+        adapter = PostgresDatabaseAdapter(settings)
+        adapter._execute = MagicMock(side_effect=DatabaseError("DB query failed after reconnect"))
+        adapter.fts_search = MagicMock()
+        with pytest.raises(DatabaseError):
+            adapter.hybrid_search(None, "plumber", limit=5)
+        adapter.fts_search.assert_not_called()
+
+
+class TestVectorType:
+
+    def test_halfvec_statements_take_halfvec_parameter(self):
+        statements = "".join(_prepare_statements("halfvec"))
+        assert "anzsic_vec (halfvec, int)" in statements
+        assert "anzsic_hybrid (halfvec, text, int, int)" in statements
+        assert "anzsic_vec_batch (halfvec[], int)" in statements
+        assert "(vector" not in statements
+
+    def test_unknown_vector_type_rejected(self, settings):
+        with pytest.raises(ConfigurationError, match="DB_VECTOR_TYPE"):
+            PostgresDatabaseAdapter(replace(settings, db_vector_type="bit"))
+
+
+class TestRowCache:
+
+    def test_only_uncached_codes_are_fetched(self, settings):
+        adapter = PostgresDatabaseAdapter(settings)
+        adapter._execute = MagicMock(
+            side_effect=lambda sql, params: [(code, f"desc {code}") for code in params[0]]
+        )
+        adapter.fetch_by_codes(["A", "B"])
+        records = adapter.fetch_by_codes(["B", "C", "A"])
+        assert list(records) == ["B", "C", "A"]
+        assert records["C"]["anzsic_desc"] == "desc C"
+        assert [call.args[1] for call in adapter._execute.call_args_list] == [
+            (["A", "B"],),
+            (["C"],),
+        ]
+
+    def test_fully_cached_lookup_skips_database(self, settings):
+        adapter = PostgresDatabaseAdapter(settings)
+        adapter._execute = MagicMock(return_value=[("A", "desc")])
+        first = adapter.fetch_by_codes(["A"])
+        assert adapter.fetch_by_codes(["A"]) == first
+        adapter._execute.assert_called_once()
+
+    def test_hierarchy_strings_are_interned(self, settings):
+        adapter = PostgresDatabaseAdapter(settings)
+        division = "".join(["Other ", "Services"])   # a fresh, non-interned str
+        adapter._execute = MagicMock(return_value=[
+            ("A", "desc A", None, None, None, None, None, division),
+            ("B", "desc B", None, None, None, None, None, "Other Services"),
+        ])
+        records = adapter.fetch_by_codes(["A", "B"])
+        assert records["A"]["division_desc"] is records["B"]["division_desc"]
+
+
+class TestRebuildVectorIndex:
+
+    def _adapter(self, settings, fail_on: str | None = None):
+        """Adapter whose borrowed connection records SQL (optionally failing)."""
+        adapter = PostgresDatabaseAdapter(settings)
+        conn = MagicMock(closed=0)
+        cur = conn.cursor.return_value.__enter__.return_value
+
+        def execute(sql, params=None):
+            if fail_on and sql.startswith(fail_on):
+                raise psycopg2.Error("build failed")
+
+        cur.execute.side_effect = execute
+        adapter._borrow = MagicMock()
+        adapter._borrow.return_value.__enter__.return_value = conn
+        return adapter, cur
+
+    def test_builds_concurrently_then_swaps(self, settings):
+        adapter, cur = self._adapter(settings)
+        adapter.rebuild_vector_index()
+        sql = [call.args[0] for call in cur.execute.call_args_list]
+        assert any(s.startswith("CREATE INDEX CONCURRENTLY") for s in sql)
+        swap = next(s for s in sql if "RENAME TO" in s)
+        assert swap.startswith("DROP INDEX IF EXISTS anzsic_codes_embedding_idx;")
+        assert sql[-2:] == ["RESET maintenance_work_mem", "RESET max_parallel_maintenance_workers"]
+
+    def test_failed_build_still_resets_settings(self, settings):
+        adapter, cur = self._adapter(settings, fail_on="CREATE INDEX")
+        with pytest.raises(DatabaseError):
+            adapter.rebuild_vector_index()
+        sql = [call.args[0] for call in cur.execute.call_args_list]
+        assert not any("RENAME TO" in s for s in sql)
+        assert sql[-2:] == ["RESET maintenance_work_mem", "RESET max_parallel_maintenance_workers"]
+
+
+class TestBorrowLimit:
+
+    def test_borrowers_beyond_pool_max_wait_instead_of_failing(self, settings):
+        adapter = PostgresDatabaseAdapter(replace(settings, db_pool_max=1))
+        pool = MagicMock()
+        pool.getconn.return_value = MagicMock(autocommit=True)
+        adapter._pool = pool
+        second_borrowed = threading.Event()
+
+        def borrow_again():
+            with adapter._borrow():
+                second_borrowed.set()
+
+        with adapter._borrow():
+            waiter = threading.Thread(target=borrow_again)
+            waiter.start()
+            assert not second_borrowed.wait(0.1)
+            assert pool.getconn.call_count == 1
+        waiter.join(timeout=5)
+        assert second_borrowed.is_set()
+        assert pool.putconn.call_count == 2
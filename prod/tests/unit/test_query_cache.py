@@ -0,0 +1,197 @@
+"""
+tests/unit/test_query_cache.py
+──────────────────────────────────────────────────────────────────────────────
+Unit tests for the response and re-rank caches in prod.services.query_cache
+and their wiring into ClassifierPipeline.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from prod.config.settings import Settings
+from prod.domain.models import ClassifyResponse, SearchMode, SearchRequest
+from prod.services.classifier import ClassifierPipeline
+from prod.services.query_cache import QueryCache, RerankCache
+
+
+def _response(query: str) -> ClassifyResponse:
+    return ClassifyResponse(
+        query=query,
+        mode="fast",
+        results=[],
+        candidates_retrieved=0,
+        generated_at=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        embed_model="emb",
+    )
+
+
+def _req(query: str, **kw) -> SearchRequest:
+    return SearchRequest(query=query, mode=SearchMode.FAST, **kw)
+
+
+class TestExactTier:
+
+    def test_hit_ignores_case_and_spacing(self):
+        cache = QueryCache(maxsize=4)
+        cache.put(_req("Mobile  mechanic"), _response("Mobile  mechanic"))
+        hit = cache.get(_req(" mobile mechanic "))
+        assert hit is not None and hit.query == "mobile mechanic"
+
+    def test_hit_is_fresh_copy(self):
+        cache = QueryCache(maxsize=4)
+        stored = _response("plumber")
+        cache.put(_req("plumber"), stored)
+        hit = cache.get(_req("plumber"))
+        assert hit is not stored
+        assert hit.generated_at > stored.generated_at
+
+    def test_request_params_are_part_of_key(self):
+        cache = QueryCache(maxsize=4)
+        cache.put(_req("plumber", top_k=5), _response("plumber"))
+        assert cache.get(_req("plumber", top_k=3)) is None
+
+    def test_evicts_least_recently_used(self):
+        cache = QueryCache(maxsize=2)
+        for q in ("a", "b"):
+            cache.put(_req(q), _response(q))
+        cache.get(_req("a"))
+        cache.put(_req("c"), _response("c"))
+        assert cache.get(_req("b")) is None
+        assert cache.get(_req("a")) is not None
+
+
+class TestSemanticTier:
+
+    def test_similar_embedding_hits(self):
+        cache = QueryCache(maxsize=4, semantic_size=4, semantic_threshold=0.97)
+        cache.put(_req("plumber"), _response("plumber"), np.array([1.0, 0.0, 0.0]))
+        hit = cache.get_similar(_req("plumbing"), np.array([0.99, 0.05, 0.0]))
+        assert hit is not None and hit.query == "plumbing"
+
+    def test_dissimilar_embedding_misses(self):
+        cache = QueryCache(maxsize=4, semantic_size=4, semantic_threshold=0.97)
+        cache.put(_req("plumber"), _response("plumber"), np.array([1.0, 0.0, 0.0]))
+        assert cache.get_similar(_req("nurse"), np.array([0.0, 1.0, 0.0])) is None
+
+    def test_params_must_match(self):
+        cache = QueryCache(maxsize=4, semantic_size=4)
+        cache.put(_req("plumber", top_k=5), _response("plumber"), np.array([1.0, 0.0]))
+        assert cache.get_similar(_req("plumbing", top_k=3), np.array([1.0, 0.0])) is None
+
+    def test_fifo_eviction(self):
+        cache = QueryCache(maxsize=8, semantic_size=2)
+        vecs = {"a": [1.0, 0.0, 0.0], "b": [0.0, 1.0, 0.0], "c": [0.0, 0.0, 1.0]}
+        for q, v in vecs.items():
+            cache.put(_req(q), _response(q), np.array(v))
+        assert cache.get_similar(_req("x"), np.array(vecs["a"])) is None
+        assert cache.get_similar(_req("x"), np.array(vecs["c"])).query == "x"
+
+    def test_disabled_or_empty_embedding(self):
+        cache = QueryCache(maxsize=4, semantic_size=0)
+        cache.put(_req("plumber"), _response("plumber"), np.array([1.0, 0.0]))
+        assert cache.get_similar(_req("plumbing"), np.array([1.0, 0.0])) is None
+        assert cache.get_similar(_req("plumbing"), np.array([], dtype=np.float32)) is None
+
+    def test_off_by_default(self, monkeypatch):
+        """The lossy semantic tier is opt-in via SEMANTIC_CACHE_SIZE."""
+        monkeypatch.delenv("SEMANTIC_CACHE_SIZE", raising=False)
+        assert Settings().semantic_cache_size == 0
+
+
+class TestPipelineWiring:
+
+    def test_repeat_query_skips_retrieval(self, mock_retriever, mock_reranker, settings):
+        pipeline = ClassifierPipeline(
+            mock_retriever, mock_reranker, settings,
+            cache=QueryCache(maxsize=4, semantic_size=4),
+        )
+        first = pipeline.classify(_req("plumber"))
+        mock_retriever.retrieve = MagicMock()
+        again = pipeline.classify(_req("Plumber"))
+        similar = pipeline.classify(_req("plumbing services"))   # mock embeds identically
+        mock_retriever.retrieve.assert_not_called()
+        assert again.results == first.results
+        assert similar.query == "plumbing services"
+
+    def test_classify_many_uses_and_fills_cache(
+        self, mock_retriever, mock_reranker, settings
+    ):
+        pipeline = ClassifierPipeline(
+            mock_retriever, mock_reranker, settings, cache=QueryCache(maxsize=4),
+        )
+        pipeline.classify(_req("plumber"))
+        mock_retriever.retrieve_many = MagicMock(wraps=mock_retriever.retrieve_many)
+        pipeline.classify_many([_req("Plumber"), _req("nurse")])
+        mock_retriever.retrieve_many.assert_called_once_with(["nurse"], 20)
+        mock_retriever.retrieve = MagicMock()
+        assert pipeline.classify(_req("nurse")).query == "nurse"
+        mock_retriever.retrieve.assert_not_called()
+
+    def test_async_path_embeds_once(self, mock_retriever, mock_reranker, settings):
+        pipeline = ClassifierPipeline(
+            mock_retriever, mock_reranker, settings,
+            cache=QueryCache(maxsize=4, semantic_size=4),
+        )
+        embed = MagicMock(wraps=mock_retriever._embedder.embed_query)
+        mock_retriever._embedder.embed_query = embed
+        asyncio.run(pipeline.classify_async(_req("plumber")))
+        assert embed.call_count == 1
+        assert asyncio.run(pipeline.classify_async(_req("plumber"))).query == "plumber"
+        assert embed.call_count == 1
+
+    def test_exact_only_cache_does_not_embed_up_front(
+        self, mock_retriever, mock_reranker, settings
+    ):
+        pipeline = ClassifierPipeline(
+            mock_retriever, mock_reranker, settings, cache=QueryCache(maxsize=4),
+        )
+        mock_retriever.embed_query = MagicMock()
+        pipeline.classify(_req("plumber"))
+        asyncio.run(pipeline.classify_async(_req("nurse")))
+        mock_retriever.embed_query.assert_not_called()
+
+
+class TestRerankCache:
+
+    def _candidates(self, *codes):
+        return [MagicMock(anzsic_code=c) for c in codes]
+
+    def test_query_variant_with_same_candidate_set_hits(self):
+        cache = RerankCache(maxsize=4, ttl_s=60)
+        cache.put("Plumber", self._candidates("A", "B"), 5, ["r"])
+        assert cache.get(" plumber ", self._candidates("B", "A"), 5) == ["r"]
+        assert cache.get("plumber", self._candidates("A", "C"), 5) is None
+
+    def test_empty_results_not_stored(self):
+        cache = RerankCache(maxsize=4, ttl_s=60)
+        cache.put("plumber", self._candidates("A"), 5, [])
+        assert cache.get("plumber", self._candidates("A"), 5) is None
+
+    def test_clear_drops_entries(self):
+        cache = RerankCache(maxsize=4, ttl_s=60)
+        cache.put("plumber", self._candidates("A"), 5, ["r"])
+        cache.clear()
+        assert cache.get("plumber", self._candidates("A"), 5) is None
+
+    def test_expired_entry_misses(self, monkeypatch):
+        cache = RerankCache(maxsize=4, ttl_s=10)
+        cache.put("plumber", self._candidates("A"), 5, ["r"])
+        later = time.monotonic() + 11
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+        assert cache.get("plumber", self._candidates("A"), 5) is None
+
+    def test_pipeline_skips_llm_on_hit(self, mock_retriever, mock_reranker, settings):
+        pipeline = ClassifierPipeline(
+            mock_retriever, mock_reranker, settings,
+            rerank_cache=RerankCache(maxsize=4, ttl_s=60),
+        )
+        req = SearchRequest(query="mobile mechanic", mode=SearchMode.HIGH_FIDELITY)
+        first = pipeline.classify(req)
+        mock_reranker.rerank = MagicMock()
+        assert pipeline.classify(req).results == first.results
+        mock_reranker.rerank.assert_not_called()
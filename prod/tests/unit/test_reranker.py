@@ -8,23 +8,38 @@ Tests cover:
   • CSV fallback trigger (empty first response)
   • top_k truncation
   • Malformed individual result items (skipped gracefully)
+  • rerank_many() batching and per-query retry of empty answers
+  • CSV reference parsed once per (path, mtime)
+  • BatchingLLMReranker coalescing concurrent rerank() calls
+  • Literal lookups (exact code, quoted phrase) skipping the LLM
 
 Uses conftest fixtures: mock_llm, mock_reranker, settings.
 """
 from __future__ import annotations
 
+import dataclasses
+import functools
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
 
 import pytest
 
 from prod.domain.models import Candidate
-from prod.services.reranker import LLMReranker
+from prod.services.reranker import BatchingLLMReranker, LLMReranker
 from prod.tests.conftest import MockLLMAdapter, MockLLMAdapterEmpty, _DB_RECORDS
 
 
 # ── Helper to build a Candidate for testing ────────────────────────────────
 
+# Stand-in CSV reference, so empty answers are retried.
+_REFERENCE = "S9419_03: Automotive Repair and Maintenance (own account)"
+
+
+@functools.cache
 def _make_candidate(code: str = "S9419_03") -> Candidate:
+    """One shared Candidate per code; the reranker only reads candidates."""
     rec = _DB_RECORDS.get(code, _DB_RECORDS["S9419_03"])
     return Candidate(
         **rec,
@@ -126,31 +141,23 @@ class TestParseResponse:
         assert "BAD_ITEM" not in codes
 
 
+@pytest.fixture(scope="module")
+def csv_settings(settings, tmp_path_factory):
+    """*settings* pointing at a tiny master CSV, written once per module."""
+    csv_file = tmp_path_factory.mktemp("reranker_csv") / "anzsic_master.csv"
+    csv_file.write_text(
+        "anzsic_code,anzsic_desc\nS9419_03,Automotive Repair\n", encoding="utf-8"
+    )
+    return dataclasses.replace(settings, master_csv_path=csv_file)
+
+
 class TestRerankerCsvFallback:
     """Test the CSV fallback logic in LLMReranker.rerank()."""
 
-    def test_fallback_triggered_on_empty_first_response(self, settings, tmp_path):
+    def test_fallback_triggered_on_empty_first_response(self, csv_settings):
         """When the first LLM call returns empty, reranker retries with CSV."""
-        # Write a tiny CSV reference file
-        csv_file = tmp_path / "anzsic_master.csv"
-        csv_file.write_text(
-            "anzsic_code,anzsic_desc\nS9419_03,Automotive Repair\n", encoding="utf-8"
-        )
-
-        from prod.config.settings import Settings as S
-        patched = S(
-            gcp_project_id="x",
-            gcp_location_id="x",
-            gcp_embed_model="x",
-            gcp_gemini_model="x",
-            gcloud_path="x",
-            https_proxy="",
-            db_dsn="dbname=x",
-            master_csv_path=csv_file,
-            embed_dim=8,
-        )
         MockLLMAdapterEmpty._call_count = 0
-        reranker = LLMReranker(llm=MockLLMAdapterEmpty(), settings=patched)
+        reranker = LLMReranker(llm=MockLLMAdapterEmpty(), settings=csv_settings)
         candidates = [_make_candidate()]
 
         results = reranker.rerank("mobile mechanic", candidates, top_k=3)
@@ -158,6 +165,22 @@ class TestRerankerCsvFallback:
         assert len(results) > 0
         assert MockLLMAdapterEmpty._call_count == 2  # called twice
 
+    def test_retry_reuses_user_message(self, mock_reranker):
+        llm = MagicMock(model_name="llm")
+        llm.generate_json.side_effect = ["[]", MockLLMAdapter._RESPONSE]
+        mock_reranker._llm = llm
+        mock_reranker._csv_reference = _REFERENCE
+        assert mock_reranker.rerank("mobile mechanic", [_make_candidate()], top_k=3)
+        (_, first), (_, retry) = (c.args for c in llm.generate_json.call_args_list)
+        assert retry is first
+
+    def test_no_retry_without_csv_reference(self, mock_reranker):
+        llm = MagicMock(model_name="llm")
+        llm.generate_json.return_value = "[]"
+        mock_reranker._llm = llm
+        assert mock_reranker.rerank("mobile mechanic", [_make_candidate()], top_k=3) == []
+        llm.generate_json.assert_called_once()
+
     def test_no_fallback_if_first_call_succeeds(self, mock_reranker):
         """When first call returns results, second call must not happen."""
         # mock_llm always returns valid JSON (MockLLMAdapter)
@@ -169,3 +192,162 @@ class TestRerankerCsvFallback:
         """No candidates → no LLM call → empty results."""
         results = mock_reranker.rerank("anything", [], top_k=5)
         assert results == []
+
+
+# ── System prompt assembly ─────────────────────────────────────────────────
+
+class TestBuildSystemPrompt:
+
+    def test_reference_prompt_built_once(self):
+        from prod.config.prompts import RERANK_SYSTEM_BASE, build_system_prompt
+
+        csv_reference = "A0111_01: Nursery production\n" * 1000
+        first = build_system_prompt(include_reference=True, csv_reference=csv_reference)
+        assert first.startswith(RERANK_SYSTEM_BASE) and first.endswith(csv_reference)
+        assert build_system_prompt(include_reference=True, csv_reference=csv_reference) is first
+
+    def test_without_reference_is_base_prompt(self):
+        from prod.config.prompts import RERANK_SYSTEM_BASE, build_system_prompt
+
+        prompt = build_system_prompt(include_reference=False, csv_reference="x")
+        assert prompt is RERANK_SYSTEM_BASE
+
+
+# ── CSV reference memoisation ──────────────────────────────────────────────
+
+class TestCsvReferenceCache:
+
+    def test_parsed_once_and_reread_after_edit(self, settings, tmp_path):
+        csv_file = tmp_path / "anzsic_master.csv"
+        csv_file.write_text("anzsic_code,anzsic_desc\nA,One\n", encoding="utf-8")
+        patched = dataclasses.replace(settings, master_csv_path=csv_file)
+        first = LLMReranker(llm=MockLLMAdapter(), settings=patched)
+        second = LLMReranker(llm=MockLLMAdapter(), settings=patched)
+        assert first._csv_reference == "A: One"
+        assert second._csv_reference is first._csv_reference
+
+        csv_file.write_text("anzsic_code,anzsic_desc\nB,Two\n", encoding="utf-8")
+        stat = csv_file.stat()
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert LLMReranker(llm=MockLLMAdapter(), settings=patched)._csv_reference == "B: Two"
+
+
+# ── rerank_many ────────────────────────────────────────────────────────────
+
+class TestRerankMany:
+
+    def test_matches_rerank_with_one_batch_call(self, mock_reranker):
+        items = [
+            ("mobile mechanic", [_make_candidate()], 3),
+            ("auto electrician", [_make_candidate("S9411_01")], 2),
+        ]
+        llm = mock_reranker._llm
+        llm.generate_json_batch = MagicMock(wraps=llm.generate_json_batch)
+        batched = mock_reranker.rerank_many(items)
+        llm.generate_json_batch.assert_called_once()
+        assert batched == [mock_reranker.rerank(*item) for item in items]
+
+    def test_empty_answer_retried_alone(self, mock_reranker):
+        llm = MagicMock(model_name="llm")
+        llm.generate_json_batch.return_value = [MockLLMAdapter._RESPONSE, "[]"]
+        llm.generate_json.return_value = MockLLMAdapter._RESPONSE
+        mock_reranker._llm = llm
+        mock_reranker._csv_reference = _REFERENCE
+        results = mock_reranker.rerank_many([
+            ("mobile mechanic", [_make_candidate()], 3),
+            ("auto electrician", [_make_candidate()], 3),
+        ])
+        assert all(results)
+        llm.generate_json.assert_called_once()
+
+    def test_no_candidates_skips_batch(self, mock_reranker):
+        mock_reranker._llm = MagicMock(model_name="llm")
+        assert mock_reranker.rerank_many([("anything", [], 5)]) == [[]]
+        mock_reranker._llm.generate_json_batch.assert_not_called()
+
+
+class TestBatchingReranker:
+
+    def test_concurrent_calls_share_one_llm_call(self, mock_reranker):
+        llm = mock_reranker._llm
+        llm.generate_json_batch = MagicMock(wraps=llm.generate_json_batch)
+        llm.generate_json = MagicMock(wraps=llm.generate_json)
+        batcher = BatchingLLMReranker(mock_reranker, window_s=5.0, max_batch=2)
+        items = [
+            ("mobile mechanic", [_make_candidate()], 3),
+            ("auto electrician", [_make_candidate("S9411_01")], 2),
+        ]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(lambda item: batcher.rerank(*item), items))
+        batcher.close()
+        llm.generate_json_batch.assert_called_once()
+        assert len(llm.generate_json_batch.call_args.args[1]) == 2
+        assert results == [mock_reranker.rerank(*item) for item in items]
+
+    def test_empty_answer_retried_on_caller(self, mock_reranker):
+        llm = MagicMock(model_name="llm")
+        llm.generate_json_batch.return_value = ["[]"]
+        llm.generate_json.return_value = MockLLMAdapter._RESPONSE
+        mock_reranker._llm = llm
+        mock_reranker._csv_reference = _REFERENCE
+        batcher = BatchingLLMReranker(mock_reranker, window_s=0.0, max_batch=8)
+        assert batcher.rerank("mobile mechanic", [_make_candidate()], 3)
+        llm.generate_json.assert_called_once()
+        batcher.close()
+
+    def test_llm_error_reaches_caller_and_close_falls_back(self, mock_reranker):
+        llm = MagicMock(model_name="llm")
+        llm.generate_json_batch.side_effect = RuntimeError("boom")
+        llm.generate_json.return_value = MockLLMAdapter._RESPONSE
+        mock_reranker._llm = llm
+        batcher = BatchingLLMReranker(mock_reranker, window_s=0.0, max_batch=8)
+        with pytest.raises(RuntimeError):
+            batcher.rerank("mobile mechanic", [_make_candidate()], 3)
+        batcher.close()
+        assert not batcher._worker.is_alive()
+        llm.generate_json_batch.side_effect = None
+        llm.generate_json_batch.return_value = [MockLLMAdapter._RESPONSE]
+        assert batcher.rerank("mobile mechanic", [_make_candidate()], 3)
+
+
+class TestLiteralLookup:
+
+    def _candidates(self):
+        return [_make_candidate("S9419_03"), _make_candidate("S9411_01")]
+
+    def _no_llm(self, reranker):
+        reranker._llm = MagicMock(model_name="llm")
+        return reranker._llm
+
+    def test_exact_code_skips_llm(self, mock_reranker):
+        llm = self._no_llm(mock_reranker)
+        results = mock_reranker.rerank(" s9419_03 ", self._candidates(), top_k=3)
+        assert [r.anzsic_code for r in results] == ["S9419_03", "S9411_01"]
+        assert [r.rank for r in results] == [1, 2]
+        assert results[0].score == 1000 and results[0].reason
+        assert results[0].rrf_score == 0.03 and results[0].in_vector
+        llm.generate_json.assert_not_called()
+
+    def test_quoted_phrase_in_one_candidate(self, mock_reranker):
+        llm = self._no_llm(mock_reranker)
+        desc = self._candidates()[1].anzsic_desc
+        results = mock_reranker.rerank_many([(f'"{desc.upper()}"', self._candidates(), 3)])
+        assert [r.anzsic_code for r in results[0]] == ["S9411_01", "S9419_03"]
+        llm.generate_json_batch.assert_not_called()
+
+    def test_match_first_then_candidates_up_to_top_k(self, mock_reranker):
+        self._no_llm(mock_reranker)
+        results = mock_reranker.rerank("S9411_01", self._candidates(), top_k=1)
+        assert [r.anzsic_code for r in results] == ["S9411_01"]
+
+    def test_each_query_counted_once(self, mock_reranker):
+        self._no_llm(mock_reranker)
+        mock_reranker.rerank_many([("S9419_03", self._candidates(), 3), ("plumber", [], 3)])
+        assert (mock_reranker._literal_hits, mock_reranker._reranks) == (1, 2)
+
+    def test_non_literal_or_absent_code_uses_llm(self, mock_reranker):
+        llm = mock_reranker._llm
+        llm.generate_json = MagicMock(wraps=llm.generate_json)
+        mock_reranker.rerank("A0111_01", self._candidates(), top_k=3)
+        mock_reranker.rerank("mobile mechanic", self._candidates(), top_k=3)
+        assert llm.generate_json.call_count == 2
@@ -0,0 +1,191 @@
+"""
+tests/unit/test_response_cache.py
+──────────────────────────────────────────────────────────────────────────────
+Unit tests for the LRU caching decorators in prod.adapters.response_cache.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from prod.adapters.response_cache import (
+    CachedEmbeddingAdapter,
+    CachedLLMAdapter,
+    LRUCache,
+    SingleFlight,
+)
+from prod.ports.embedding_port import EmbeddingPort
+from prod.ports.llm_port import LLMPort
+
+
+def _inner_embedder() -> MagicMock:
+    inner = MagicMock()
+    inner.model_name = "emb"
+    inner.dimensions = 8
+    inner.embed_query.side_effect = lambda text: np.full(8, 0.1, dtype=np.float32)
+    inner.embed_queries_batch.side_effect = lambda texts: [
+        np.full(8, 0.3, dtype=np.float32) for _ in texts
+    ]
+    inner.embed_document.side_effect = lambda text, title: np.full(8, 0.2, dtype=np.float32)
+    return inner
+
+
+class TestLRUCache:
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")          # "b" is now least recently used
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_hit_rate(self):
+        cache = LRUCache(maxsize=2)
+        assert cache.hit_rate == 0.0
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+        assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+
+class TestSingleFlight:
+
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=2)
+            return "v"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(flight.do, "k", slow)
+            started.wait(timeout=2)          # leader is now in flight
+            followers = [pool.submit(flight.do, "k", slow) for _ in range(3)]
+            time.sleep(0.05)                 # let followers reach do()
+            release.set()
+            results = [f.result(timeout=2) for f in [leader, *followers]]
+
+        assert results == ["v"] * 4
+        assert len(calls) == 1
+
+    def test_exception_propagates_and_key_is_released(self):
+        flight = SingleFlight()
+
+        def boom():
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError, match="upstream down"):
+            flight.do("k", boom)
+        assert flight.do("k", lambda: "ok") == "ok"
+
+
+class TestCachedEmbeddingAdapter:
+
+    def test_satisfies_port(self):
+        assert isinstance(CachedEmbeddingAdapter(_inner_embedder(), 8), EmbeddingPort)
+
+    def test_repeated_query_hits_cache(self):
+        inner = _inner_embedder()
+        cached = CachedEmbeddingAdapter(inner, maxsize=8)
+        first = cached.embed_query("plumber")
+        for _ in range(2):
+            assert cached.embed_query("plumber") is first
+        assert inner.embed_query.call_count == 1
+
+    def test_query_key_ignores_case_and_spacing(self):
+        inner = _inner_embedder()
+        cached = CachedEmbeddingAdapter(inner, maxsize=8)
+        first = cached.embed_query("Mobile  mechanic")
+        assert cached.embed_query(" mobile mechanic ") is first
+        assert inner.embed_query.call_count == 1
+
+    def test_query_and_document_cached_separately(self):
+        inner = _inner_embedder()
+        cached = CachedEmbeddingAdapter(inner, maxsize=8)
+        cached.embed_query("plumber")
+        assert cached.embed_document("plumber")[0] == np.float32(0.2)
+        inner.embed_document.assert_called_once()
+
+    def test_batch_embeds_only_distinct_misses(self):
+        inner = _inner_embedder()
+        cached = CachedEmbeddingAdapter(inner, maxsize=8)
+        hit = cached.embed_query("plumber")
+        results = cached.embed_queries_batch(["Plumber", "nurse", " NURSE "])
+        inner.embed_queries_batch.assert_called_once_with(["nurse"])
+        assert results[0] is hit and results[1] is results[2]
+        assert cached.embed_query("nurse") is results[1]
+
+    def test_caller_mutation_does_not_poison_cache(self):
+        cached = CachedEmbeddingAdapter(_inner_embedder(), maxsize=8)
+        vector = cached.embed_query("plumber")
+        with pytest.raises(ValueError):
+            vector[0] = 9.9
+
+
+class TestCachedLLMAdapter:
+
+    def test_satisfies_port(self):
+        inner = MagicMock()
+        inner.model_name = "llm"
+        assert isinstance(CachedLLMAdapter(inner, 8), LLMPort)
+
+    def test_repeated_prompt_hits_cache(self):
+        inner = MagicMock()
+        inner.model_name = "llm"
+        inner.generate_json.return_value = '{"ok": 1}'
+        cached = CachedLLMAdapter(inner, maxsize=8)
+        assert cached.generate_json("sys", "usr") == '{"ok": 1}'
+        assert cached.generate_json("sys", "usr") == '{"ok": 1}'
+        assert inner.generate_json.call_count == 1
+
+    def test_failed_call_not_cached(self):
+        inner = MagicMock()
+        inner.model_name = "llm"
+        inner.generate_json.side_effect = [None, '{"ok": 1}']
+        cached = CachedLLMAdapter(inner, maxsize=8)
+        assert cached.generate_json("sys", "usr") is None
+        assert cached.generate_json("sys", "usr") == '{"ok": 1}'
+
+    def test_batch_sends_only_misses(self):
+        inner = MagicMock()
+        inner.model_name = "llm"
+        inner.generate_json.return_value = '{"a": 1}'
+        inner.generate_json_batch.return_value = ['{"b": 1}', None]
+        cached = CachedLLMAdapter(inner, maxsize=8)
+        cached.generate_json("sys", "a")
+        assert cached.generate_json_batch("sys", ["a", "b", "c"]) == [
+            '{"a": 1}', '{"b": 1}', None,
+        ]
+        inner.generate_json_batch.assert_called_once_with("sys", ["b", "c"])
+        assert cached.generate_json("sys", "b") == '{"b": 1}'
+
+
+class TestDiskCachedEmbeddingAdapter:
+
+    def test_query_survives_restart(self, tmp_path):
+        pytest.importorskip("diskcache")
+        from prod.adapters.response_cache import DiskCachedEmbeddingAdapter
+
+        inner = _inner_embedder()
+        first = DiskCachedEmbeddingAdapter(inner, str(tmp_path), size_limit_mb=1)
+        vector = first.embed_query("plumber")
+        first.close()
+
+        reopened = DiskCachedEmbeddingAdapter(inner, str(tmp_path), size_limit_mb=1)
+        assert np.array_equal(reopened.embed_query(" Plumber "), vector)
+        assert reopened.embed_queries_batch(["plumber", "nurse"])[0].dtype == vector.dtype
+        inner.embed_query.assert_called_once()
+        inner.embed_queries_batch.assert_called_once_with(["nurse"])
+        reopened.close()
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import pytest
 
-from prod.services.retriever import compute_rrf
+from prod.services.retriever import compute_rrf, compute_rrf_topk
 
 
 class TestComputeRRF:
@@ -100,13 +100,64 @@ class TestComputeRRF:
         vec_hits = [("A", 1), ("A", 2)]  # malformed input
         fts_hits = []
         results = compute_rrf(vec_hits, fts_hits)
-        # dict() keeps last value, so "A" should appear exactly once
         codes = [r.anzsic_code for r in results]
         assert len(codes) == len(set(codes))
 
+    @pytest.mark.parametrize(
+        ("vec_hits", "fts_hits", "ranks"),
+        [
+            ([("A", 3), ("A", 1)], [], (1, None)),
+            ([], [("A", 3), ("A", 1)], (None, 1)),
+            ([("A", 3), ("A", 1)], [("B", 1), ("A", 4), ("A", 2)], (1, 2)),
+        ],
+        ids=["vector_only", "fts_only", "both_legs"],
+    )
+    def test_duplicate_code_keeps_best_rank(self, vec_hits, fts_hits, ranks):
+        """A code listed twice by one leg is scored on its lowest rank."""
+        results = {r.anzsic_code: r for r in compute_rrf(vec_hits, fts_hits)}
+        assert (results["A"].vector_rank, results["A"].fts_rank) == ranks
+
     def test_large_input_does_not_raise(self):
         """Should handle large ranked lists without error."""
         vec_hits = [(f"CODE_{i:04d}", i + 1) for i in range(1000)]
         fts_hits = [(f"CODE_{i:04d}", i + 1) for i in range(500, 1500)]
         results = compute_rrf(vec_hits, fts_hits)
         assert len(results) > 0
+
+    def test_topk_matches_sorted_compute_rrf(self):
+        """compute_rrf_topk() keeps the same n results, in the same order, as a full
+        sort by (score DESC, code)."""
+        vec_hits = [(f"CODE_{i:04d}", i + 1) for i in range(1000)]
+        fts_hits = [(f"CODE_{i:04d}", i + 1) for i in range(500, 1500)]
+        full = sorted(compute_rrf(vec_hits, fts_hits), key=lambda r: (-r.rrf_score, r.anzsic_code))
+        assert compute_rrf_topk(vec_hits, fts_hits, k=60, top_k=20) == full[:20]
+
+    @pytest.mark.parametrize("leg", ["vector", "fts"])
+    def test_topk_single_leg_matches_compute_rrf(self, leg):
+        """With one leg empty, compute_rrf_topk() still keeps the best-ranked codes in order."""
+        hits = [(f"CODE_{i:02d}", i + 1) for i in reversed(range(30))]
+        vec_hits, fts_hits = (hits, []) if leg == "vector" else ([], hits)
+        full = sorted(compute_rrf(vec_hits, fts_hits), key=lambda r: (-r.rrf_score, r.anzsic_code))
+        assert compute_rrf_topk(vec_hits, fts_hits, top_k=5) == full[:5]
+
+    @pytest.mark.parametrize(
+        ("vec_hits", "fts_hits"),
+        [
+            ([("B", 1), ("A", 2)], [("A", 1), ("B", 2)]),
+            ([("D", 1), ("C", 1)], []),
+        ],
+        ids=["both_legs", "single_leg"],
+    )
+    def test_topk_breaks_score_ties_by_code(self, vec_hits, fts_hits):
+        """Equal scores keep the lowest code, as the anzsic_hybrid SQL pre-fusion
+        does (ORDER BY score DESC, anzsic_code) — not first-seen order."""
+        top = compute_rrf_topk(vec_hits, fts_hits, top_k=1)
+        assert [r.anzsic_code for r in top] == [min(code for code, _ in vec_hits)]
+
+    @pytest.mark.parametrize("rank", [10_000, 5_000_000, 0, -1])
+    @pytest.mark.parametrize("fts_hits", [[], [("A", 3)]], ids=["single_leg", "both_legs"])
+    def test_extreme_ranks_are_scored_exactly(self, fts_hits, rank):
+        """Very large, zero and negative ranks all score 1/(k + rank)."""
+        results = {r.anzsic_code: r for r in compute_rrf([("A", 1), ("B", rank)], fts_hits)}
+        assert results["B"].rrf_score == pytest.approx(1 / (60 + rank))
+        assert results["A"].rrf_score == pytest.approx(1 / 61 + (1 / 63 if fts_hits else 0.0))
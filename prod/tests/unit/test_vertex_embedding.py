@@ -0,0 +1,131 @@
+"""
+tests/unit/test_vertex_embedding.py
+──────────────────────────────────────────────────────────────────────────────
+Unit tests for VertexEmbeddingAdapter batching and AsyncVertexEmbeddingAdapter
+(network calls mocked).
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import orjson
+
+from prod.adapters.vertex_embedding import AsyncVertexEmbeddingAdapter, VertexEmbeddingAdapter
+
+
+def _adapter(settings, **overrides) -> VertexEmbeddingAdapter:
+    adapter = VertexEmbeddingAdapter(MagicMock(), replace(settings, **overrides))
+    threads: set[int] = set()
+
+    def fake_post(payload, retries=3):
+        threads.add(threading.get_ident())
+        return {
+            "predictions": [
+                {"embeddings": {"values": [float(inst["content"].split()[-1])] * 8}}
+                for inst in payload["instances"]
+            ]
+        }
+
+    adapter._post_with_retry = fake_post
+    adapter.threads = threads
+    return adapter
+
+
+class TestEmbedDocumentsBatch:
+
+    def test_concurrent_batches_preserve_order(self, settings):
+        adapter = _adapter(settings, embed_batch_size=2, embed_parallelism=4)
+        texts = [f"text {i}" for i in range(9)]
+        results = adapter.embed_documents_batch(texts)
+        assert [r[0] for r in results] == [float(i) for i in range(9)]
+
+    def test_single_worker_runs_inline(self, settings):
+        adapter = _adapter(settings, embed_batch_size=2, embed_parallelism=1)
+        adapter.embed_documents_batch([f"text {i}" for i in range(5)])
+        assert adapter.threads == {threading.get_ident()}
+
+    def test_title_only_sent_when_present(self, settings):
+        adapter = VertexEmbeddingAdapter(MagicMock(), settings)
+        sent = []
+
+        def fake_post(payload, retries=3):
+            sent.extend(payload["instances"])
+            return {"predictions": []}
+
+        adapter._post_with_retry = fake_post
+        adapter.embed_documents_batch(["a", "b"], ["T", ""])
+        assert sent == [
+            {"content": "a", "task_type": "RETRIEVAL_DOCUMENT", "title": "T"},
+            {"content": "b", "task_type": "RETRIEVAL_DOCUMENT"},
+        ]
+
+    def test_malformed_prediction_becomes_none(self, settings):
+        adapter = VertexEmbeddingAdapter(MagicMock(), settings)
+        adapter._post_with_retry = lambda payload, retries=3: {
+            "predictions": [{"embeddings": {"values": [1.0] * 8}}, {"embeddings": {}}]
+        }
+        results = adapter.embed_documents_batch(["a", "b", "c"])
+        assert results[0].shape == (8,)
+        assert results[1:] == [None, None]
+
+
+class TestEmbedQueriesBatch:
+
+    def test_one_call_with_query_task_type(self, settings):
+        adapter = VertexEmbeddingAdapter(MagicMock(), settings)
+        payloads = []
+
+        def fake_post(payload, retries=3):
+            payloads.append(payload)
+            return {"predictions": [{"embeddings": {"values": [1.0] * 8}}] * 2}
+
+        adapter._post_with_retry = fake_post
+        results = adapter.embed_queries_batch(["plumber", "nurse", "plumber"])
+        assert len(payloads) == 1
+        assert {i["task_type"] for i in payloads[0]["instances"]} == {"RETRIEVAL_QUERY"}
+        assert len(payloads[0]["instances"]) == 2 and len(results) == 3
+
+
+class TestSharedSession:
+
+    def test_shares_regional_session_with_gemini(self, settings):
+        from prod.adapters.gemini_llm import GeminiLLMAdapter
+
+        embedder = VertexEmbeddingAdapter(MagicMock(), settings)
+        llm = GeminiLLMAdapter(MagicMock(), settings)
+        try:
+            assert embedder._session is llm._session
+        finally:
+            embedder.close()
+            llm.close()
+
+
+class TestAsyncVertexEmbeddingAdapter:
+
+    def test_embed_query_sends_query_task_type(self, settings):
+        seen = []
+
+        def handler(request):
+            seen.append(orjson.loads(request.content)["instances"][0])
+            return httpx.Response(
+                200, json={"predictions": [{"embeddings": {"values": [0.5] * 8}}]}
+            )
+
+        auth = MagicMock()
+        auth.aget_token = AsyncMock(return_value="tok")
+        adapter = AsyncVertexEmbeddingAdapter(auth, settings)
+        adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def go():
+            try:
+                return await adapter.embed_query("plumber")
+            finally:
+                await adapter.aclose()
+
+        vector = asyncio.run(go())
+        assert vector.shape == (8,) and vector.dtype.name == "float32"
+        assert seen == [{"content": "plumber", "task_type": "RETRIEVAL_QUERY"}]